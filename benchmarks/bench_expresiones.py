@@ -0,0 +1,42 @@
+"""Micro-benchmark: evaluaciones por segundo con eval(f_str) vs. expresión compilada
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_expresiones
+"""
+import timeit
+
+import numpy as np
+
+from core.expresiones import compilar
+
+CASOS = [
+    ("x**2 - 2*x - 3", ('x',), (1.5,)),
+    ("np.sin(x)*x**2 + np.exp(-x)", ('x',), (0.7,)),
+    ("-2*y + np.cos(t)", ('t', 'y'), (0.3, 1.2)),
+]
+
+
+def evaluaciones_por_segundo(funcion, args, repeticiones=5, numero=20000):
+    tiempo = min(timeit.repeat(lambda: funcion(*args), repeat=repeticiones, number=numero))
+    return numero / tiempo
+
+
+def main():
+    print(f"{'Expresión':<32}{'eval(f_str)':>16}{'compilada':>16}{'aceleración':>14}")
+    print("-" * 78)
+    for fuente, variables, args in CASOS:
+        # Versión original: el lambda vuelve a analizar la cadena en cada llamada
+        espacio = {'np': np}
+        if variables == ('x',):
+            antes = lambda x: eval(fuente, espacio, {'x': x})
+        else:
+            antes = lambda t, y: eval(fuente, espacio, {'t': t, 'y': y})
+        despues = compilar(fuente, variables).funcion
+
+        v_antes = evaluaciones_por_segundo(antes, args)
+        v_despues = evaluaciones_por_segundo(despues, args)
+        print(f"{fuente:<32}{v_antes:>16,.0f}{v_despues:>16,.0f}{v_despues / v_antes:>13.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark: evaluaciones de f para alcanzar una tolerancia fija
+
+Compara Simpson 3/8 compuesta (n mínimo, duplicando, con el error real),
+Simpson 3/8 adaptativa, Romberg sobre Simpson 3/8, Gauss-Legendre y
+Gauss-Kronrod G7K15 adaptativa.
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_integracion
+"""
+import numpy as np
+
+from core.integracion import integrar, simpson38
+
+TOL = 1e-10
+
+CASOS = [
+    ("exp(x)", 0.0, 1.0, np.e - 1),
+    ("sin(x)**2", 0.0, np.pi, np.pi / 2),
+    ("1/(1 + 25*x**2)", -1.0, 1.0, 0.4 * np.arctan(5)),
+    ("sqrt(x)", 0.0, 1.0, 2 / 3),
+]
+
+ADAPTATIVOS = ['simpson38_adaptativo', 'romberg_simpson38', 'gauss_legendre', 'gauss_kronrod']
+
+
+def simpson_compuesta_necesaria(f, a, b, exacto, n_max=3 * 2**22):
+    """Evaluaciones con el n = 3·2^k más pequeño cuyo error real es menor que TOL"""
+    n = 3
+    while n <= n_max:
+        res = simpson38(f, a, b, n)
+        if abs(res.valor - exacto) < TOL:
+            return res.evaluaciones, abs(res.valor - exacto)
+        n *= 2
+    return None, abs(res.valor - exacto)
+
+
+def main():
+    print(f"Tolerancia: {TOL:g}   (evaluaciones de f / error real)\n")
+    print(f"{'f(x)':<20}{'Simpson n fijo':>20}" + "".join(f"{m:>24}" for m in ADAPTATIVOS))
+    print("-" * (40 + 24 * len(ADAPTATIVOS)))
+    for f, a, b, exacto in CASOS:
+        evaluaciones, error = simpson_compuesta_necesaria(f, a, b, exacto)
+        celdas = [f"{evaluaciones if evaluaciones else '—'} / {error:.0e}"]
+        for metodo in ADAPTATIVOS:
+            res = integrar(f, a, b, metodo, tol=TOL)
+            marca = "" if res.convergio else "*"
+            celdas.append(f"{res.evaluaciones}{marca} / {abs(res.valor - exacto):.0e}")
+        print(f"{f:<20}{celdas[0]:>20}" + "".join(f"{c:>24}" for c in celdas[1:]))
+    print("\n* no alcanzó la tolerancia pedida")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark: iteraciones y tiempo de Jacobi, Gauss-Seidel, SOR y Gradiente Conjugado
+
+Matrices de prueba: Poisson 1D (tridiagonal 2, -1) y Poisson 2D (5 puntos).
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_lineales
+"""
+import time
+
+import numpy as np
+
+from core.lineales import METODOS_ITERATIVOS, sp_sparse
+
+TOL = 1e-8
+MAX_ITER = 200000
+
+
+def poisson_1d(n):
+    if sp_sparse is not None:
+        return sp_sparse.diags([-np.ones(n - 1), 2 * np.ones(n), -np.ones(n - 1)], [-1, 0, 1], format='csr')
+    return 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+def poisson_2d(m):
+    """Laplaciano de 5 puntos en una malla m×m (m² incógnitas)"""
+    T = poisson_1d(m)
+    if sp_sparse is not None:
+        I = sp_sparse.identity(m, format='csr')
+        return (sp_sparse.kron(I, T) + sp_sparse.kron(T, I)).tocsr()
+    I = np.eye(m)
+    return np.kron(I, T) + np.kron(T, I)
+
+
+def main():
+    casos = [
+        ("Poisson 1D, n=100", poisson_1d(100)),
+        ("Poisson 1D, n=400", poisson_1d(400)),
+        ("Poisson 2D, 20x20", poisson_2d(20)),
+        ("Poisson 2D, 50x50", poisson_2d(50)),
+    ]
+    print(f"Tolerancia: ||b - Ax|| / ||b|| < {TOL:g}   (scipy.sparse: {'sí' if sp_sparse else 'no'})\n")
+    for nombre, A in casos:
+        b = np.ones(A.shape[0])
+        print(nombre)
+        print(f"  {'Método':<22}{'Iteraciones':>12}{'Tiempo (s)':>12}{'Residuo':>12}")
+        for metodo, funcion in METODOS_ITERATIVOS.items():
+            inicio = time.perf_counter()
+            res = funcion(A, b, tol=TOL, max_iter=MAX_ITER, criterio='residuo')
+            tiempo = time.perf_counter() - inicio
+            etiqueta = res.metodo + (f" (ω={res.omega:.3f})" if metodo == 'sor' else "")
+            iteraciones = f"{res.iteraciones}" + ("" if res.convergio else "*")
+            print(f"  {etiqueta:<22}{iteraciones:>12}{tiempo:>12.3f}{res.residuos[-1]:>12.1e}")
+        print()
+    print("* no alcanzó la tolerancia en el máximo de iteraciones")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Consola de resultados con búfer para el ScrolledText de la interfaz
+
+En lugar de insertar y redibujar el widget en cada línea, las líneas se
+acumulan y se vuelcan en lote cada pocos milisegundos. El widget sólo
+conserva las últimas ``max_lineas``; opcionalmente, todo se copia a un
+archivo de log para no perder las tablas largas.
+"""
+import tkinter as tk
+from collections import deque
+
+
+class ConsolaSalida:
+    """Salida con búfer sobre un widget Text/ScrolledText"""
+
+    def __init__(self, widget, max_lineas=5000, intervalo_ms=50):
+        self.widget = widget
+        self.max_lineas = max_lineas
+        self.intervalo_ms = intervalo_ms
+        # Las líneas pendientes también se recortan: nunca se mostrarían
+        self._pendientes = deque(maxlen=max_lineas)
+        self._programado = None
+        self._log = None
+
+    @property
+    def ruta_log(self):
+        return self._log.name if self._log is not None else None
+
+    def escribir(self, texto, color='#00ff00'):
+        """Encola una línea; se mostrará en el próximo volcado"""
+        if self._log is not None:
+            self._log.write(texto + '\n')
+        self._pendientes.append((texto, color))
+        if self._programado is None:
+            self._programado = self.widget.after(self.intervalo_ms, self.vaciar)
+
+    def vaciar(self):
+        """Inserta todas las líneas pendientes en el widget de una sola vez"""
+        self._programado = None
+        if not self._pendientes:
+            return
+
+        # Agrupar líneas consecutivas del mismo color en un solo insert
+        bloque, color_bloque = [], None
+        for texto, color in self._pendientes:
+            if color != color_bloque and bloque:
+                self.widget.insert(tk.END, '\n'.join(bloque) + '\n', color_bloque)
+                bloque = []
+            bloque.append(texto)
+            color_bloque = color
+        self.widget.insert(tk.END, '\n'.join(bloque) + '\n', color_bloque)
+        self._pendientes.clear()
+
+        # Búfer circular: descartar las líneas más antiguas del widget
+        lineas = int(self.widget.index('end-1c').split('.')[0])
+        if lineas > self.max_lineas:
+            self.widget.delete('1.0', f'{lineas - self.max_lineas + 1}.0')
+
+        self.widget.see(tk.END)
+
+    def limpiar(self):
+        """Borra el widget y lo pendiente (el log en archivo se conserva)"""
+        self._pendientes.clear()
+        self.widget.delete(1.0, tk.END)
+        if self._log is not None:
+            self._log.write('\n')
+
+    def activar_log(self, ruta):
+        """Copia todas las líneas, incluidas las recortadas del widget, a ruta"""
+        self.desactivar_log()
+        self._log = open(ruta, 'w', encoding='utf-8', buffering=1 << 16)
+
+    def desactivar_log(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
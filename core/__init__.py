@@ -0,0 +1 @@
+"""Núcleo numérico del programa de Métodos Numéricos (sin dependencias de Tkinter)"""
@@ -0,0 +1,107 @@
+"""Carga masiva de matrices y vectores desde archivo
+
+Formatos admitidos:
+  .npy  arreglo de NumPy, abierto como memmap (no se copia a memoria)
+  .npz  matriz dispersa guardada con scipy.sparse.save_npz
+  .mtx  Matrix Market; en formato 'coordinate' se carga directo a CSR
+  .csv  texto separado por comas (también .txt/.dat separado por espacios)
+"""
+import os
+
+import numpy as np
+
+from core.lineales import es_dispersa, sp_sparse
+
+try:
+    import scipy.io as sp_io
+except ImportError:  # sin scipy se usa el lector propio de Matrix Market
+    sp_io = None
+
+
+def _leer_matrix_market(ruta):
+    """Lector mínimo de Matrix Market (real/integer, general/symmetric)"""
+    with open(ruta, 'r') as archivo:
+        cabecera = archivo.readline().lower().split()
+        if len(cabecera) < 5 or cabecera[0] != '%%matrixmarket':
+            raise ValueError(f"{ruta} no es un archivo Matrix Market")
+        formato, campo, simetria = cabecera[2], cabecera[3], cabecera[4]
+        if campo not in ('real', 'integer', 'double'):
+            raise ValueError(f"Matrix Market de tipo '{campo}' no soportado")
+        linea = archivo.readline()
+        while linea.startswith('%'):
+            linea = archivo.readline()
+        dims = [int(v) for v in linea.split()]
+        datos = np.loadtxt(archivo, ndmin=2)
+
+    if formato == 'array':
+        filas, columnas = dims[0], dims[1]
+        # El formato 'array' guarda por columnas
+        return datos.ravel().reshape((columnas, filas)).T
+
+    filas, columnas, _ = dims
+    i = datos[:, 0].astype(np.int64) - 1
+    j = datos[:, 1].astype(np.int64) - 1
+    v = datos[:, 2]
+    if simetria == 'symmetric':
+        fuera = i != j
+        i, j, v = np.concatenate([i, j[fuera]]), np.concatenate([j, i[fuera]]), np.concatenate([v, v[fuera]])
+    if sp_sparse is not None:
+        return sp_sparse.csr_matrix((v, (i, j)), shape=(filas, columnas))
+    A = np.zeros((filas, columnas))
+    np.add.at(A, (i, j), v)
+    return A
+
+
+def cargar_matriz(ruta):
+    """Lee una matriz de .npy, .npz, .mtx o .csv/.txt"""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == '.npy':
+        A = np.load(ruta, mmap_mode='r')
+    elif extension == '.npz':
+        if sp_sparse is None:
+            raise ValueError("Leer .npz disperso requiere scipy")
+        A = sp_sparse.load_npz(ruta).tocsr()
+    elif extension == '.mtx':
+        if sp_io is not None:
+            A = sp_io.mmread(ruta)
+            A = A.tocsr() if es_dispersa(A) else np.asarray(A)
+        else:
+            A = _leer_matrix_market(ruta)
+    elif extension in ('.csv', '.txt', '.dat'):
+        A = np.loadtxt(ruta, delimiter=',' if extension == '.csv' else None, ndmin=2)
+    else:
+        raise ValueError(f"Formato de archivo no soportado: {extension}")
+
+    if A.ndim != 2:
+        raise ValueError(f"Se esperaba una matriz en {os.path.basename(ruta)}, forma {A.shape}")
+    return A
+
+
+def cargar_vector(ruta):
+    """Lee un vector con los mismos formatos que cargar_matriz"""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == '.npy':
+        v = np.load(ruta, mmap_mode='r')
+    else:
+        v = cargar_matriz(ruta)
+        if es_dispersa(v):
+            v = v.toarray()
+    v = np.asarray(v)
+    if v.ndim == 2 and 1 in v.shape:
+        v = v.ravel()
+    if v.ndim != 1:
+        raise ValueError(f"Se esperaba un vector en {os.path.basename(ruta)}, forma {v.shape}")
+    return v
+
+
+def resumen_matriz(A):
+    """Texto corto con forma, formato y número de no ceros"""
+    filas, columnas = A.shape
+    if es_dispersa(A):
+        nnz = A.nnz
+        formato = f"dispersa {A.format.upper()}"
+    else:
+        nnz = int(np.count_nonzero(A))
+        formato = "densa (memmap)" if isinstance(A, np.memmap) else "densa"
+    densidad = 100.0 * nnz / max(filas * columnas, 1)
+    return f"{filas}×{columnas}, {formato}, nnz = {nnz} ({densidad:.3g} %)"
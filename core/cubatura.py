@@ -0,0 +1,207 @@
+"""Integración en cajas [a1, b1] × [a2, b2] × ... (cubatura)
+
+Dos modos:
+  simpson38_nd  producto tensorial de Simpson 3/8 compuesta, evaluado sobre
+                np.meshgrid por bloques del primer eje para acotar la memoria
+  cuasi_monte_carlo
+                Sobol/Halton aleatorizados (o Monte Carlo simple) con varias
+                réplicas independientes: el valor es su media y el error su
+                desviación estándar / sqrt(réplicas), actualizado ronda a
+                ronda. Cada (réplica, ronda) tiene su propia semilla derivada
+                de la semilla global, así que el resultado es el mismo con 1
+                o con varios procesos.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.expresiones import como_expresion
+
+try:
+    from scipy.stats import qmc
+except ImportError:  # sin scipy: Halton propio, Sobol no disponible
+    qmc = None
+
+
+@dataclass
+class ResultadoCubatura:
+    """Resultado de una integral múltiple"""
+    valor: float
+    evaluaciones: int
+    metodo: str
+    n: tuple = None                 # Simpson: subintervalos por eje
+    error: float = None             # QMC: error estándar entre réplicas
+    convergio: bool = True
+    mensaje: str = ""
+    historial: list = field(default_factory=list)   # QMC: (puntos por réplica, valor, error) por ronda
+
+
+def variables_caja(dimension):
+    """Nombres de las variables del integrando: x, y, z o x1, ..., xd"""
+    if dimension <= 3:
+        return ('x', 'y', 'z')[:dimension]
+    return tuple(f"x{i + 1}" for i in range(dimension))
+
+
+def _preparar_caja(limites):
+    limites = np.asarray(limites, dtype=float)
+    if limites.ndim != 2 or limites.shape[1] != 2 or limites.shape[0] < 1:
+        raise ValueError("Los límites deben ser una lista de pares (a, b)")
+    return limites
+
+
+def _pesos_simpson38(a, b, n):
+    """Nodos y pesos de Simpson 3/8 compuesta con n subintervalos (múltiplo de 3)"""
+    h = (b - a) / n
+    w = np.full(n + 1, 3.0)
+    w[0] = w[-1] = 1.0
+    w[3:-1:3] = 2.0
+    return a + h * np.arange(n + 1), (3 * h / 8) * w
+
+
+def simpson38_nd(f, limites, n, bloque=1_000_000, control=None):
+    """Simpson 3/8 tensorial: Σ w_i w_j w_k f(x_i, y_j, z_k)
+
+    n es un entero (igual en todos los ejes) o uno por eje; se redondea al
+    múltiplo de 3. La malla se arma con np.meshgrid por bloques de índices
+    del primer eje, de modo que nunca hay más de ~bloque puntos en memoria.
+    """
+    limites = _preparar_caja(limites)
+    d = len(limites)
+    f = como_expresion(f, variables_caja(d))
+    n = np.broadcast_to(np.asarray(n, dtype=int), (d,))
+    if np.any(n < 1):
+        raise ValueError("El número de subintervalos debe ser positivo")
+    n = tuple(int(((k + 2) // 3) * 3) for k in n)
+
+    ejes = [_pesos_simpson38(a, b, k) for (a, b), k in zip(limites, n)]
+    nodos = [x for x, _ in ejes]
+    pesos = [w for _, w in ejes]
+
+    resto = int(np.prod([x.size for x in nodos[1:]]))
+    filas = max(1, bloque // max(resto, 1))
+    total = 0.0
+    for inicio in range(0, nodos[0].size, filas):
+        if control is not None:
+            control.reportar(inicio / nodos[0].size)
+        malla = np.meshgrid(nodos[0][inicio:inicio + filas], *nodos[1:], indexing='ij')
+        valores = f.evaluar_arreglo(*malla)
+        # Contracción eje por eje con los pesos (el primero sólo en el bloque)
+        valores = np.tensordot(pesos[0][inicio:inicio + filas], valores, axes=(0, 0))
+        for w in pesos[1:]:
+            valores = np.tensordot(w, valores, axes=(0, 0))
+        total += float(valores)
+
+    evaluaciones = int(np.prod([k + 1 for k in n]))
+    return ResultadoCubatura(total, evaluaciones, "Simpson 3/8 tensorial", n=n)
+
+
+def _halton(indices, dimension):
+    """Puntos de Halton (inverso radical en las primeras bases primas) para los índices dados"""
+    primos = []
+    candidato = 2
+    while len(primos) < dimension:
+        if all(candidato % p for p in primos):
+            primos.append(candidato)
+        candidato += 1
+    puntos = np.zeros((indices.size, dimension))
+    for eje, base in enumerate(primos):
+        i = indices.copy()
+        factor = 1.0 / base
+        while np.any(i > 0):
+            puntos[:, eje] += factor * (i % base)
+            i //= base
+            factor /= base
+    return puntos
+
+
+def _puntos_ronda(secuencia, dimension, semilla, replica, ronda, m):
+    """m puntos en [0, 1)^d de la ronda dada de una réplica (reproducible e independiente)"""
+    semilla_replica = np.random.SeedSequence(semilla, spawn_key=(replica,))
+    if secuencia == 'aleatoria':
+        rng = np.random.default_rng(np.random.SeedSequence(semilla, spawn_key=(replica, ronda)))
+        return rng.random((m, dimension))
+    if qmc is not None:
+        clase = qmc.Sobol if secuencia == 'sobol' else qmc.Halton
+        generador = clase(dimension, scramble=True, seed=np.random.default_rng(semilla_replica))
+        if ronda:
+            generador.fast_forward(ronda * m)
+        return generador.random(m)
+    if secuencia == 'sobol':
+        raise ValueError("La secuencia de Sobol requiere scipy")
+    # Halton con desplazamiento aleatorio (rotación de Cranley-Patterson) por réplica
+    desplazamiento = np.random.default_rng(semilla_replica).random(dimension)
+    puntos = _halton(np.arange(ronda * m, (ronda + 1) * m) + 1, dimension)
+    return (puntos + desplazamiento) % 1.0
+
+
+def _estimar_ronda(f, variables, limites, secuencia, semilla, replica, ronda, m):
+    """Suma de f en los m puntos de una (réplica, ronda); se ejecuta también en otros procesos"""
+    f = como_expresion(f, variables)
+    a, b = limites[:, 0], limites[:, 1]
+    u = _puntos_ronda(secuencia, len(limites), semilla, replica, ronda, m)
+    x = a + (b - a) * u
+    return float(np.sum(f.evaluar_arreglo(*x.T)))
+
+
+def cuasi_monte_carlo(f, limites, n=2**16, secuencia='sobol', replicas=8, puntos_ronda=4096,
+                      tol=None, semilla=0, procesos=1, control=None):
+    """Cuasi-Monte Carlo aleatorizado sobre la caja
+
+    Cada una de las réplicas recorre su propia secuencia (Sobol o Halton
+    aleatorizados, o números aleatorios con secuencia='aleatoria') en rondas
+    de puntos_ronda puntos hasta sumar n. Tras cada ronda se actualiza el
+    valor (media de las réplicas) y el error estándar; con tol se detiene en
+    cuanto el error baja de tol. Con procesos > 1 las réplicas de cada ronda
+    se reparten entre procesos (una Expresion viaja como su fuente; una
+    función de Python debe poder serializarse, no un lambda).
+    """
+    if secuencia not in ('sobol', 'halton', 'aleatoria'):
+        raise ValueError(f"Secuencia desconocida: {secuencia}")
+    if replicas < 2:
+        raise ValueError("Se necesitan al menos 2 réplicas para estimar el error")
+    limites = _preparar_caja(limites)
+    d = len(limites)
+    variables = variables_caja(d)
+    f = como_expresion(f, variables)
+    if secuencia == 'sobol' and puntos_ronda & (puntos_ronda - 1):
+        raise ValueError("Con Sobol los puntos por ronda deben ser potencia de 2")
+
+    rondas = max(1, -(-int(n) // puntos_ronda))
+    volumen = float(np.prod(limites[:, 1] - limites[:, 0]))
+    sumas = np.zeros(replicas)
+    historial = []
+    convergio, mensaje = tol is None, ""
+    valor = error = None
+
+    ejecutor = ProcessPoolExecutor(max_workers=procesos) if procesos > 1 else None
+    try:
+        for ronda in range(rondas):
+            if control is not None:
+                control.reportar(ronda / rondas)
+            argumentos = [(f, variables, limites, secuencia, semilla,
+                           r, ronda, puntos_ronda) for r in range(replicas)]
+            if ejecutor is None:
+                sumas += [_estimar_ronda(*args) for args in argumentos]
+            else:
+                sumas += list(ejecutor.map(_estimar_ronda, *zip(*argumentos)))
+
+            puntos = (ronda + 1) * puntos_ronda
+            estimaciones = volumen * sumas / puntos
+            valor = float(np.mean(estimaciones))
+            error = float(np.std(estimaciones, ddof=1) / np.sqrt(replicas))
+            historial.append((puntos, valor, error))
+            if tol is not None and error < tol:
+                convergio = True
+                break
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown()
+
+    if not convergio:
+        mensaje = f"El error estimado no bajó de {tol:g} con {rondas * puntos_ronda} puntos por réplica"
+    nombre = {'sobol': "Sobol", 'halton': "Halton", 'aleatoria': "Monte Carlo"}[secuencia]
+    return ResultadoCubatura(valor, replicas * historial[-1][0], f"{nombre} ({replicas} réplicas)",
+                             error=error, convergio=convergio, mensaje=mensaje, historial=historial)
+
@@ -0,0 +1,239 @@
+"""Derivación automática hacia adelante: números duales e hiperduales
+
+Un Dual v + d·ε (ε² = 0) lleva junto al valor la derivada respecto de x;
+un HiperDual v + d1·ε1 + d2·ε2 + d12·ε1ε2 lleva además la segunda
+derivada en d12. Al evaluar la expresión compilada del usuario con
+x = Dual(x0, 1) (o HiperDual(x0, 1, 1, 0)) cada operación aplica la regla
+de la cadena, y el resultado trae f, f' (y f'') exactas, sin paso h ni
+cancelación, en una sola pasada.
+
+Las funciones de ESPACIO_NOMBRES (sin, exp, sqrt, ...) son ufuncs de NumPy,
+que se resuelven con __array_ufunc__; los componentes pueden ser números o
+arreglos, así que un mismo Dual deriva en muchos puntos a la vez. Las
+funciones de math (math.sin, ...) no admiten duales: derivar lanza
+TypeError y quien llama recurre a diferencias finitas.
+"""
+import numpy as np
+
+_LN10 = np.log(10.0)
+
+
+def _sqrt_derivadas(v):
+    r = np.sqrt(v)
+    return r, 0.5 / r, -0.25 / (r * v)
+
+
+def _tan_derivadas(v):
+    t = np.tan(v)
+    s = 1 + t * t
+    return t, s, 2 * t * s
+
+
+def _tanh_derivadas(v):
+    t = np.tanh(v)
+    s = 1 - t * t
+    return t, s, -2 * t * s
+
+
+# ufunc -> v ↦ (g(v), g'(v), g''(v))
+_UNARIAS = {
+    np.negative: lambda v: (-v, -1.0, 0.0),
+    np.positive: lambda v: (v, 1.0, 0.0),
+    np.absolute: lambda v: (np.abs(v), np.sign(v), 0.0),
+    np.square: lambda v: (v * v, 2 * v, 2.0),
+    np.sqrt: _sqrt_derivadas,
+    np.exp: lambda v: (np.exp(v),) * 3,
+    np.log: lambda v: (np.log(v), 1 / v, -1 / (v * v)),
+    np.log10: lambda v: (np.log10(v), 1 / (v * _LN10), -1 / (v * v * _LN10)),
+    np.sin: lambda v: (np.sin(v), np.cos(v), -np.sin(v)),
+    np.cos: lambda v: (np.cos(v), -np.sin(v), -np.cos(v)),
+    np.tan: _tan_derivadas,
+    np.arcsin: lambda v: (np.arcsin(v), 1 / np.sqrt(1 - v * v), v / (1 - v * v) ** 1.5),
+    np.arccos: lambda v: (np.arccos(v), -1 / np.sqrt(1 - v * v), -v / (1 - v * v) ** 1.5),
+    np.arctan: lambda v: (np.arctan(v), 1 / (1 + v * v), -2 * v / (1 + v * v) ** 2),
+    np.sinh: lambda v: (np.sinh(v), np.cosh(v), np.sinh(v)),
+    np.cosh: lambda v: (np.cosh(v), np.sinh(v), np.cosh(v)),
+    np.tanh: _tanh_derivadas,
+}
+
+_BINARIAS = {
+    np.add: lambda a, b: a + b,
+    np.subtract: lambda a, b: a - b,
+    np.multiply: lambda a, b: a * b,
+    np.true_divide: lambda a, b: a / b,
+    np.power: lambda a, b: a ** b,
+}
+
+
+class _NumeroAD:
+    """Operaciones comunes a Dual e HiperDual; las subclases definen la regla de la cadena y el producto"""
+
+    __slots__ = ()
+
+    def _componentes(self):
+        return tuple(getattr(self, nombre) for nombre in self.__slots__)
+
+    def _cadena(self, g, g1, g2):
+        raise NotImplementedError
+
+    def _producto(self, otro):
+        raise NotImplementedError
+
+    # Aritmética
+    def __add__(self, otro):
+        if isinstance(otro, _NumeroAD):
+            return type(self)(*[a + b for a, b in zip(self._componentes(), otro._componentes())])
+        return type(self)(self.v + otro, *self._componentes()[1:])
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        return self + (-otro)
+
+    def __rsub__(self, otro):
+        return (-self) + otro
+
+    def __mul__(self, otro):
+        if isinstance(otro, _NumeroAD):
+            return self._producto(otro)
+        return type(self)(*[c * otro for c in self._componentes()])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro):
+        if isinstance(otro, _NumeroAD):
+            return self * otro._reciproco()
+        return type(self)(*[c / otro for c in self._componentes()])
+
+    def __rtruediv__(self, otro):
+        return self._reciproco() * otro
+
+    def _reciproco(self):
+        v = self.v
+        return self._cadena(1 / v, -1 / (v * v), 2 / (v * v * v))
+
+    def __pow__(self, otro):
+        if isinstance(otro, _NumeroAD):
+            return np.exp(otro * np.log(self))
+        n = otro
+        v = self.v
+        if n == 0:
+            return type(self)(v ** 0)
+        # np.power: con v = 0 y exponente negativo da inf en lugar de ZeroDivisionError
+        return self._cadena(v ** n, n * np.power(v, n - 1),
+                            n * (n - 1) * np.power(v, n - 2) if n != 1 else 0.0)
+
+    def __rpow__(self, otro):
+        return np.exp(self * np.log(otro))
+
+    def __neg__(self):
+        return type(self)(*[-c for c in self._componentes()])
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    # Las comparaciones usan el valor (sirven para min, max y expresiones condicionales)
+    def __lt__(self, otro):
+        return self.v < getattr(otro, 'v', otro)
+
+    def __le__(self, otro):
+        return self.v <= getattr(otro, 'v', otro)
+
+    def __gt__(self, otro):
+        return self.v > getattr(otro, 'v', otro)
+
+    def __ge__(self, otro):
+        return self.v >= getattr(otro, 'v', otro)
+
+    def __array_ufunc__(self, ufunc, metodo, *entradas, **opciones):
+        if metodo != '__call__' or opciones:
+            return NotImplemented
+        if ufunc in _UNARIAS and len(entradas) == 1:
+            return self._cadena(*_UNARIAS[ufunc](self.v))
+        if ufunc in _BINARIAS and len(entradas) == 2:
+            a, b = entradas
+            if not isinstance(a, _NumeroAD):
+                # ndarray (op) dual: se resuelve con los métodos reflejados del dual
+                return {np.add: b.__radd__, np.subtract: b.__rsub__, np.multiply: b.__rmul__,
+                        np.true_divide: b.__rtruediv__, np.power: b.__rpow__}[ufunc](a)
+            return _BINARIAS[ufunc](a, b)
+        return NotImplemented
+
+
+class Dual(_NumeroAD):
+    """v + d·ε con ε² = 0: valor y primera derivada"""
+
+    __slots__ = ('v', 'd')
+
+    def __init__(self, v, d=0.0):
+        self.v = v
+        self.d = d
+
+    def _producto(self, otro):
+        return Dual(self.v * otro.v, self.d * otro.v + self.v * otro.d)
+
+    def _cadena(self, g, g1, g2):
+        return Dual(g, g1 * self.d)
+
+    def __repr__(self):
+        return f"Dual({self.v!r}, {self.d!r})"
+
+
+class HiperDual(_NumeroAD):
+    """v + d1·ε1 + d2·ε2 + d12·ε1ε2 con ε1² = ε2² = 0: con d1 = d2 = 1, d12 es la segunda derivada"""
+
+    __slots__ = ('v', 'd1', 'd2', 'd12')
+
+    def __init__(self, v, d1=0.0, d2=0.0, d12=0.0):
+        self.v = v
+        self.d1 = d1
+        self.d2 = d2
+        self.d12 = d12
+
+    def _producto(self, otro):
+        return HiperDual(self.v * otro.v,
+                         self.d1 * otro.v + self.v * otro.d1,
+                         self.d2 * otro.v + self.v * otro.d2,
+                         self.d12 * otro.v + self.d1 * otro.d2 + self.d2 * otro.d1 + self.v * otro.d12)
+
+    def _cadena(self, g, g1, g2):
+        return HiperDual(g, g1 * self.d1, g1 * self.d2, g1 * self.d12 + g2 * self.d1 * self.d2)
+
+    def __repr__(self):
+        return f"HiperDual({self.v!r}, {self.d1!r}, {self.d2!r}, {self.d12!r})"
+
+
+def derivar(f, x, orden=1):
+    """(f(x), f'(x)) con orden=1 o (f(x), f'(x), f''(x)) con orden=2, exactas
+
+    f es la función compilada de una variable (Expresion.funcion o un
+    callable); x puede ser un número o un arreglo. Lanza TypeError si la
+    expresión usa algo que no admite duales (funciones de math, np.where...).
+    """
+    x = np.asarray(x, dtype=float) if np.ndim(x) else float(x)
+    uno = np.ones_like(x) if np.ndim(x) else 1.0
+    if orden == 1:
+        semilla = Dual(x, uno)
+    elif orden == 2:
+        semilla = HiperDual(x, uno, uno, 0.0 * uno)
+    else:
+        raise ValueError("La derivación automática admite orden 1 o 2")
+    try:
+        resultado = f(semilla)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"La expresión no admite derivación automática: {e}") from None
+
+    if isinstance(resultado, Dual) and orden == 1:
+        componentes = (resultado.v, resultado.d)
+    elif isinstance(resultado, HiperDual):
+        componentes = (resultado.v, resultado.d1, resultado.d12)
+    elif isinstance(resultado, (int, float, np.number)):
+        componentes = (resultado,) + (0.0,) * orden     # f constante
+    else:
+        raise TypeError(f"La expresión no admite derivación automática (devolvió {type(resultado).__name__})")
+    forma = np.shape(x)
+    return tuple(np.broadcast_to(np.asarray(c, dtype=float), forma)[()] if forma else float(c)
+                 for c in componentes)
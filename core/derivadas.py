@@ -0,0 +1,210 @@
+"""Derivación numérica: segunda derivada clásica y diferencias finitas generales
+
+second_derivative es la fórmula de 3 puntos de la pantalla original.
+derivada calcula derivadas de cualquier orden con plantillas arbitrarias
+(pesos de Fornberg), extrapolación de Richardson y búsqueda automática del
+paso, sobre uno o muchos puntos a la vez.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from core.derivacion_automatica import derivar
+from core.expresiones import como_expresion
+
+
+@dataclass
+class ResultadoDerivada:
+    """f''(x0) y los valores de f usados en la fórmula"""
+    valor: float
+    x0: float
+    h: float
+    f_menos: float
+    f_centro: float
+    f_mas: float
+    exacta: float = None    # f''(x0) por derivación automática (None si la expresión no la admite)
+
+
+def second_derivative(f, x0, h=0.01):
+    """f''(x0) ≈ (f(x0 + h) - 2 f(x0) + f(x0 - h)) / h²"""
+    f = como_expresion(f, ('x',)).funcion
+
+    f_mas = f(x0 + h)
+    f_centro = f(x0)
+    f_menos = f(x0 - h)
+
+    f_segunda = (f_mas - 2*f_centro + f_menos) / (h**2)
+
+    try:
+        exacta = derivar(f, x0, 2)[2]
+    except (TypeError, ArithmeticError):
+        exacta = None
+
+    return ResultadoDerivada(f_segunda, x0, h, f_menos, f_centro, f_mas, exacta)
+
+
+@dataclass
+class ResultadoDiferencias:
+    """Derivada de orden m por diferencias finitas en uno o varios puntos x0"""
+    valor: np.ndarray            # escalar (float) si x0 es un número
+    error: np.ndarray            # estimación de |error| (truncamiento + redondeo)
+    h: np.ndarray                # paso usado en cada punto
+    x0: np.ndarray
+    orden: int
+    nodos: tuple                 # plantilla en unidades de h
+    pesos: np.ndarray
+    precision: int               # orden de precisión de la plantilla (error ~ h^precision)
+    richardson: int              # niveles de extrapolación de Richardson
+    evaluaciones: int            # evaluaciones de f en total
+
+
+@lru_cache(maxsize=128)
+def pesos_fornberg(orden, nodos):
+    """Pesos w_k de f^(orden)(0) ≈ Σ w_k f(x_k) para nodos x_k arbitrarios (algoritmo de Fornberg)
+
+    Con nodos en unidades de h, la derivada en x0 es Σ w_k f(x0 + x_k h) / h^orden.
+    Se guardan en caché por (orden, nodos).
+    """
+    pesos = calcular_pesos(orden, nodos)
+    pesos.flags.writeable = False
+    return pesos
+
+
+def calcular_pesos(orden, nodos):
+    """Algoritmo de Fornberg sin caché (nodos reales, p. ej. de una malla no uniforme)"""
+    x = [float(v) for v in nodos]
+    n = len(x)
+    if orden < 0 or n <= orden:
+        raise ValueError(f"Para la derivada de orden {orden} se necesitan al menos {orden + 1} nodos")
+    if len(set(x)) != n:
+        raise ValueError("Los nodos de la plantilla deben ser distintos")
+    c = np.zeros((n, orden + 1))
+    c[0, 0] = 1.0
+    c1 = 1.0
+    c4 = x[0]
+    for i in range(1, n):
+        mn = min(i, orden)
+        c2 = 1.0
+        c5 = c4
+        c4 = x[i]
+        for j in range(i):
+            c3 = x[i] - x[j]
+            c2 *= c3
+            if j == i - 1:
+                for k in range(mn, 0, -1):
+                    c[i, k] = c1 * (k * c[i - 1, k - 1] - c5 * c[i - 1, k]) / c2
+                c[i, 0] = -c1 * c5 * c[i - 1, 0] / c2
+            for k in range(mn, 0, -1):
+                c[j, k] = (c4 * c[j, k] - k * c[j, k - 1]) / c3
+            c[j, 0] = c4 * c[j, 0] / c3
+        c1 = c2
+    return c[:, orden].copy()
+
+
+def plantilla(orden, puntos=None, tipo='central'):
+    """Nodos (en unidades de h) de una plantilla central, hacia adelante o hacia atrás
+
+    Sin puntos se usa la plantilla más pequeña: central de precisión 2 o
+    lateral de precisión 1.
+    """
+    if tipo == 'central':
+        puntos = 2 * ((orden + 1) // 2) + 1 if puntos is None else puntos
+        if puntos % 2 == 0:
+            raise ValueError("Una plantilla central necesita un número impar de puntos")
+        nodos = tuple(range(-(puntos // 2), puntos // 2 + 1))
+    elif tipo in ('adelante', 'atras'):
+        puntos = orden + 1 if puntos is None else puntos
+        nodos = tuple(range(puntos)) if tipo == 'adelante' else tuple(range(-puntos + 1, 1))
+    else:
+        raise ValueError(f"Tipo de plantilla desconocido: {tipo}")
+    if puntos <= orden:
+        raise ValueError(f"Para la derivada de orden {orden} se necesitan al menos {orden + 1} puntos")
+    return nodos
+
+
+def _es_simetrica(nodos):
+    return sorted(nodos) == sorted(-v for v in nodos)
+
+
+def _precision(orden, nodos):
+    """Orden del error de truncamiento; las plantillas simétricas ganan uno cuando n - orden es impar"""
+    p = len(nodos) - orden
+    return p + 1 if _es_simetrica(nodos) and p % 2 else p
+
+
+def derivada(f, x0, orden=1, puntos=None, tipo='central', h=None, richardson=0, nodos=None, control=None):
+    """f^(orden)(x0) por diferencias finitas, con estimación del error
+
+    x0 puede ser un número o un arreglo (se evalúa todo de una vez). La
+    plantilla es central/adelante/atrás con puntos nodos, o la tupla nodos
+    dada (en unidades de h); los pesos salen del algoritmo de Fornberg.
+
+    Con richardson = L se combinan las aproximaciones con pasos h, h/2, ...,
+    h/2^L para anular los L primeros términos del error. Sin h, el paso se
+    busca en cada punto entre candidatos h_0·2^k alrededor del óptimo
+    teórico ε^(1/(p+m)) y se elige el que minimiza el error estimado:
+    truncamiento (diferencia con la aproximación de paso 2h) más redondeo
+    (ε Σ|w_k f_k| / h^m).
+    """
+    expresion = como_expresion(f, ('x',))
+    nodos = plantilla(orden, puntos, tipo) if nodos is None else tuple(nodos)
+    pesos = pesos_fornberg(orden, nodos)
+    precision = _precision(orden, nodos)
+    # Órdenes de los términos del error: en las plantillas simétricas sólo aparecen de dos en dos;
+    # cada nivel de Richardson anula uno y el último es el orden del error que queda
+    potencias = [precision + (2 if _es_simetrica(nodos) else 1) * k for k in range(richardson + 1)]
+    eps = np.finfo(float).eps
+
+    escalar = np.ndim(x0) == 0
+    x = np.atleast_1d(np.asarray(x0, dtype=float))
+    desplazamientos = np.asarray(nodos, dtype=float)[:, None]
+    evaluaciones = 0
+
+    def estimar(paso):
+        """(aproximación extrapolada, error de redondeo estimado) con paso h (un arreglo por punto)"""
+        nonlocal evaluaciones
+        tabla = []
+        for nivel in range(richardson + 1):
+            hn = paso / 2 ** nivel
+            valores = expresion.evaluar_arreglo(x + desplazamientos * hn)
+            evaluaciones += valores.size
+            tabla.append(pesos @ valores / hn ** orden)
+        redondeo = eps * (np.abs(pesos) @ np.abs(valores)) / hn ** orden
+        for q in potencias[:-1]:
+            factor = 2.0 ** q
+            tabla = [(factor * tabla[i + 1] - tabla[i]) / (factor - 1) for i in range(len(tabla) - 1)]
+            redondeo = redondeo * (factor + 1) / (factor - 1)
+        return tabla[0], redondeo
+
+    factor_final = 2.0 ** potencias[-1]
+    if h is not None:
+        paso = np.broadcast_to(np.asarray(h, dtype=float), x.shape).copy()
+        valor, redondeo = estimar(paso)
+        doble, _ = estimar(2 * paso)
+        error = np.abs(valor - doble) / (factor_final - 1) + redondeo
+    else:
+        escala = np.maximum(np.abs(x), 1.0)
+        optimo = eps ** (1.0 / (potencias[-1] + orden)) * escala
+        candidatos = [optimo * 2.0 ** k for k in range(-4, 6)]
+        estimaciones = []
+        for k, candidato in enumerate(candidatos):
+            if control is not None:
+                control.reportar(k / len(candidatos))
+            estimaciones.append(estimar(candidato))
+        valores = np.array([e[0] for e in estimaciones])
+        redondeos = np.array([e[1] for e in estimaciones])
+        truncamientos = np.abs(valores[:-1] - valores[1:]) / (factor_final - 1)
+        totales = truncamientos + redondeos[:-1]
+        totales[~np.isfinite(totales)] = np.inf
+        mejor = np.argmin(totales, axis=0)
+        columnas = np.arange(x.size)
+        valor = valores[mejor, columnas]
+        error = totales[mejor, columnas]
+        paso = np.array(candidatos)[mejor, columnas]
+
+    if escalar:
+        valor, error, paso = float(valor[0]), float(error[0]), float(paso[0])
+        x = float(x[0])
+    return ResultadoDiferencias(valor, error, paso, x, orden, nodos, pesos, precision, richardson,
+                                evaluaciones)
@@ -0,0 +1,222 @@
+"""Derivadas de datos muestreados: arreglos en memoria, flujos por bloques y archivos
+
+En el interior se usan las fórmulas centrales de tres puntos (las mismas de
+second_derivative) aplicadas a todo el arreglo en una sola operación
+vectorizada; con malla no uniforme (x dado) los pesos dependen de los dos
+pasos vecinos h1 = x_i - x_{i-1}, h2 = x_{i+1} - x_i:
+
+  f'(x_i)  ≈ [-h2/(h1 s)] y_{i-1} + [(h2 - h1)/(h1 h2)] y_i + [h1/(h2 s)] y_{i+1}
+  f''(x_i) ≈ [2/(h1 s)]   y_{i-1} - [2/(h1 h2)] y_i         + [2/(h2 s)] y_{i+1}
+
+con s = h1 + h2. En los extremos se usan orden + 2 nodos hacia un lado
+(pesos de Fornberg), de segundo orden. Cada columna de y es una señal.
+
+derivar_flujo recibe los datos por bloques: de cada bloque se guardan las
+últimas orden + 2 filas (el halo) para completar la plantilla de la primera
+fila del bloque siguiente, así que el resultado es idéntico al de
+derivar_muestras sobre el arreglo completo y la memoria no depende del largo
+de la señal. derivar_archivo aplica el flujo a un .npy o .csv y escribe las
+derivadas a otro .npy por bloques.
+"""
+import itertools
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.derivadas import calcular_pesos, pesos_fornberg
+from core.trayectorias import ArchivoNpy
+
+
+@dataclass
+class ResultadoDerivadasArchivo:
+    """Derivadas de un archivo de muestras, escritas a un .npy"""
+    datos: np.ndarray       # memmap (filas, columnas) con las derivadas
+    ruta: str
+    orden: int
+    uniforme: bool          # True con paso h fijo; False si la columna 0 es x
+
+    @property
+    def filas(self):
+        return self.datos.shape[0]
+
+    @property
+    def senales(self):
+        return self.datos.shape[1] - (0 if self.uniforme else 1)
+
+
+def _validar_orden(orden):
+    if orden not in (1, 2):
+        raise ValueError("Las derivadas de datos tabulados admiten orden 1 o 2")
+
+
+def _interior(y, x, h, orden):
+    """Derivada en las filas 1..n-2 de y con la plantilla central de tres puntos"""
+    anterior, centro, siguiente = y[:-2], y[1:-1], y[2:]
+    if x is None:
+        if orden == 1:
+            return (siguiente - anterior) / (2 * h)
+        return (siguiente - 2 * centro + anterior) / h ** 2
+
+    pasos = np.diff(x)
+    h1, h2 = pasos[:-1], pasos[1:]
+    s = h1 + h2
+    if y.ndim == 2:
+        h1, h2, s = h1[:, None], h2[:, None], s[:, None]
+    if orden == 1:
+        return (-h2 / (h1 * s)) * anterior + ((h2 - h1) / (h1 * h2)) * centro + (h1 / (h2 * s)) * siguiente
+    return 2 * (anterior / (h1 * s) - centro / (h1 * h2) + siguiente / (h2 * s))
+
+
+def _extremo(y, x, h, orden, final):
+    """Derivada en la primera (o última) fila con orden + 2 nodos hacia un lado"""
+    m = orden + 2
+    filas = slice(-m, None) if final else slice(0, m)
+    if x is None:
+        nodos = tuple(range(-(m - 1), 1)) if final else tuple(range(m))
+        pesos = pesos_fornberg(orden, nodos) / h ** orden
+    else:
+        nodos = x[filas] - x[filas][-1 if final else 0]
+        pesos = calcular_pesos(orden, nodos)
+    return (pesos @ y[filas])[None]
+
+
+def _preparar(y, x, h, orden):
+    _validar_orden(orden)
+    y = np.asarray(y, dtype=float)
+    if y.ndim not in (1, 2):
+        raise ValueError("Se esperaba un vector de muestras o una matriz (muestras × señales)")
+    if x is None:
+        if h is None or not h > 0:
+            raise ValueError("Indique el paso h > 0 de la malla uniforme o las abscisas x")
+        h = float(h)
+    else:
+        x = np.asarray(x, dtype=float)
+        if x.shape != y.shape[:1]:
+            raise ValueError(f"x tiene {x.size} valores y hay {len(y)} muestras")
+        if np.any(np.diff(x) <= 0):
+            raise ValueError("Las abscisas x deben ser estrictamente crecientes")
+    return y, x, h
+
+
+def derivar_muestras(y, x=None, h=None, orden=1):
+    """Primera o segunda derivada de una señal muestreada en todos sus puntos
+
+    y es un vector (n,) o una matriz (n, señales); la malla es uniforme con
+    paso h o no uniforme con abscisas x crecientes. Devuelve un arreglo de la
+    misma forma que y.
+    """
+    y, x, h = _preparar(y, x, h, orden)
+    if len(y) < orden + 2:
+        raise ValueError(f"Se necesitan al menos {orden + 2} muestras para la derivada de orden {orden}")
+    return np.concatenate((_extremo(y, x, h, orden, False), _interior(y, x, h, orden),
+                           _extremo(y, x, h, orden, True)))
+
+
+def derivar_flujo(bloques, h=None, orden=1):
+    """Deriva una señal que llega por bloques; genera un bloque de derivadas por bloque leído
+
+    Cada bloque es una matriz (filas, columnas): con h dado todas las
+    columnas son señales; sin h la columna 0 es x y los bloques de salida la
+    conservan en la columna 0. Cada fila sale con un bloque de retraso (su
+    plantilla necesita la fila siguiente); la última sale al agotarse el
+    flujo. El resultado concatenado es igual al de derivar_muestras.
+    """
+    _validar_orden(orden)
+    uniforme = h is not None
+    if uniforme and not h > 0:
+        raise ValueError("El paso h debe ser positivo")
+    m = orden + 2
+
+    def derivar(ventana):
+        """Interior de la ventana: filas 1..len-2"""
+        x = None if uniforme else ventana[:, 0]
+        d = _interior(ventana if uniforme else ventana[:, 1:], x, h, orden)
+        return d if uniforme else np.column_stack((x[1:-1], d))
+
+    def extremo(ventana, final):
+        x = None if uniforme else ventana[:, 0]
+        d = _extremo(ventana if uniforme else ventana[:, 1:], x, h, orden, final)
+        return d if uniforme else np.column_stack((x[[-1 if final else 0]], d))
+
+    halo = None
+    inicio = False                  # ¿ya salió la primera fila?
+    for bloque in bloques:
+        bloque = np.asarray(bloque, dtype=float)
+        if bloque.ndim == 1:
+            bloque = bloque[:, None]            # un vector es una sola señal
+        if not uniforme and bloque.shape[1] < 2:
+            raise ValueError("Sin paso h, cada bloque necesita la columna x y al menos una señal")
+        ventana = bloque if halo is None else np.concatenate((halo, bloque))
+        if not inicio and len(ventana) < m:
+            halo = ventana.copy()
+            continue
+        if not uniforme and np.any(np.diff(ventana[:, 0]) <= 0):
+            raise ValueError("Las abscisas x deben ser estrictamente crecientes")
+        salida = []
+        if not inicio:
+            salida.append(extremo(ventana, False))
+            desde = 1
+            inicio = True
+        else:
+            desde = len(halo) - 1   # la última fila del halo estaba pendiente
+        salida.append(derivar(ventana[desde - 1:]))
+        halo = ventana[-m:].copy()     # copia: el bloque puede ser un búfer que se reutiliza
+        yield np.concatenate(salida)
+
+    if halo is None:
+        return
+    if not inicio:
+        raise ValueError(f"Se necesitan al menos {m} muestras para la derivada de orden {orden}")
+    yield extremo(halo, True)
+
+
+def _filas_archivo(ruta):
+    """Número de filas de un .npy (sin leerlo) o None si no se conoce de antemano"""
+    if os.path.splitext(ruta)[1].lower() == '.npy':
+        return np.load(ruta, mmap_mode='r').shape[0]
+    return None
+
+
+def bloques_archivo(ruta, filas=65536):
+    """Lee un .npy o un .csv/.txt/.dat de muestras en bloques de a lo sumo `filas` filas"""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == '.npy':
+        datos = np.load(ruta, mmap_mode='r')
+        if datos.ndim not in (1, 2):
+            raise ValueError(f"Se esperaba un vector o una matriz en {os.path.basename(ruta)}, forma {datos.shape}")
+        for i in range(0, datos.shape[0], filas):
+            yield np.array(datos[i:i + filas], dtype=float)
+    elif extension in ('.csv', '.txt', '.dat'):
+        separador = ',' if extension == '.csv' else None
+        with open(ruta, 'r') as archivo:
+            while True:
+                lineas = list(itertools.islice(archivo, filas))
+                if not lineas:
+                    break
+                yield np.loadtxt(lineas, delimiter=separador, ndmin=2)
+    else:
+        raise ValueError(f"Formato de archivo no soportado: {extension}")
+
+
+def derivar_archivo(entrada, salida, h=None, orden=1, filas=65536, control=None):
+    """Deriva las señales de un archivo de muestras y escribe las derivadas a un .npy
+
+    Con h dado todas las columnas son señales de paso h; sin h la columna 0
+    es x (malla no uniforme) y se copia a la columna 0 de la salida. Solo hay
+    en memoria un bloque de `filas` filas más el halo.
+    """
+    total = _filas_archivo(entrada)
+    derivadas = derivar_flujo(bloques_archivo(entrada, filas), h, orden)
+    primero = next(derivadas, None)
+    if primero is None:
+        raise ValueError(f"{os.path.basename(entrada)} no tiene muestras")
+    escritas = 0
+    with ArchivoNpy(salida, primero.shape[1]) as archivo:
+        for bloque in itertools.chain([primero], derivadas):
+            archivo.escribir(bloque)
+            escritas += len(bloque)
+            if control is not None and total:
+                control.reportar(escritas / total)
+        archivo.cerrar()
+    return ResultadoDerivadasArchivo(np.load(salida, mmap_mode='r'), salida, orden, h is not None)
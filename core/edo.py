@@ -0,0 +1,363 @@
+"""Ecuaciones diferenciales ordinarias
+
+Paso fijo: Runge-Kutta 2 (una ecuación) y Euler (sistemas). Paso adaptativo:
+Dormand-Prince 5(4) (dopri45) para una ecuación o un sistema, con control
+del error local, FSAL y salida densa.
+
+El lado derecho de un sistema se compila una vez en un LadoDerecho que
+escribe dy/dt en un búfer preasignado (sin reservar memoria por paso). Los
+métodos de paso fijo guardan la trayectoria con un EscritorTrayectoria: uno
+de cada guardar_cada pasos, en memoria o en un archivo .npy. Todos aceptan
+eventos g(t, y) = 0 (ver core.eventos); uno terminal detiene la integración.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.ejecucion import intervalo_reporte
+from core.eventos import DetectorEventos, interpolante_hermite
+from core.expresiones import como_expresion, compilar_vectorial
+from core.lineales import es_dispersa
+from core.trayectorias import EscritorTrayectoria
+
+
+@dataclass
+class ResultadoEDO:
+    """Trayectoria calculada por un integrador de EDO"""
+    t: np.ndarray
+    y: np.ndarray        # (n_pasos + 1,) para una ecuación, (n_pasos + 1, n) para sistemas
+    n_pasos: int
+    metodo: str
+    aceptados: int = None       # métodos adaptativos: pasos aceptados / rechazados
+    rechazados: int = None
+    evaluaciones: int = None    # evaluaciones del lado derecho f(t, y)
+    densa: object = None        # SalidaDensa: y(t) en cualquier t del intervalo
+    iteraciones_newton: int = None   # métodos implícitos
+    jacobianos: int = None           # veces que se calculó el jacobiano
+    factorizaciones: int = None      # factorizaciones LU de I - c·J
+    trayectoria: object = None       # Trayectoria (paso fijo): t e y son vistas de ella
+    guardar_cada: int = 1            # la fila j de t, y es el paso min(j·guardar_cada, n_pasos)
+    eventos: list = field(default_factory=list)   # (índice del evento, t, y) en orden cronológico
+    evento_terminal: int = None      # evento que detuvo la integración antes de tf
+
+
+class LadoDerecho:
+    """Lado derecho de un sistema y' = f(t, y) con escritura en un búfer
+
+    funcion(t, y, out) escribe dy/dt en out y lo devuelve; llamar con
+    out=None reserva un vector nuevo. Si el sistema es lineal, jacobiano
+    guarda la matriz A (la usan los métodos implícitos).
+    """
+
+    def __init__(self, funcion, n=None, jacobiano=None, descripcion=""):
+        self.funcion = funcion
+        self.n = n
+        self.jacobiano = jacobiano
+        self.descripcion = descripcion
+
+    def __call__(self, t, y, out=None):
+        if out is None:
+            out = np.empty(np.shape(y))
+        return self.funcion(t, y, out)
+
+
+def compilar_sistema(funciones):
+    """Convierte el lado derecho en un LadoDerecho
+
+    funciones puede ser una lista de expresiones f_i(t, y) (se compilan
+    juntas en una sola función, ver ExpresionVectorial), un LadoDerecho
+    (p. ej. de sistema_lineal) o una función sistema(t, y) -> dy/dt.
+    """
+    if isinstance(funciones, LadoDerecho):
+        return funciones
+    if callable(funciones):
+        def copiar(t, y, out):
+            out[...] = funciones(t, y)
+            return out
+        return LadoDerecho(copiar, descripcion=getattr(funciones, '__name__', ''))
+    expresiones = compilar_vectorial(tuple(funciones), ('t', 'y'))
+    return LadoDerecho(expresiones.funcion, len(expresiones), descripcion=repr(expresiones))
+
+
+def sistema_lineal(A, b=None):
+    """y' = A·y + b: cada evaluación es un producto matriz-vector (A densa o dispersa)"""
+    if es_dispersa(A):
+        A = A.tocsr()
+    else:
+        A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    if A.ndim != 2 or A.shape != (n, n):
+        raise ValueError("La matriz A debe ser cuadrada")
+    b = None if b is None else np.asarray(b, dtype=float).ravel()
+    if b is not None and b.size != n:
+        raise ValueError(f"El vector b debe tener {n} valores")
+
+    if es_dispersa(A):
+        def sistema(t, y, out):
+            out[...] = A @ y
+            if b is not None:
+                out += b
+            return out
+    else:
+        def sistema(t, y, out):
+            np.matmul(A, y, out=out)
+            if b is not None:
+                out += b
+            return out
+
+    return LadoDerecho(sistema, n, jacobiano=A, descripcion=f"A·y + b ({n} ecuaciones)")
+
+
+def campos_eventos(detector):
+    """Campos de ResultadoEDO con los eventos encontrados (nada si no se pidieron)"""
+    if detector is None:
+        return {}
+    return {'eventos': detector.encontrados, 'evento_terminal': detector.terminal}
+
+
+def rk2(f, t0, y0, tf, h, guardar_cada=1, archivo=None, eventos=None, control=None):
+    """Runge-Kutta de 2do orden (punto medio) para y' = f(t, y)
+
+    Guarda uno de cada guardar_cada pasos (y el último); con archivo, la
+    trayectoria se escribe por bloques a ese .npy en lugar de a memoria.
+    eventos es una lista de Evento (o expresiones g(t, y)); si uno terminal
+    se cumple, la trayectoria termina en el instante del evento.
+    """
+    f = como_expresion(f, ('t', 'y')).funcion
+
+    n_pasos = int((tf - t0) / h)
+
+    t = t0
+    y = float(y0)
+    detector = DetectorEventos(eventos, t, y) if eventos else None
+    pasos = n_pasos
+    with EscritorTrayectoria(1, archivo, guardar_cada, pasos=n_pasos) as escritor:
+        escritor.agregar(0, t, y)
+        cada = intervalo_reporte(n_pasos)
+        for i in range(n_pasos):
+            if control is not None and i % cada == 0:
+                control.reportar(i / n_pasos)
+            k1 = f(t, y)
+            t_mid = t + h/2
+            y_mid = y + (h/2) * k1
+            k2 = f(t_mid, y_mid)
+
+            t_nuevo = t0 + (i+1) * h
+            y_nuevo = y + h * k2
+            if detector is not None:
+                alto = detector.revisar(t, y, t_nuevo, y_nuevo, lambda: interpolante_hermite(
+                    t, y, k1, t_nuevo, y_nuevo, f(t_nuevo, y_nuevo)))
+                if alto is not None:
+                    (t, y), pasos = alto, i + 1
+                    break
+            t, y = t_nuevo, y_nuevo
+            escritor.agregar(i+1, t, y)
+        trayectoria = escritor.cerrar(pasos, t, y)
+
+    return ResultadoEDO(trayectoria.t, trayectoria.y[:, 0], pasos, "Runge-Kutta 2 (punto medio)",
+                        trayectoria=trayectoria, guardar_cada=guardar_cada, **campos_eventos(detector))
+
+
+def euler_system(funciones, y0, t0, tf, h, guardar_cada=1, archivo=None, eventos=None, control=None):
+    """Euler explícito para sistemas: y_{n+1} = y_n + h * f(t_n, y_n)
+
+    guardar_cada, archivo y eventos como en rk2.
+    """
+    sistema = compilar_sistema(funciones)
+    y = np.array(y0, dtype=float).ravel()
+    n = y.size
+
+    n_pasos = int((tf - t0) / h)
+
+    dydt = np.empty(n)
+    t = t0
+    detector = DetectorEventos(eventos, t, y) if eventos else None
+    pasos = n_pasos
+    with EscritorTrayectoria(n, archivo, guardar_cada, pasos=n_pasos) as escritor:
+        escritor.agregar(0, t, y)
+        cada = intervalo_reporte(n_pasos)
+        for i in range(n_pasos):
+            if control is not None and i % cada == 0:
+                control.reportar(i / n_pasos)
+            sistema(t, y, dydt)
+
+            t_nuevo = t0 + (i+1) * h
+            if detector is None:
+                # y_{n+1} = y_n + h f(t_n, y_n), en el mismo vector de estado
+                dydt *= h
+                y += dydt
+            else:
+                y_nuevo = y + h * dydt
+                alto = detector.revisar(t, y, t_nuevo, y_nuevo, lambda: interpolante_hermite(
+                    t, y, dydt, t_nuevo, y_nuevo, sistema(t_nuevo, y_nuevo)))
+                if alto is not None:
+                    (t, y), pasos = alto, i + 1
+                    break
+                y = y_nuevo
+            t = t_nuevo
+            escritor.agregar(i+1, t, y)
+        trayectoria = escritor.cerrar(pasos, t, y)
+
+    return ResultadoEDO(trayectoria.t, trayectoria.y, pasos, "Euler (orden 1)",
+                        trayectoria=trayectoria, guardar_cada=guardar_cada, **campos_eventos(detector))
+
+
+# Dormand-Prince 5(4): nodos, matriz A, pesos de orden 5 (última fila de A, FSAL)
+# y diferencia con los de orden 4 para estimar el error
+_DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+_DP_E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# Coeficientes de la salida densa de orden 4 (Hairer, contd5)
+_DP_D = np.array([-12715105075/11282082432, 0, 87487479700/32700410799, -10690763975/1880347072,
+                  701980252875/199316789632, -1453857185/822651844, 69997945/29380423])
+
+
+class SalidaDensa:
+    """Interpolante de la solución entre los pasos aceptados
+
+    En cada paso [t_i, t_i + h_i] guarda cinco vectores r_1..r_5 y evalúa
+    y(t_i + θh) = r1 + θ(r2 + (1-θ)(r3 + θ(r4 + (1-θ) r5))). h_i es
+    t_{i+1} - t_i salvo en un último paso cortado por un evento terminal.
+    """
+
+    def __init__(self, t, coeficientes, escalar=False, h=None):
+        self.t = np.asarray(t, dtype=float)            # t_0, ..., t_N
+        self.coeficientes = np.asarray(coeficientes)   # (N, 5, n)
+        self.escalar = escalar
+        self.h = np.diff(self.t) if h is None else np.asarray(h, dtype=float)
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        tt = t.ravel()
+        creciente = self.t[-1] >= self.t[0]
+        nodos = self.t if creciente else -self.t
+        i = np.clip(np.searchsorted(nodos, tt if creciente else -tt, side='right') - 1,
+                    0, len(self.coeficientes) - 1)
+        theta = ((tt - self.t[i]) / self.h[i])[:, None]
+        y = _densa_paso(self.coeficientes[i].transpose(1, 0, 2), theta)
+        if self.escalar:
+            y = y[:, 0]
+            return float(y[0]) if t.ndim == 0 else y.reshape(t.shape)
+        return y[0] if t.ndim == 0 else y.reshape(t.shape + (y.shape[-1],))
+
+
+def _densa_paso(r, theta):
+    """Polinomio de la salida densa con coeficientes r = (r1, ..., r5) en θ"""
+    theta1 = 1 - theta
+    return r[0] + theta * (r[1] + theta1 * (r[2] + theta * (r[3] + theta1 * r[4])))
+
+
+def _sistema_o_escalar(f, y0):
+    """Devuelve (sistema(t, y) -> arreglo, y0 como vector, es_escalar)"""
+    if np.ndim(y0) == 0:
+        g = como_expresion(f, ('t', 'y')).funcion
+
+        def escalar(t, y, out):
+            out[0] = g(t, y[0])
+            return out
+        return LadoDerecho(escalar, 1), np.array([float(y0)]), True
+    return compilar_sistema(f), np.array(y0, dtype=float).ravel(), False
+
+
+def _paso_inicial(sistema, t0, y0, f0, tf, rtol, atol):
+    """Estimación del primer paso: 1 % de ||y0|| / ||f0|| en norma escalada"""
+    escala = atol + rtol * np.abs(y0)
+    d0 = np.sqrt(np.mean((y0 / escala) ** 2))
+    d1 = np.sqrt(np.mean((f0 / escala) ** 2))
+    h = 0.01 * d0 / d1 if d0 > 1e-5 and d1 > 1e-5 else 1e-6
+    return min(h, abs(tf - t0))
+
+
+def dopri45(f, t0, y0, tf, rtol=1e-6, atol=1e-9, h0=None, h_max=None, max_pasos=1_000_000,
+            eventos=None, control=None):
+    """Runge-Kutta adaptativo de Dormand-Prince 5(4)
+
+    f es una expresión f(t, y) si y0 es un número, o una lista de
+    expresiones / función sistema(t, y) si y0 es un vector. El error local
+    se mide con la diferencia entre las soluciones de orden 5 y 4, escalada
+    por atol + rtol·|y|; el paso se ajusta con h·0.9·err^(-1/5) (entre 0.2h
+    y 10h). La última etapa de un paso es la primera del siguiente (FSAL):
+    cada paso aceptado cuesta seis evaluaciones de f. Los eventos se
+    localizan sobre la salida densa del paso, sin evaluar f de nuevo.
+    """
+    sistema, y, escalar = _sistema_o_escalar(f, y0)
+    direccion = 1.0 if tf >= t0 else -1.0
+    h_max = abs(tf - t0) if h_max is None else abs(h_max)
+
+    t = float(t0)
+    k = np.empty((7, y.size))
+    sistema(t, y, k[0])
+    evaluaciones = 1
+    h = abs(h0) if h0 is not None else _paso_inicial(sistema, t, y, k[0], tf, rtol, atol)
+    h = min(max(h, 1e-12 * max(abs(t0), 1.0)), h_max)
+
+    ts, ys, coeficientes, anchos = [t], [y.copy()], [], []
+    detector = DetectorEventos(eventos, t, y, escalar) if eventos else None
+    aceptados = rechazados = 0
+    rechazado_antes = False
+    while direccion * (tf - t) > 0:
+        if aceptados + rechazados >= max_pasos:
+            raise ValueError(f"Se superó el máximo de {max_pasos} pasos en t = {t:.6g}")
+        if control is not None and (aceptados + rechazados) % 50 == 0:
+            control.reportar((t - t0) / (tf - t0) if tf != t0 else 1.0)
+
+        h = min(h, abs(tf - t))
+        hs = direccion * h
+        for etapa in range(1, 7):
+            y_etapa = y + hs * (np.dot(_DP_A[etapa], k[:etapa]))
+            sistema(t + _DP_C[etapa] * hs, y_etapa, k[etapa])
+        evaluaciones += 6
+        y_nuevo = y_etapa      # la etapa 7 se evalúa en la solución de orden 5
+
+        escala = atol + rtol * np.maximum(np.abs(y), np.abs(y_nuevo))
+        error = np.sqrt(np.mean((hs * (_DP_E @ k) / escala) ** 2))
+        if not np.isfinite(error):
+            error = np.inf
+
+        if error <= 1.0:
+            diferencia = y_nuevo - y
+            bspl = hs * k[0] - diferencia
+            r = [y, diferencia, bspl, diferencia - hs * k[6] - bspl, hs * (_DP_D @ k)]
+            coeficientes.append(r)
+            anchos.append(hs)
+            aceptados += 1
+            t_nuevo = t + hs if abs(tf - (t + hs)) > 1e-14 * max(abs(tf), 1.0) else tf
+            if detector is not None:
+                t_paso = t
+                alto = detector.revisar(t, y, t_nuevo, y_nuevo,
+                                        lambda: lambda tt: _densa_paso(r, (tt - t_paso) / hs))
+                if alto is not None:
+                    ts.append(alto[0])
+                    ys.append(alto[1])
+                    break
+            t = t_nuevo
+            y = y_nuevo
+            ts.append(t)
+            ys.append(y)
+            k[0] = k[6]    # FSAL
+            factor = 10.0 if error == 0 else min(10.0, 0.9 * error ** -0.2)
+            if rechazado_antes:
+                factor = min(factor, 1.0)
+            rechazado_antes = False
+        else:
+            rechazados += 1
+            rechazado_antes = True
+            factor = max(0.2, 0.9 * error ** -0.2) if np.isfinite(error) else 0.2
+        h = min(h * factor, h_max)
+        if h < 1e-14 * max(abs(t), 1.0):
+            raise ValueError(f"El paso se volvió demasiado pequeño en t = {t:.6g} (¿problema rígido?)")
+
+    ts = np.array(ts)
+    ys = np.array(ys)
+    densa = SalidaDensa(ts, coeficientes, escalar, anchos) if coeficientes else None
+    return ResultadoEDO(ts, ys[:, 0] if escalar else ys, aceptados, "Dormand-Prince RK45 (adaptativo)",
+                        aceptados=aceptados, rechazados=rechazados, evaluaciones=evaluaciones, densa=densa,
+                        **campos_eventos(detector))
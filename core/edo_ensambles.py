@@ -0,0 +1,200 @@
+"""Ensambles de EDO: muchas condiciones iniciales (y parámetros) a la vez
+
+Las m trayectorias se guardan como un arreglo Y de forma (m, n_eq) y se
+avanzan juntas con paso fijo (Euler o RK2 punto medio): cada evaluación
+del lado derecho es una sola operación sobre arreglos. Para un sistema
+compilado (ver ExpresionVectorial) se llama a la función con y = Y.T, de
+modo que y[i] es la fila con la componente i de todas las trayectorias y
+out[i] se escribe de una vez. Los parámetros opcionales de cada trayectoria
+(una matriz (m, n_par)) se usan en las expresiones como p[0], p[1], ...
+
+Si una expresión no funciona con arreglos (min, max, if, ...) se detecta en
+la primera evaluación y se recorre trayectoria por trayectoria. Los
+ensambles muy grandes se parten en bloques que se reparten entre procesos.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.edo import LadoDerecho
+from core.ejecucion import intervalo_reporte
+from core.expresiones import como_expresion, compilar_vectorial
+
+
+@dataclass
+class ResultadoEnsamble:
+    """Trayectorias de un ensamble de EDO"""
+    t: np.ndarray
+    y: np.ndarray        # (n_puntos, m) para una ecuación, (n_puntos, m, n_eq) para sistemas
+    n_pasos: int
+    metodo: str
+    trayectorias: int
+    vectorizado: bool    # False si el lado derecho se evaluó trayectoria por trayectoria
+    evaluaciones: int    # evaluaciones del lado derecho para todo el ensamble a la vez
+
+
+class _LadoDerechoEnsamble:
+    """Evalúa f(t, y[, p]) para todas las trayectorias: out[k] = f(t, Y[k], P[k])"""
+
+    def __init__(self, f, escalar, con_parametros):
+        variables = ('t', 'y', 'p') if con_parametros else ('t', 'y')
+        self.escalar = escalar
+        self.vectorial = None        # se decide en la primera evaluación
+        if escalar:
+            self.funcion = como_expresion(f, variables).funcion
+            self.escribe = False
+        elif isinstance(f, LadoDerecho):
+            if con_parametros:
+                raise ValueError("Un LadoDerecho no admite parámetros por trayectoria")
+            self.funcion = f.funcion
+            self.escribe = True
+        elif callable(f):
+            self.funcion = f
+            self.escribe = False
+        else:
+            self.funcion = compilar_vectorial(tuple(f), variables).funcion
+            self.escribe = True
+
+    def _evaluar(self, t, y, p, out):
+        """Una evaluación: y, p y out son (n_eq, ...) o escalares"""
+        extra = () if p is None else (p,)
+        if self.escribe:
+            self.funcion(t, y, *extra, out)
+        else:
+            out[...] = self.funcion(t, y[0] if self.escalar else y, *extra)
+
+    def _por_trayectoria(self, t, Y, P, out, indices):
+        for k in indices:
+            self._evaluar(t, Y[k], None if P is None else P[k], out[k])
+
+    def __call__(self, t, Y, P, out):
+        if self.vectorial is False:
+            self._por_trayectoria(t, Y, P, out, range(len(Y)))
+            return out
+        try:
+            self._evaluar(t, Y.T, None if P is None else P.T, out.T)
+            vectorial = True
+        except (TypeError, ValueError, IndexError):
+            vectorial = False
+        if self.vectorial is None and vectorial:
+            # Se compara con la evaluación de una en una en la primera y la última trayectoria
+            muestra = np.empty((len(Y),) + out.shape[1:])
+            extremos = sorted({0, len(Y) - 1})
+            self._por_trayectoria(t, Y, P, muestra, extremos)
+            vectorial = np.allclose(muestra[extremos], out[extremos], rtol=1e-9, atol=1e-12,
+                                    equal_nan=True)
+        self.vectorial = vectorial
+        if not vectorial:
+            self._por_trayectoria(t, Y, P, out, range(len(Y)))
+        return out
+
+
+def _indices_guardados(n_pasos, guardar_cada):
+    """Pasos que se guardan: 0, k, 2k, ... y siempre el último"""
+    indices = np.arange(0, n_pasos + 1, guardar_cada)
+    if indices[-1] != n_pasos:
+        indices = np.append(indices, n_pasos)
+    return indices
+
+
+def _integrar_bloque(f, escalar, Y0, P, t0, h, n_pasos, metodo, guardar_cada, control=None):
+    """Avanza el bloque de trayectorias Y0 (m, n_eq); se ejecuta también en otros procesos"""
+    rhs = _LadoDerechoEnsamble(f, escalar, P is not None)
+    Y = Y0.copy()
+    K1 = np.empty_like(Y)
+    K2 = np.empty_like(Y) if metodo == 'rk2' else None
+    Y_medio = np.empty_like(Y) if metodo == 'rk2' else None
+
+    guardados = _indices_guardados(n_pasos, guardar_cada)
+    salida = np.empty((guardados.size,) + Y.shape)
+    salida[0] = Y
+    siguiente = 1
+
+    cada = intervalo_reporte(n_pasos)
+    for i in range(n_pasos):
+        if control is not None and i % cada == 0:
+            control.reportar(i / n_pasos)
+        t = t0 + i * h
+        rhs(t, Y, P, K1)
+        if metodo == 'euler':
+            K1 *= h
+            Y += K1
+        else:
+            np.multiply(K1, h / 2, out=Y_medio)
+            Y_medio += Y
+            rhs(t + h / 2, Y_medio, P, K2)
+            K2 *= h
+            Y += K2
+        if siguiente < guardados.size and guardados[siguiente] == i + 1:
+            salida[siguiente] = Y
+            siguiente += 1
+
+    return salida, rhs.vectorial is not False
+
+
+_METODOS_ENSAMBLE = {
+    'euler': ("Euler (orden 1)", 1),
+    'rk2': ("Runge-Kutta 2 (punto medio)", 2),
+}
+
+
+def ensamble_edo(f, y0, t0, tf, h, parametros=None, metodo='rk2', guardar_cada=1,
+                 procesos=1, bloque=20_000, control=None):
+    """Integra a la vez todas las trayectorias de un ensamble con paso fijo
+
+    y0 es un vector (una ecuación, una condición inicial por trayectoria) o
+    una matriz (m, n_eq) con una fila por trayectoria; f es la expresión
+    f(t, y) o la lista de expresiones del sistema, igual que en rk2 y
+    euler_system. parametros, si se da, es una matriz (m, n_par) (o un
+    vector, un parámetro por trayectoria) y las expresiones lo usan como
+    p[0], p[1], ...
+
+    Sólo se guarda uno de cada guardar_cada pasos (y el último). Con
+    procesos > 1 y más de bloque trayectorias, los bloques se reparten entre
+    procesos (f debe poder serializarse: cadenas sí, lambdas no).
+    """
+    if metodo not in _METODOS_ENSAMBLE:
+        raise ValueError(f"Método de ensamble desconocido: {metodo}")
+    if h <= 0:
+        raise ValueError("El paso h debe ser positivo")
+    if guardar_cada < 1:
+        raise ValueError("guardar_cada debe ser al menos 1")
+    escalar = np.ndim(y0) == 1 and not isinstance(f, (list, tuple, LadoDerecho))
+    Y0 = np.array(y0, dtype=float, ndmin=1)
+    if escalar:
+        Y0 = Y0[:, None]
+    elif Y0.ndim != 2:
+        raise ValueError("Para un sistema y0 debe ser una matriz (trayectorias × ecuaciones)")
+    m = len(Y0)
+    if m == 0:
+        raise ValueError("El ensamble no tiene trayectorias")
+    P = None
+    if parametros is not None:
+        P = np.asarray(parametros, dtype=float)
+        P = P[:, None] if P.ndim == 1 else P
+        if P.ndim != 2 or len(P) != m:
+            raise ValueError(f"Se esperaba una fila de parámetros por trayectoria ({m})")
+
+    n_pasos = int((tf - t0) / h)
+    guardados = _indices_guardados(n_pasos, guardar_cada)
+    nombre, etapas = _METODOS_ENSAMBLE[metodo]
+
+    if procesos > 1 and m > bloque:
+        y = np.empty((guardados.size,) + Y0.shape)
+        cortes = range(0, m, bloque)
+        argumentos = [(f, escalar, Y0[c:c + bloque], None if P is None else P[c:c + bloque],
+                       t0, h, n_pasos, metodo, guardar_cada) for c in cortes]
+        vectorizado = True
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            for k, (c, (parte, vectorial)) in enumerate(zip(cortes, ejecutor.map(_integrar_bloque,
+                                                                                   *zip(*argumentos)))):
+                if control is not None:
+                    control.reportar(k / len(argumentos))
+                y[:, c:c + bloque] = parte
+                vectorizado &= vectorial
+    else:
+        y, vectorizado = _integrar_bloque(f, escalar, Y0, P, t0, h, n_pasos, metodo, guardar_cada, control)
+
+    return ResultadoEnsamble(t0 + h * guardados, y[:, :, 0] if escalar else y, n_pasos,
+                             f"{nombre}, ensamble", m, vectorizado, etapas * n_pasos)
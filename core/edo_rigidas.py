@@ -0,0 +1,295 @@
+"""Métodos implícitos para sistemas rígidos de EDO (paso fijo)
+
+Euler implícito y BDF2 resuelven en cada paso el sistema no lineal
+
+    y = ψ + c·f(t, y)        (Euler: ψ = y_n, c = h;  BDF2: ψ = 4/3 y_n - 1/3 y_{n-1}, c = 2h/3)
+
+con Newton sobre la matriz M = I - c·J. El jacobiano J se calcula por
+diferencias finitas (o es exacto si el sistema es lineal, ver
+sistema_lineal), M se factoriza con LU y ambos se reutilizan en los pasos
+siguientes: sólo se recalculan cuando Newton empieza a converger despacio o
+diverge. Rosenbrock-W (ROS2) es linealmente implícito: dos resoluciones con
+la misma factorización por paso y sin iteración, y admite un jacobiano
+desactualizado: se recalcula cuando la etapa intermedia muestra que ya no
+linealiza bien a f, o cada cierto número de pasos.
+"""
+import numpy as np
+
+from core.edo import ResultadoEDO, campos_eventos, compilar_sistema
+from core.ejecucion import intervalo_reporte
+from core.eventos import DetectorEventos, interpolante_hermite
+from core.lineales import es_dispersa, sp_linalg, sp_sparse, sp_sparse_linalg
+from core.trayectorias import EscritorTrayectoria
+
+
+class _Jacobiano:
+    """Jacobiano de f, factorización LU de I - c·J y contadores"""
+
+    def __init__(self, sistema, n):
+        self.sistema = sistema
+        self.n = n
+        self.exacto = sistema.jacobiano
+        self.J = None
+        self.c = None
+        self.resolver = None
+        self.fresco = False          # J calculado en el paso actual
+        self.pendiente = True        # recalcular J al empezar el próximo paso
+        self.evaluaciones = 0        # evaluaciones de f hechas por las diferencias finitas
+        self.calculos = 0
+        self.factorizaciones = 0
+        self._columna = np.empty(n)
+
+    def actualizar(self, t, y, f_y):
+        """Recalcula J en (t, y); f_y = f(t, y) ya evaluada"""
+        if self.exacto is not None:
+            if self.J is None:
+                self.J = self.exacto
+                self.calculos += 1
+            self.fresco = True
+            return
+        J = np.empty((self.n, self.n))
+        y_mas = y.copy()
+        for j in range(self.n):
+            delta = np.sqrt(np.finfo(float).eps) * max(abs(y[j]), 1.0)
+            y_mas[j] = y[j] + delta
+            self.sistema(t, y_mas, self._columna)
+            J[:, j] = (self._columna - f_y) / delta
+            y_mas[j] = y[j]
+        self.evaluaciones += self.n
+        self.calculos += 1
+        self.J = J
+        self.c = None                # hay que refactorizar
+        self.fresco = True
+
+    def factorizar(self, c):
+        """Factoriza M = I - c·J (sólo si cambió J o c)"""
+        if self.c == c and self.resolver is not None:
+            return
+        if es_dispersa(self.J):
+            M = (sp_sparse.identity(self.n, format='csc') - c * self.J).tocsc()
+            self.resolver = sp_sparse_linalg.splu(M).solve
+        else:
+            M = np.eye(self.n) - c * self.J
+            if sp_linalg is not None:
+                lu = sp_linalg.lu_factor(M, check_finite=False)
+                self.resolver = lambda r: sp_linalg.lu_solve(lu, r, check_finite=False)
+            else:
+                inversa = np.linalg.inv(M)
+                self.resolver = inversa.__matmul__
+        self.c = c
+        self.factorizaciones += 1
+
+
+def _preparar(funciones, y0, t0, tf, h):
+    sistema = compilar_sistema(funciones)
+    y = np.array(y0, dtype=float).ravel()
+    if h <= 0:
+        raise ValueError("El paso h debe ser positivo")
+    return sistema, y, int((tf - t0) / h)
+
+
+def _newton(sistema, jac, t, psi, c, y_pred, tol, max_iter, f_y, completo=False):
+    """Resuelve y = psi + c·f(t, y); devuelve (y, iteraciones, evaluaciones, lenta)
+
+    Newton simplificado (J fijo) salvo con completo=True, que recalcula J en
+    cada iterado. f_y es un búfer de trabajo. Si la iteración diverge
+    (||Δ_k|| / ||Δ_{k-1}|| > 0.9) o no converge en max_iter pasos devuelve
+    y = None.
+    """
+    y = y_pred.copy()
+    anterior = None
+    for k in range(max_iter):
+        sistema(t, y, f_y)
+        if completo:
+            jac.actualizar(t, y, f_y)
+            jac.factorizar(c)
+        residuo = y - psi - c * f_y
+        delta = jac.resolver(-residuo)
+        y += delta
+        norma = np.max(np.abs(delta)) if delta.size else 0.0
+        if not np.isfinite(norma):
+            return None, k + 1, k + 1, True
+        tasa = norma / anterior if anterior else 0.0
+        if norma <= tol * (1.0 + np.max(np.abs(y))):
+            # Convergencia lenta: conviene recalcular J en el próximo paso
+            return y, k + 1, k + 1, completo or k >= 3 or tasa > 0.3
+        if not completo and anterior is not None and tasa > 0.9:
+            return None, k + 1, k + 1, True
+        anterior = norma
+    return None, max_iter, max_iter, True
+
+
+def _paso_implicito(sistema, jac, t_nuevo, t_base, y_base, psi, c, y_pred, tol, max_iter, f_y):
+    """Paso implícito: Newton con el J guardado; si falla, con J recalculado en
+    (t_n, y_n) y, como último recurso, Newton completo (J en cada iterado)"""
+    evaluaciones = iteraciones = 0
+    for intento in ('guardado', 'fresco', 'completo'):
+        if intento == 'fresco':
+            if jac.fresco:
+                continue
+            sistema(t_base, y_base, f_y)
+            evaluaciones += 1
+            jac.actualizar(t_base, y_base, f_y)
+        jac.factorizar(c)
+        y, its, evals, lenta = _newton(sistema, jac, t_nuevo, psi, c, y_pred, tol,
+                                       max_iter if intento != 'completo' else 4 * max_iter, f_y,
+                                       completo=intento == 'completo')
+        evaluaciones += evals
+        iteraciones += its
+        if y is not None:
+            if lenta:
+                jac.pendiente = True
+            return y, iteraciones, evaluaciones
+    raise ValueError(f"Newton no convergió en t = {t_nuevo:.6g}; reduzca el paso h")
+
+
+def _integrar_implicito(nombre, funciones, y0, t0, tf, h, bdf2, tol_newton, max_newton,
+                        guardar_cada, archivo, eventos, control):
+    sistema, y, n_pasos = _preparar(funciones, y0, t0, tf, h)
+    n = y.size
+    jac = _Jacobiano(sistema, n)
+    f_y = np.empty(n)
+    y_anterior = None
+    evaluaciones = iteraciones = 0
+    detector = DetectorEventos(eventos, t0, y) if eventos else None
+    pasos = n_pasos
+    t_nuevo = t0
+
+    with EscritorTrayectoria(n, archivo, guardar_cada, pasos=n_pasos) as escritor:
+        escritor.agregar(0, t0, y)
+        cada = intervalo_reporte(n_pasos)
+        for i in range(n_pasos):
+            if control is not None and i % cada == 0:
+                control.reportar(i / n_pasos)
+            t, t_nuevo = t0 + i * h, t0 + (i + 1) * h
+            if jac.pendiente:
+                sistema(t, y, f_y)
+                evaluaciones += 1
+                jac.actualizar(t, y, f_y)
+                jac.pendiente = False
+            else:
+                jac.fresco = False
+
+            if bdf2 and y_anterior is not None:
+                psi = (4.0 * y - y_anterior) / 3.0
+                c = 2.0 * h / 3.0
+                y_pred = 2.0 * y - y_anterior
+            else:
+                # Primer paso de BDF2 (o todos los de Euler): Euler implícito
+                psi, c, y_pred = y, h, y
+            y_nuevo, its, evals = _paso_implicito(sistema, jac, t_nuevo, t, y, psi, c, y_pred,
+                                                  tol_newton, max_newton, f_y)
+            evaluaciones += evals
+            iteraciones += its
+            if detector is not None:
+                alto = detector.revisar(t, y, t_nuevo, y_nuevo, lambda: interpolante_hermite(
+                    t, y, sistema(t, y), t_nuevo, y_nuevo, sistema(t_nuevo, y_nuevo)))
+                if alto is not None:
+                    (t_nuevo, y), pasos = alto, i + 1
+                    break
+            y_anterior, y = y, y_nuevo
+            escritor.agregar(i + 1, t_nuevo, y)
+        trayectoria = escritor.cerrar(pasos, t_nuevo, y)
+
+    return ResultadoEDO(trayectoria.t, trayectoria.y, pasos, nombre,
+                        evaluaciones=evaluaciones + jac.evaluaciones, iteraciones_newton=iteraciones,
+                        jacobianos=jac.calculos, factorizaciones=jac.factorizaciones,
+                        trayectoria=trayectoria, guardar_cada=guardar_cada, **campos_eventos(detector))
+
+
+def backward_euler(funciones, y0, t0, tf, h, tol_newton=1e-10, max_newton=8, guardar_cada=1,
+                   archivo=None, eventos=None, control=None):
+    """Euler implícito: y_{n+1} = y_n + h f(t_{n+1}, y_{n+1}) (orden 1, L-estable)"""
+    return _integrar_implicito("Euler implícito (orden 1)", funciones, y0, t0, tf, h, False,
+                               tol_newton, max_newton, guardar_cada, archivo, eventos, control)
+
+
+def bdf2(funciones, y0, t0, tf, h, tol_newton=1e-10, max_newton=8, guardar_cada=1,
+         archivo=None, eventos=None, control=None):
+    """BDF2: y_{n+1} - 4/3 y_n + 1/3 y_{n-1} = 2/3 h f(t_{n+1}, y_{n+1}) (orden 2, L-estable)
+
+    El primer paso se da con Euler implícito.
+    """
+    return _integrar_implicito("BDF2 (orden 2)", funciones, y0, t0, tf, h, True,
+                               tol_newton, max_newton, guardar_cada, archivo, eventos, control)
+
+
+# ROS2 (Verwer et al., 1999): método W de orden 2, L-estable
+_GAMMA_ROS2 = 1.0 + 1.0 / np.sqrt(2.0)
+
+
+def rosenbrock_w(funciones, y0, t0, tf, h, reusar_jacobiano=50, guardar_cada=1, archivo=None,
+                 eventos=None, control=None):
+    """Rosenbrock-W de 2 etapas (ROS2), linealmente implícito
+
+        (I - γhJ) k1 = f(t_n, y_n)
+        (I - γhJ) k2 = f(t_n + h, y_n + h k1) - 2 k1
+        y_{n+1} = y_n + h (3/2 k1 + 1/2 k2),     γ = 1 + 1/√2
+
+    Al ser un método W mantiene el orden 2 aunque J no sea el jacobiano
+    exacto, por eso J y su LU se reutilizan. J se recalcula cuando deja de
+    describir a f: la segunda etapa evalúa f(y_n + h k1), que se compara con
+    la predicción lineal f(y_n) + J·h k1; si difieren en más de la mitad del
+    cambio de f (o tras reusar_jacobiano pasos) se recalcula en el paso
+    siguiente, y si el paso da valores no finitos se repite con J nuevo.
+    """
+    sistema, y, n_pasos = _preparar(funciones, y0, t0, tf, h)
+    n = y.size
+    jac = _Jacobiano(sistema, n)
+    f_y = np.empty(n)
+    f_etapa = np.empty(n)
+    evaluaciones = 0
+    ultimo_calculo = 0
+    detector = DetectorEventos(eventos, t0, y) if eventos else None
+    pasos = n_pasos
+    t_nuevo = t0
+
+    with EscritorTrayectoria(n, archivo, guardar_cada, pasos=n_pasos) as escritor:
+        escritor.agregar(0, t0, y)
+        cada = intervalo_reporte(n_pasos)
+        for i in range(n_pasos):
+            if control is not None and i % cada == 0:
+                control.reportar(i / n_pasos)
+            t = t0 + i * h
+            sistema(t, y, f_y)
+            evaluaciones += 1
+            if jac.pendiente or i - ultimo_calculo >= reusar_jacobiano:
+                jac.actualizar(t, y, f_y)
+                jac.pendiente = False
+                ultimo_calculo = i
+            else:
+                jac.fresco = False
+
+            while True:
+                jac.factorizar(_GAMMA_ROS2 * h)
+                k1 = jac.resolver(f_y)
+                sistema(t + h, y + h * k1, f_etapa)
+                evaluaciones += 1
+                cambio_f = f_etapa - f_y
+                k2 = jac.resolver(f_etapa - 2.0 * k1)
+                y_nuevo = y + h * (1.5 * k1 + 0.5 * k2)
+                if np.all(np.isfinite(y_nuevo)):
+                    break
+                if jac.fresco:
+                    raise ValueError(f"La solución dejó de ser finita en t = {t + h:.6g}; reduzca el paso h")
+                jac.actualizar(t, y, f_y)
+                ultimo_calculo = i
+            t_nuevo = t0 + (i + 1) * h
+            if detector is not None:
+                alto = detector.revisar(t, y, t_nuevo, y_nuevo, lambda: interpolante_hermite(
+                    t, y, f_y, t_nuevo, y_nuevo, sistema(t_nuevo, y_nuevo)))
+                if alto is not None:
+                    (t_nuevo, y), pasos = alto, i + 1
+                    break
+            y = y_nuevo
+            escritor.agregar(i + 1, t_nuevo, y)
+
+            if jac.exacto is None:
+                discrepancia = np.max(np.abs(cambio_f - jac.J @ (h * k1)))
+                jac.pendiente = discrepancia > 0.5 * np.max(np.abs(cambio_f))
+        trayectoria = escritor.cerrar(pasos, t_nuevo, y)
+
+    return ResultadoEDO(trayectoria.t, trayectoria.y, pasos, "Rosenbrock-W ROS2 (orden 2)",
+                        evaluaciones=evaluaciones + jac.evaluaciones, jacobianos=jac.calculos,
+                        factorizaciones=jac.factorizaciones, trayectoria=trayectoria,
+                        guardar_cada=guardar_cada, **campos_eventos(detector))
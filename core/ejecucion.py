@@ -0,0 +1,77 @@
+"""Ejecución de cálculos largos fuera del hilo de la interfaz
+
+Los métodos del núcleo aceptan un parámetro opcional ``control``: entre
+iteraciones publican su avance con ``control.reportar(fraccion)``, que lanza
+CalculoCancelado si alguien pidió cancelar. La interfaz consulta el avance
+periódicamente (root.after) sin tocar Tk desde el hilo de cálculo.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CalculoCancelado(Exception):
+    """El usuario canceló el cálculo"""
+
+
+class Control:
+    """Progreso y bandera de cancelación compartidos con el hilo de cálculo"""
+
+    def __init__(self):
+        self._cancelar = threading.Event()
+        self.progreso = 0.0
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    @property
+    def cancelado(self):
+        return self._cancelar.is_set()
+
+    def reportar(self, progreso):
+        """Publica el avance (0 a 1) y detiene el cálculo si se pidió cancelar"""
+        self.progreso = min(max(progreso, 0.0), 1.0)
+        if self._cancelar.is_set():
+            raise CalculoCancelado()
+
+
+def intervalo_reporte(total, reportes=200):
+    """Cada cuántas iteraciones conviene llamar a control.reportar"""
+    return max(1, int(total) // reportes)
+
+
+class Tarea:
+    """Cálculo enviado al ejecutor: futuro + control"""
+
+    def __init__(self, futuro, control):
+        self.futuro = futuro
+        self.control = control
+
+    @property
+    def terminada(self):
+        return self.futuro.done()
+
+    @property
+    def progreso(self):
+        return self.control.progreso
+
+    def cancelar(self):
+        self.control.cancelar()
+
+    def resultado(self):
+        """Devuelve el resultado o relanza la excepción (incluida CalculoCancelado)"""
+        return self.futuro.result()
+
+
+class Ejecutor:
+    """Pool de hilos para los cálculos; cada tarea recibe su propio Control"""
+
+    def __init__(self, max_hilos=1):
+        self._pool = ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix='calculo')
+
+    def enviar(self, funcion, *args, **kwargs):
+        control = Control()
+        futuro = self._pool.submit(funcion, *args, control=control, **kwargs)
+        return Tarea(futuro, control)
+
+    def cerrar(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
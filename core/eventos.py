@@ -0,0 +1,102 @@
+"""Eventos de EDO: instantes en que g(t, y(t)) = 0
+
+Tras cada paso aceptado se evalúa cada g en el nuevo estado; si cambió de
+signo (en la dirección pedida) la raíz se localiza dentro del paso con el
+método de Illinois sobre un interpolante de la solución: la salida densa en
+Dormand-Prince o un Hermite cúbico con f en los extremos en los métodos de
+paso fijo (sólo se construye si hay un cambio de signo). Un evento terminal
+detiene la integración en el instante exacto del evento.
+"""
+import numpy as np
+
+from core.expresiones import como_expresion
+from core.raices import illinois
+
+
+class Evento:
+    """Función de evento g(t, y) con su dirección y si detiene la integración
+
+    direccion = +1 sólo cuenta cruces de g de negativo a positivo, -1 de
+    positivo a negativo y 0 ambos.
+    """
+
+    def __init__(self, g, terminal=False, direccion=0, nombre=None):
+        if direccion not in (-1, 0, 1):
+            raise ValueError("La dirección del evento debe ser -1, 0 o +1")
+        expresion = como_expresion(g, ('t', 'y'))
+        self.funcion = expresion.funcion
+        self.terminal = bool(terminal)
+        self.direccion = direccion
+        self.nombre = nombre or expresion.fuente
+
+    def __call__(self, t, y):
+        return float(self.funcion(t, y))
+
+    def cruza(self, g_a, g_b):
+        """¿Hay un cruce nuevo en (t_a, t_b]? Un cero en t_a ya se reportó en el paso anterior"""
+        if g_a == 0 or g_a * g_b > 0:
+            return False
+        return self.direccion == 0 or self.direccion * (g_b - g_a) > 0
+
+    def __repr__(self):
+        return f"Evento({self.nombre!r}, terminal={self.terminal}, direccion={self.direccion})"
+
+
+def interpolante_hermite(t_a, y_a, f_a, t_b, y_b, f_b):
+    """Hermite cúbico con valores y derivadas en los extremos del paso"""
+    h = t_b - t_a
+
+    def y(t):
+        s = (t - t_a) / h
+        s1 = 1.0 - s
+        return ((1.0 + 2.0 * s) * s1 * s1 * y_a + s * s1 * s1 * h * f_a
+                + s * s * (3.0 - 2.0 * s) * y_b - s * s * s1 * h * f_b)
+    return y
+
+
+class DetectorEventos:
+    """Sigue el signo de los eventos a lo largo de la integración
+
+    revisar(t_a, y_a, t_b, y_b, interpolante) se llama tras cada paso;
+    interpolante() construye y(t) en el paso y sólo se invoca si algún
+    evento cambió de signo. Devuelve (t, y) del primer evento terminal, o
+    None para seguir integrando. Con escalar=True los estados son vectores
+    de una componente y los eventos reciben y como número.
+    """
+
+    def __init__(self, eventos, t0, y0, escalar=False):
+        self.eventos = [e if isinstance(e, Evento) else Evento(e) for e in eventos]
+        self.escalar = escalar
+        self.encontrados = []        # (índice del evento, t, y) en orden cronológico
+        self.terminal = None         # índice del evento que detuvo la integración
+        self.valores = self._evaluar(t0, y0)
+
+    def _estado(self, y):
+        return float(y[0]) if self.escalar else y
+
+    def _evaluar(self, t, y):
+        y = self._estado(y)
+        return [evento(t, y) for evento in self.eventos]
+
+    def revisar(self, t_a, y_a, t_b, y_b, interpolante):
+        nuevos = self._evaluar(t_b, y_b)
+        cruces = [k for k, evento in enumerate(self.eventos)
+                  if evento.cruza(self.valores[k], nuevos[k])]
+        anteriores, self.valores = self.valores, nuevos
+        if not cruces:
+            return None
+
+        y_de = interpolante()
+        hallados = []
+        for k in cruces:
+            g = lambda t, evento=self.eventos[k]: evento(t, self._estado(y_de(t)))
+            tol = 4 * np.finfo(float).eps * max(abs(t_a), abs(t_b), 1.0)
+            raiz = illinois(g, t_a, t_b, tol=tol, max_iter=100, fa=anteriores[k], fb=nuevos[k]).raiz
+            hallados.append((raiz, k))
+        for t_e, k in sorted(hallados, key=lambda par: abs(par[0] - t_a)):
+            y_e = y_de(t_e)
+            self.encontrados.append((k, float(t_e), self._estado(y_e)))
+            if self.eventos[k].terminal:
+                self.terminal = k
+                return t_e, y_e
+        return None
@@ -0,0 +1,243 @@
+"""Compilación de las expresiones que escribe el usuario (f(x), f(t, y), ...)
+
+La cadena se analiza y valida una sola vez y se convierte en una función de
+Python normal, de modo que evaluarla no vuelve a pasar por el parser. Si la
+expresión es segura con arreglos (p. ej. np.sin(x)*x**2) se puede evaluar de
+una sola vez sobre un np.ndarray de nodos; si no, se recorre escalar a escalar.
+"""
+import ast
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Nombres disponibles dentro de las expresiones además de las variables
+ESPACIO_NOMBRES = {
+    'np': np,
+    'math': math,
+    'abs': abs,
+    'min': min,
+    'max': max,
+    'pow': pow,
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'asin': np.arcsin,
+    'acos': np.arccos,
+    'atan': np.arctan,
+    'sinh': np.sinh,
+    'cosh': np.cosh,
+    'tanh': np.tanh,
+    'exp': np.exp,
+    'log': np.log,
+    'log10': np.log10,
+    'sqrt': np.sqrt,
+    'pi': np.pi,
+    'e': np.e,
+}
+
+# Funciones de NumPy que no actúan elemento a elemento (reducciones, etc.)
+_NO_ELEMENTALES = {
+    'sum', 'prod', 'mean', 'median', 'std', 'var', 'max', 'min', 'amax', 'amin',
+    'argmax', 'argmin', 'cumsum', 'cumprod', 'diff', 'sort', 'dot', 'linalg',
+    'trapz', 'trapezoid', 'gradient', 'convolve', 'roll', 'flip',
+}
+
+
+def _validar(arbol, variables):
+    """Rechaza nombres desconocidos y accesos a atributos privados"""
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Name):
+            if nodo.id not in variables and nodo.id not in ESPACIO_NOMBRES:
+                raise ValueError(f"Nombre no permitido en la expresión: '{nodo.id}'")
+        elif isinstance(nodo, ast.Attribute):
+            if nodo.attr.startswith('_'):
+                raise ValueError(f"Atributo no permitido en la expresión: '{nodo.attr}'")
+
+
+def _es_vectorizable(arbol):
+    """Descarta construcciones que no funcionan (o cambian de sentido) con arreglos"""
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, (ast.IfExp, ast.BoolOp, ast.Subscript)):
+            return False
+        if isinstance(nodo, ast.Name) and nodo.id in ('math', 'min', 'max'):
+            return False
+        if isinstance(nodo, ast.Attribute) and nodo.attr in _NO_ELEMENTALES:
+            return False
+    return True
+
+
+class Expresion:
+    """Expresión del usuario compilada a una función de sus variables"""
+
+    _compilada = True   # False si envuelve un callable (desde_funcion)
+
+    def __init__(self, fuente, variables=('x',)):
+        self.fuente = fuente.strip()
+        self.variables = tuple(variables)
+
+        if not self.fuente:
+            raise ValueError("La expresión está vacía")
+        try:
+            arbol = ast.parse(self.fuente, mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Expresión inválida '{self.fuente}': {e.msg}") from None
+        _validar(arbol, self.variables)
+        # None = aún no se sabe; se decide en la primera evaluación con arreglos
+        self.vectorial = None if _es_vectorizable(arbol) else False
+        self._usa_variables = any(
+            isinstance(nodo, ast.Name) and nodo.id in self.variables
+            for nodo in ast.walk(arbol))
+
+        # Se genera 'def _expresion(x): return (...)' y se compila una vez
+        codigo = compile(
+            f"def _expresion({', '.join(self.variables)}):\n"
+            f"    return (\n{self.fuente}\n)\n",
+            f"<expresión: {self.fuente}>", 'exec')
+        espacio = dict(ESPACIO_NOMBRES)
+        exec(codigo, espacio)
+        # Los bucles críticos llaman directamente a self.funcion
+        self.funcion = espacio['_expresion']
+
+    @classmethod
+    def desde_funcion(cls, funcion, variables=('x',)):
+        """Envuelve un callable de Python para usarlo donde se espera una Expresion"""
+        expresion = cls.__new__(cls)
+        expresion.fuente = getattr(funcion, '__name__', repr(funcion))
+        expresion.variables = tuple(variables)
+        expresion.vectorial = None
+        expresion._usa_variables = True
+        expresion.funcion = funcion
+        expresion._compilada = False
+        return expresion
+
+    def __call__(self, *args):
+        return self.funcion(*args)
+
+    def evaluar_arreglo(self, *args):
+        """Evalúa sobre arreglos (elemento a elemento) y devuelve un np.ndarray de float"""
+        arreglos = np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in args])
+        forma = arreglos[0].shape
+
+        if self.vectorial is not False:
+            try:
+                resultado = np.asarray(self.funcion(*arreglos), dtype=float)
+            except (TypeError, ValueError):
+                resultado = None
+            if resultado is None:
+                self.vectorial = False
+            elif self.vectorial is None:
+                self.vectorial = self._coincide_con_escalar(arreglos, resultado)
+            if self.vectorial:
+                if resultado.shape != forma:
+                    resultado = np.broadcast_to(resultado, forma).copy()
+                return resultado
+            self.vectorial = False
+
+        # Respaldo: bucle escalar, correcto para cualquier expresión
+        planos = [a.ravel() for a in arreglos]
+        valores = np.fromiter((self.funcion(*v) for v in zip(*planos)),
+                              dtype=float, count=planos[0].size)
+        return valores.reshape(forma)
+
+    def _coincide_con_escalar(self, arreglos, resultado):
+        """Comprueba el resultado vectorial contra la evaluación escalar en los extremos"""
+        forma = arreglos[0].shape
+        if resultado.shape != forma:
+            # Un escalar sólo es válido si la expresión es constante
+            if resultado.ndim != 0 or self._usa_variables:
+                return False
+            resultado = np.broadcast_to(resultado, forma)
+        if resultado.size == 0:
+            return True
+        planos = [a.ravel() for a in arreglos]
+        vector = resultado.ravel()
+        for k in {0, vector.size - 1}:
+            try:
+                escalar = float(self.funcion(*[float(p[k]) for p in planos]))
+            except (ArithmeticError, TypeError, ValueError):
+                continue
+            if not np.allclose(escalar, vector[k], rtol=1e-9, atol=1e-12, equal_nan=True):
+                return False
+        return True
+
+    def __reduce__(self):
+        # Para enviarla a otro proceso: se manda la fuente y se compila allá
+        if self._compilada:
+            return compilar, (self.fuente, self.variables)
+        return Expresion.desde_funcion, (self.funcion, self.variables)
+
+    def __repr__(self):
+        return f"Expresion({self.fuente!r}, variables={self.variables!r})"
+
+
+class ExpresionVectorial:
+    """Varias expresiones f_0, ..., f_{n-1} compiladas en una sola función
+
+    Se genera un único objeto de código
+
+        def _sistema(t, y, out):
+            out[0] = (f_0)
+            ...
+            return out
+
+    que escribe el vector completo en un búfer preasignado: una llamada por
+    paso en lugar de n. Si y es una matriz (n, m), cada out[i] es una fila.
+    """
+
+    def __init__(self, fuentes, variables=('t', 'y')):
+        self.fuentes = tuple(f.strip() for f in fuentes)
+        self.variables = tuple(variables)
+        if not self.fuentes:
+            raise ValueError("El sistema no tiene ecuaciones")
+        for i, fuente in enumerate(self.fuentes):
+            if not fuente:
+                raise ValueError(f"La expresión {i} está vacía")
+            try:
+                arbol = ast.parse(fuente, mode='eval')
+            except SyntaxError as e:
+                raise ValueError(f"Expresión inválida '{fuente}': {e.msg}") from None
+            _validar(arbol, self.variables)
+
+        lineas = "".join(f"    out[{i}] = (\n{fuente}\n)\n" for i, fuente in enumerate(self.fuentes))
+        codigo = compile(
+            f"def _sistema({', '.join(self.variables)}, out):\n{lineas}    return out\n",
+            f"<sistema de {len(self.fuentes)} expresiones>", 'exec')
+        espacio = dict(ESPACIO_NOMBRES)
+        exec(codigo, espacio)
+        self.funcion = espacio['_sistema']
+
+    def __len__(self):
+        return len(self.fuentes)
+
+    def __call__(self, *args):
+        return self.funcion(*args)
+
+    def __reduce__(self):
+        return compilar_vectorial, (self.fuentes, self.variables)
+
+    def __repr__(self):
+        return f"ExpresionVectorial({list(self.fuentes)!r}, variables={self.variables!r})"
+
+
+@lru_cache(maxsize=64)
+def compilar_vectorial(fuentes, variables=('t', 'y')):
+    """Devuelve la ExpresionVectorial compilada (cacheada por fuentes y variables)"""
+    return ExpresionVectorial(tuple(fuentes), tuple(variables))
+
+
+@lru_cache(maxsize=256)
+def compilar(fuente, variables=('x',)):
+    """Devuelve la Expresion compilada (cacheada por fuente y variables)"""
+    return Expresion(fuente, tuple(variables))
+
+
+def como_expresion(f, variables=('x',)):
+    """Acepta una cadena, una Expresion o un callable y devuelve una Expresion"""
+    if isinstance(f, Expresion):
+        return f
+    if isinstance(f, str):
+        return compilar(f, tuple(variables))
+    if callable(f):
+        return Expresion.desde_funcion(f, variables)
+    raise TypeError(f"Se esperaba una expresión o una función, no {type(f).__name__}")
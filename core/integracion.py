@@ -0,0 +1,326 @@
+"""Integración numérica basada en la regla de Simpson 3/8
+
+simpson38 es la regla compuesta con n fijo. simpson38_adaptativo usa la
+misma regla en cada panel y sólo subdivide donde la estimación local del
+error supera la tolerancia, reutilizando los valores de f ya calculados.
+romberg_simpson38 duplica la malla nivel a nivel y extrapola (Richardson).
+
+Para integrandos suaves, gauss_legendre y gauss_kronrod (G7K15 adaptativa)
+alcanzan la misma precisión con muchas menos evaluaciones; sus nodos y pesos
+se calculan una vez por orden y se guardan en caché.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from core.expresiones import como_expresion
+
+
+@dataclass
+class ResultadoIntegral:
+    """Resultado de una integración numérica"""
+    valor: float
+    n: int          # subintervalos usados
+    h: float        # paso (el más pequeño en los métodos adaptativos)
+    error: float = None             # estimación del error absoluto
+    evaluaciones: int = None        # evaluaciones de f
+    metodo: str = "Simpson 3/8 compuesta"
+    convergio: bool = True
+    mensaje: str = ""
+    tabla: list = field(default_factory=list)   # Romberg: tabla[k][j], n_k = 3·2^k
+
+
+def _simpson38_paneles(f4, ancho):
+    """Regla 3/8 simple en cada fila: f4 (m, 4) con los valores en los nodos del panel"""
+    return (ancho / 8) * (f4[:, 0] + 3 * f4[:, 1] + 3 * f4[:, 2] + f4[:, 3])
+
+
+def _suma_simpson38(f_x, h):
+    """Simpson 3/8 compuesta a partir de los valores en los n + 1 nodos"""
+    # Pesos 1, 3, 3, 2, 3, 3, 2, ..., 3, 3, 1
+    suma = f_x[0] + f_x[-1] + 3 * np.sum(f_x[1:-1]) - np.sum(f_x[3:-1:3])
+    return float((3 * h / 8) * suma)
+
+
+def simpson38(f, a, b, n, control=None):
+    """Simpson 3/8 compuesta; n se redondea hacia arriba al múltiplo de 3"""
+    f = como_expresion(f, ('x',))
+
+    if n % 3 != 0:
+        n = ((n + 2) // 3) * 3
+
+    h = (b - a) / n
+
+    # Evaluar f en todos los nodos de una vez (bucle escalar si no es vectorizable)
+    f_x = f.evaluar_arreglo(a + h * np.arange(n + 1))
+
+    return ResultadoIntegral(_suma_simpson38(f_x, h), n, h, evaluaciones=n + 1)
+
+
+def simpson38_adaptativo(f, a, b, tol=1e-8, max_nivel=30, max_evaluaciones=1_000_000, control=None):
+    """Simpson 3/8 adaptativa
+
+    Cada panel [p, q] se compara con sus tres tercios: con S1 la regla 3/8
+    en el panel y S3 la suma en los tercios, el error de S3 es del orden de
+    |S3 - S1| / 80 (la regla es O(h⁴) y el paso se divide entre 3). Los
+    cuatro nodos de S1 son nodos de S3, así que refinar un panel cuesta seis
+    evaluaciones nuevas, y cada tercio hereda sus cuatro valores.
+
+    Se procesan todos los paneles de un nivel a la vez (una sola llamada
+    vectorizada a f) y un panel se acepta si su error no pasa de
+    tol · ancho / (b - a).
+    """
+    f = como_expresion(f, ('x',))
+    longitud = abs(b - a)
+    if longitud == 0:
+        return ResultadoIntegral(0.0, 0, 0.0, error=0.0, evaluaciones=0, metodo="Simpson 3/8 adaptativa")
+
+    # Paneles activos: extremo izquierdo, ancho común del nivel, f en sus 4 nodos y S1
+    izquierdos = np.array([a], dtype=float)
+    ancho = b - a
+    f4 = f.evaluar_arreglo(a + (ancho / 3) * np.arange(4)).reshape(1, 4)
+    S1 = _simpson38_paneles(f4, ancho)
+    evaluaciones = 4
+
+    valor, error, subintervalos = 0.0, 0.0, 0
+    convergio, mensaje = True, ""
+    for nivel in range(max_nivel):
+        if control is not None:
+            control.reportar(nivel / max_nivel)
+
+        # Seis nodos nuevos por panel: posiciones 1, 2, 4, 5, 7, 8 de la malla de 9 subintervalos
+        h = ancho / 9
+        nuevos = izquierdos[:, None] + h * np.array([1, 2, 4, 5, 7, 8])
+        f_nuevos = f.evaluar_arreglo(nuevos.ravel()).reshape(-1, 6)
+        evaluaciones += f_nuevos.size
+
+        f10 = np.empty((len(izquierdos), 10))
+        f10[:, [0, 3, 6, 9]] = f4
+        f10[:, [1, 2, 4, 5, 7, 8]] = f_nuevos
+        tercios = np.stack([_simpson38_paneles(f10[:, 3 * i:3 * i + 4], ancho / 3) for i in range(3)], axis=1)
+        S3 = tercios.sum(axis=1)
+        errores = np.abs(S3 - S1) / 80
+
+        aceptados = errores <= tol * abs(ancho) / longitud
+        ultimo = nivel == max_nivel - 1 or evaluaciones + 6 * 3 * np.count_nonzero(~aceptados) > max_evaluaciones
+        if ultimo and not np.all(aceptados):
+            convergio = False
+            mensaje = (f"Se alcanzó el nivel máximo de subdivisión ({max_nivel})" if nivel == max_nivel - 1
+                       else f"Se alcanzó el máximo de evaluaciones ({max_evaluaciones})")
+            aceptados[:] = True
+
+        valor += float(np.sum(S3[aceptados]))
+        error += float(np.sum(errores[aceptados]))
+        subintervalos += 9 * int(np.count_nonzero(aceptados))
+        if np.all(aceptados):
+            break
+
+        # Los paneles rechazados se dividen en sus tres tercios, que ya tienen f y S1
+        rechazados = ~aceptados
+        ancho /= 3
+        izquierdos = (izquierdos[rechazados, None] + ancho * np.arange(3)).ravel()
+        f4 = np.stack([f10[rechazados, 3 * i:3 * i + 4] for i in range(3)], axis=1).reshape(-1, 4)
+        S1 = tercios[rechazados].ravel()
+
+    return ResultadoIntegral(valor, subintervalos, abs(h), error=error, evaluaciones=evaluaciones,
+                             metodo="Simpson 3/8 adaptativa", convergio=convergio, mensaje=mensaje)
+
+
+def romberg_simpson38(f, a, b, tol=1e-10, max_niveles=20, control=None):
+    """Extrapolación de Richardson sobre Simpson 3/8 con n_k = 3·2^k
+
+    La regla compuesta es S(h) = (9 T(h) - T(3h)) / 8 con T el trapecio, así
+    que su error se desarrolla en potencias pares h⁴, h⁶, h⁸, ... Al dividir
+    h entre 2, la columna j elimina el término h^(2j+2):
+
+        R[k][j] = R[k][j-1] + (R[k][j-1] - R[k-1][j-1]) / (4^(j+1) - 1)
+
+    Los nodos de un nivel son nodos del siguiente: cada refinamiento sólo
+    evalúa f en los n_k puntos medios nuevos. Para cuando dos diagonales
+    consecutivas difieren menos que tol.
+    """
+    f = como_expresion(f, ('x',))
+    n = 3
+    h = (b - a) / n
+    f_x = f.evaluar_arreglo(a + h * np.arange(n + 1))
+    evaluaciones = n + 1
+    tabla = [[_suma_simpson38(f_x, h)]]
+    error = float('inf')
+
+    for k in range(1, max_niveles):
+        if control is not None:
+            control.reportar(k / max_niveles)
+
+        # Puntos medios nuevos e intercalado con los valores guardados
+        medios = f.evaluar_arreglo(a + h * (np.arange(n) + 0.5))
+        evaluaciones += n
+        refinado = np.empty(2 * n + 1)
+        refinado[0::2] = f_x
+        refinado[1::2] = medios
+        f_x, n, h = refinado, 2 * n, h / 2
+
+        fila = [_suma_simpson38(f_x, h)]
+        for j in range(1, k + 1):
+            fila.append(fila[j - 1] + (fila[j - 1] - tabla[k - 1][j - 1]) / (4 ** (j + 1) - 1))
+        tabla.append(fila)
+
+        error = abs(fila[-1] - tabla[k - 1][-1])
+        if error < tol:
+            return ResultadoIntegral(fila[-1], n, h, error=error, evaluaciones=evaluaciones,
+                                     metodo="Romberg (Simpson 3/8)", tabla=tabla)
+
+    return ResultadoIntegral(tabla[-1][-1], n, h, error=error, evaluaciones=evaluaciones,
+                             metodo="Romberg (Simpson 3/8)", convergio=False,
+                             mensaje=f"No alcanzó la tolerancia en {max_niveles} niveles", tabla=tabla)
+
+
+@lru_cache(maxsize=64)
+def nodos_gauss_legendre(n):
+    """Nodos y pesos de Gauss-Legendre de n puntos en [-1, 1] (de sólo lectura)"""
+    if n < 1:
+        raise ValueError("El orden de Gauss-Legendre debe ser al menos 1")
+    x, w = np.polynomial.legendre.leggauss(n)
+    x.flags.writeable = False
+    w.flags.writeable = False
+    return x, w
+
+
+# Kronrod de 15 puntos y Gauss de 7 (QUADPACK, qk15): mitad positiva de los nodos,
+# el último es el centro; los nodos de Gauss son los de índice impar
+_XGK15 = (0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+          0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+          0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+          0.207784955007898467600689403773245, 0.0)
+_WGK15 = (0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+          0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+          0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+          0.204432940075298892414161999234649, 0.209482141084727828012999174891714)
+_WG7 = (0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+        0.381830050505118944950369775488975, 0.417959183673469387755102040816327)
+
+
+@lru_cache(maxsize=8)
+def nodos_gauss_kronrod(n=7):
+    """(x, w_kronrod, w_gauss) del par G{n}K{2n+1} en [-1, 1]
+
+    w_gauss vale cero en los nodos que sólo pertenecen a Kronrod, así que
+    ambas reglas se calculan con los mismos 2n + 1 valores de f.
+    """
+    if n != 7:
+        raise ValueError("Sólo está disponible el par Gauss-Kronrod G7K15")
+    mitad = np.array(_XGK15)
+    x = np.concatenate([-mitad, mitad[-2::-1]])
+    wk = np.concatenate([_WGK15, _WGK15[-2::-1]])
+    wg_mitad = np.zeros(8)
+    wg_mitad[1::2] = _WG7
+    wg = np.concatenate([wg_mitad, wg_mitad[-2::-1]])
+    for arreglo in (x, wk, wg):
+        arreglo.flags.writeable = False
+    return x, wk, wg
+
+
+def gauss_legendre(f, a, b, n=None, tol=1e-10, max_n=512, control=None):
+    """Cuadratura de Gauss-Legendre
+
+    Con n dado se aplica la regla de n puntos. Si n es None se duplica el
+    orden desde 4 hasta que dos resultados consecutivos difieren menos que
+    tol; el error reportado es esa diferencia.
+    """
+    f = como_expresion(f, ('x',))
+    centro, radio = (a + b) / 2, (b - a) / 2
+
+    def regla(orden):
+        x, w = nodos_gauss_legendre(orden)
+        return float(radio * (w @ f.evaluar_arreglo(centro + radio * x)))
+
+    if n is not None:
+        return ResultadoIntegral(regla(n), n, abs(b - a) / n, evaluaciones=n,
+                                 metodo=f"Gauss-Legendre ({n} puntos)")
+
+    orden = 4
+    anterior = regla(orden)
+    evaluaciones = orden
+    error = float('inf')
+    while 2 * orden <= max_n:
+        if control is not None:
+            control.reportar(np.log2(orden) / np.log2(max_n))
+        orden *= 2
+        valor = regla(orden)
+        evaluaciones += orden
+        error = abs(valor - anterior)
+        anterior = valor
+        if error < tol:
+            return ResultadoIntegral(valor, orden, abs(b - a) / orden, error=error,
+                                     evaluaciones=evaluaciones, metodo=f"Gauss-Legendre ({orden} puntos)")
+    return ResultadoIntegral(anterior, orden, abs(b - a) / orden, error=error, evaluaciones=evaluaciones,
+                             metodo=f"Gauss-Legendre ({orden} puntos)", convergio=False,
+                             mensaje=f"No alcanzó la tolerancia con {max_n} puntos")
+
+
+def gauss_kronrod(f, a, b, tol=1e-10, max_subintervalos=10_000, control=None):
+    """Gauss-Kronrod G7K15 adaptativa
+
+    En cada subintervalo la regla de Kronrod de 15 puntos da el valor y
+    |K15 - G7| la estimación del error (G7 usa 7 de los mismos 15 nodos).
+    Como en simpson38_adaptativo, todos los subintervalos de un nivel se
+    evalúan en una sola llamada vectorizada y se biseca cada uno cuyo error
+    supere tol · ancho / (b - a).
+    """
+    f = como_expresion(f, ('x',))
+    x, wk, wg = nodos_gauss_kronrod(7)
+    longitud = abs(b - a)
+    if longitud == 0:
+        return ResultadoIntegral(0.0, 0, 0.0, error=0.0, evaluaciones=0, metodo="Gauss-Kronrod G7K15")
+
+    izquierdos = np.array([a], dtype=float)
+    ancho = b - a
+    valor, error, evaluaciones, subintervalos = 0.0, 0.0, 0, 0
+    convergio, mensaje = True, ""
+    nivel = 0
+    while izquierdos.size:
+        if control is not None:
+            control.reportar(min(subintervalos / max_subintervalos, 1.0))
+        radio = ancho / 2
+        f_x = f.evaluar_arreglo((izquierdos[:, None] + radio * (1 + x)).ravel()).reshape(-1, x.size)
+        evaluaciones += f_x.size
+        K = radio * (f_x @ wk)
+        G = radio * (f_x @ wg)
+        errores = np.abs(K - G)
+
+        aceptados = errores <= tol * abs(ancho) / longitud
+        restantes = 2 * np.count_nonzero(~aceptados)
+        if not np.all(aceptados) and subintervalos + aceptados.size + restantes > max_subintervalos:
+            convergio = False
+            mensaje = f"Se alcanzó el máximo de subintervalos ({max_subintervalos})"
+            aceptados[:] = True
+
+        valor += float(np.sum(K[aceptados]))
+        error += float(np.sum(errores[aceptados]))
+        subintervalos += int(np.count_nonzero(aceptados))
+
+        ancho /= 2
+        izquierdos = (izquierdos[~aceptados, None] + ancho * np.arange(2)).ravel()
+        nivel += 1
+
+    return ResultadoIntegral(valor, subintervalos, abs(ancho) * 2, error=error, evaluaciones=evaluaciones,
+                             metodo="Gauss-Kronrod G7K15 adaptativa", convergio=convergio, mensaje=mensaje)
+
+
+# Para elegir el integrador por nombre desde la interfaz
+METODOS_INTEGRACION = {
+    'simpson38': simpson38,
+    'simpson38_adaptativo': simpson38_adaptativo,
+    'romberg_simpson38': romberg_simpson38,
+    'gauss_legendre': gauss_legendre,
+    'gauss_kronrod': gauss_kronrod,
+}
+
+
+def integrar(f, a, b, metodo='simpson38', **opciones):
+    """Integra f en [a, b] con el método indicado por nombre"""
+    try:
+        funcion = METODOS_INTEGRACION[metodo]
+    except KeyError:
+        raise ValueError(f"Método de integración desconocido: {metodo}") from None
+    return funcion(f, a, b, **opciones)
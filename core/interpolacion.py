@@ -0,0 +1,229 @@
+"""Interpolación de Lagrange en 1, 2 o 3 variables (producto tensorial)
+
+En 1D se usa la forma baricéntrica: los pesos w_j se calculan una sola vez y
+cada evaluación cuesta O(n),
+
+    P(x) = Σ w_j y_j / (x - x_j)  /  Σ w_j / (x - x_j)
+
+En varias variables la base es separable, L_ijk(x, y, z) = L_i(x) L_j(y) L_k(z):
+se evalúa un vector de base por eje y se contrae la malla de valores eje por
+eje, en lugar de recorrer todos los índices.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class ResultadoInterpolacion:
+    """Valor interpolado y bases de Lagrange evaluadas en cada eje"""
+    valor: float
+    bases: list          # bases[k][i] = L_i(punto[k]) en el eje k
+
+
+def _nodos_distintos(nodos):
+    nodos = np.asarray(nodos, dtype=float).ravel()
+    if nodos.size == 0:
+        raise ValueError("Se necesita al menos un nodo")
+    if np.unique(nodos).size != nodos.size:
+        raise ValueError("Los nodos de interpolación deben ser distintos")
+    return nodos
+
+
+def _es_equiespaciada(nodos):
+    if nodos.size < 3:
+        return True
+    h = np.diff(nodos)
+    return bool(np.all(np.abs(h - h[0]) <= 1e-12 * np.abs(h[0]) * nodos.size))
+
+
+def pesos_baricentricos(nodos, bloque=1024):
+    """w_j = 1 / Π_{k≠j} (x_j - x_k), reescalados para que max |w_j| = 1
+
+    Con nodos equiespaciados se usa la fórmula cerrada w_j = (-1)^j C(n-1, j)
+    (O(n), en logaritmos para no desbordar); en otro caso el producto se hace
+    por bloques de filas, O(n²) una sola vez. El factor común no cambia la
+    fórmula baricéntrica.
+    """
+    nodos = _nodos_distintos(nodos)
+    n = nodos.size
+    if _es_equiespaciada(nodos):
+        j = np.arange(n)
+        log_binomial = np.concatenate(([0.0], np.cumsum(np.log((n - 1 - j[:-1]) / (j[:-1] + 1)))))
+        w = np.exp(log_binomial - log_binomial.max())
+        w[1::2] *= -1
+        return w
+
+    # Escalar las diferencias por (b - a)/4 evita desbordes del producto
+    escala = (nodos.max() - nodos.min()) / 4.0 or 1.0
+    w = np.empty(n)
+    for inicio in range(0, n, bloque):
+        fin = min(inicio + bloque, n)
+        diferencias = (nodos[inicio:fin, None] - nodos[None, :]) / escala
+        diferencias[np.arange(fin - inicio), np.arange(inicio, fin)] = 1.0
+        w[inicio:fin] = 1.0 / np.prod(diferencias, axis=1)
+    return w / np.max(np.abs(w))
+
+
+def matriz_bases(nodos, pesos, x):
+    """Matriz B[p, j] = L_j(x[p]) a partir de los pesos baricéntricos"""
+    x = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+    diferencias = x[:, None] - nodos[None, :]
+    fila, columna = np.nonzero(diferencias == 0)
+    diferencias[fila, columna] = 1.0
+    t = pesos / diferencias
+    t /= t.sum(axis=1, keepdims=True)
+    # En un nodo la base es el vector unitario
+    t[fila] = 0.0
+    t[fila, columna] = 1.0
+    return t
+
+
+class InterpoladorBaricentrico:
+    """Polinomio de Lagrange por los puntos (nodos[j], valores[j])
+
+    Los pesos se calculan al construirlo y se reutilizan en cada evaluación;
+    agregar_nodo los actualiza en O(n) sin recalcularlos todos.
+    """
+
+    def __init__(self, nodos, valores):
+        self.nodos = _nodos_distintos(nodos)
+        self.valores = np.asarray(valores, dtype=float).ravel()
+        if self.valores.shape != self.nodos.shape:
+            raise ValueError(f"Se esperaban {self.nodos.size} valores")
+        self.pesos = pesos_baricentricos(self.nodos)
+
+    def __len__(self):
+        return self.nodos.size
+
+    def agregar_nodo(self, x, y):
+        """Añade (x, y) en O(n): w_j /= (x_j - x) y el peso nuevo es 1 / Π (x - x_j)
+
+        Los pesos guardados están reescalados por un factor c desconocido; c se
+        recupera comparando el peso más grande con su valor exacto (también
+        O(n)) para que el nuevo quede en la misma escala. Todo en logaritmos.
+        """
+        x = float(x)
+        diferencias = self.nodos - x
+        if np.any(diferencias == 0):
+            raise ValueError(f"El nodo {x} ya está en la interpolación")
+
+        k = int(np.argmax(np.abs(self.pesos)))
+        d_k = np.delete(self.nodos[k] - self.nodos, k)
+        log_c = np.log(abs(self.pesos[k])) + np.sum(np.log(np.abs(d_k)))
+        signo_c = np.sign(self.pesos[k]) * np.prod(np.sign(d_k))
+        log_nuevo = log_c - np.sum(np.log(np.abs(diferencias)))
+        signo_nuevo = signo_c * np.prod(np.sign(-diferencias))
+
+        pesos = self.pesos / diferencias
+        log_pesos = np.log(np.max(np.abs(pesos)))
+        log_maximo = max(log_pesos, log_nuevo)
+        pesos *= np.exp(log_pesos - log_maximo) / np.max(np.abs(pesos))
+        self.pesos = np.append(pesos, signo_nuevo * np.exp(log_nuevo - log_maximo))
+        self.nodos = np.append(self.nodos, x)
+        self.valores = np.append(self.valores, float(y))
+
+    def base(self, x):
+        """Vector [L_0(x), ..., L_{n-1}(x)] en un punto"""
+        return matriz_bases(self.nodos, self.pesos, float(x))[0]
+
+    def __call__(self, x, bloque=4096):
+        """Evalúa P en x (escalar o arreglo); se procesa por bloques de puntos"""
+        x = np.asarray(x, dtype=float)
+        puntos = x.ravel()
+        resultado = np.empty(puntos.size)
+        for inicio in range(0, puntos.size, bloque):
+            xs = puntos[inicio:inicio + bloque]
+            diferencias = xs[:, None] - self.nodos[None, :]
+            coincide = diferencias == 0
+            fila, columna = np.nonzero(coincide)
+            diferencias[fila, columna] = 1.0
+            t = self.pesos / diferencias
+            parcial = (t @ self.valores) / t.sum(axis=1)
+            # En un nodo el cociente es 0/0: se toma el dato directamente
+            parcial[fila] = self.valores[columna]
+            resultado[inicio:inicio + bloque] = parcial
+        if x.ndim == 0:
+            return float(resultado[0])
+        return resultado.reshape(x.shape)
+
+
+def base_lagrange(nodos, x):
+    """Vector [L_0(x), ..., L_{n-1}(x)] para los nodos dados"""
+    return InterpoladorBaricentrico(nodos, np.zeros(len(nodos))).base(x)
+
+
+class InterpoladorTensorial:
+    """Interpolación de Lagrange en la malla nodos[0] × nodos[1] × ...
+
+    valores[i0, i1, ...] es el dato en (nodos[0][i0], nodos[1][i1], ...).
+    Los pesos baricéntricos de cada eje se calculan una vez; cada consulta
+    evalúa una matriz de base por eje y contrae la malla con tensordot/einsum.
+    """
+
+    def __init__(self, nodos, valores):
+        self.nodos = [_nodos_distintos(eje) for eje in nodos]
+        self.pesos = [pesos_baricentricos(eje) for eje in self.nodos]
+        self.valores = np.asarray(valores, dtype=float)
+        forma = tuple(eje.size for eje in self.nodos)
+        if self.valores.shape != forma:
+            raise ValueError(f"Los valores deben tener forma {forma}")
+
+    @property
+    def dimension(self):
+        return len(self.nodos)
+
+    def _puntos(self, puntos):
+        puntos = np.asarray(puntos, dtype=float)
+        if puntos.ndim == 0:
+            puntos = puntos.reshape(1)
+        if puntos.shape[-1] != self.dimension:
+            raise ValueError(f"Cada punto debe tener {self.dimension} coordenadas")
+        return puntos.reshape(-1, self.dimension)
+
+    def bases(self, puntos):
+        """Lista con la matriz de base (m, n_k) de cada eje para m puntos"""
+        puntos = self._puntos(puntos)
+        return [matriz_bases(eje, w, puntos[:, k])
+                for k, (eje, w) in enumerate(zip(self.nodos, self.pesos))]
+
+    def _contraer(self, bases):
+        # Primer eje: (m, n0) · (n0, n1, ...) -> (m, n1, ...); los demás con einsum
+        # conservando el índice del punto
+        resultado = np.tensordot(bases[0], self.valores, axes=(1, 0))
+        for B in bases[1:]:
+            resultado = np.einsum('pj,pj...->p...', B, resultado)
+        return resultado
+
+    def __call__(self, puntos, bloque=None):
+        """Valor en un punto (d coordenadas) o en un lote de forma (..., d)"""
+        forma = np.shape(puntos)[:-1]
+        puntos = self._puntos(puntos)
+        if bloque is None:
+            # Limita el intermedio (bloque, n1, n2, ...) a ~10^6 elementos
+            bloque = max(1, 1_000_000 // max(1, self.valores[0].size))
+        resultado = np.empty(len(puntos))
+        for inicio in range(0, len(puntos), bloque):
+            resultado[inicio:inicio + bloque] = self._contraer(self.bases(puntos[inicio:inicio + bloque]))
+        if forma == ():
+            return float(resultado[0])
+        return resultado.reshape(forma)
+
+
+def lagrange_nd(nodos, valores, punto):
+    """Interpola en la malla nodos[0] × nodos[1] × ...
+
+    valores[i0, i1, ...] es el dato en (nodos[0][i0], nodos[1][i1], ...) y
+    punto es (x,), (x, y) o (x, y, z), o un lote de puntos de forma (m, d).
+    Para un solo punto bases[k] es el vector de base del eje k; para un lote
+    es la matriz (m, n_k).
+    """
+    interpolador = InterpoladorTensorial(nodos, valores)
+    if np.ndim(punto) <= 1:
+        punto = np.atleast_1d(np.asarray(punto, dtype=float))
+        if punto.size != interpolador.dimension:
+            raise ValueError(f"El punto debe tener {interpolador.dimension} coordenadas")
+        bases = interpolador.bases(punto)
+        return ResultadoInterpolacion(float(interpolador._contraer(bases)[0]), [B[0] for B in bases])
+    bases = interpolador.bases(punto)
+    return ResultadoInterpolacion(interpolador._contraer(bases), bases)
@@ -0,0 +1,301 @@
+"""Métodos iterativos para sistemas lineales Ax = b
+
+A puede ser un arreglo denso de NumPy o una matriz dispersa de scipy.sparse
+(se convierte a CSR). Todos los métodos comparten la misma interfaz:
+
+    metodo(A, b, tol, max_iter, x0=None, criterio='incremento',
+           guardar_iteraciones=False, control=None, ...)
+
+y devuelven un ResultadoIterativo con el historial de residuos, de modo que
+se puede elegir el que converja más rápido para cada problema.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.ejecucion import intervalo_reporte
+
+try:
+    import scipy.linalg as sp_linalg
+    import scipy.sparse as sp_sparse
+    import scipy.sparse.linalg as sp_sparse_linalg
+except ImportError:  # scipy es opcional: sólo se necesita para matrices dispersas
+    sp_linalg = sp_sparse = sp_sparse_linalg = None
+
+
+@dataclass
+class ResultadoIterativo:
+    """Resultado de un método iterativo para Ax = b"""
+    x: np.ndarray
+    iteraciones: int
+    error: float                     # último valor del criterio de paro
+    convergio: bool
+    metodo: str
+    diagonal_dominante: bool = None
+    omega: float = None              # sólo SOR
+    mensaje: str = ""
+    errores: list = field(default_factory=list)     # criterio de paro en cada iteración
+    residuos: list = field(default_factory=list)    # ||b - Ax||₂ / ||b||₂ (x al inicio de cada paso)
+    historial: list = field(default_factory=list)   # (iter, x, error) si se pidió guardarlo
+
+
+def es_dispersa(A):
+    return sp_sparse is not None and sp_sparse.issparse(A)
+
+
+def preparar_sistema(A, b):
+    """Convierte A (densa o dispersa) y b a float y valida sus dimensiones"""
+    if es_dispersa(A):
+        A = sp_sparse.csr_matrix(A, dtype=float)
+    else:
+        A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float).ravel()
+    n = A.shape[0]
+    if A.ndim != 2 or A.shape != (n, n):
+        raise ValueError("La matriz A debe ser cuadrada")
+    if b.shape != (n,):
+        raise ValueError(f"El vector b debe tener {n} valores")
+    return A, b
+
+
+def es_diagonal_dominante(A):
+    """|a_ii| >= Σ_{j≠i} |a_ij| para todas las filas"""
+    d = np.abs(A.diagonal())
+    suma_filas = np.asarray(abs(A).sum(axis=1)).ravel()
+    return bool(np.all(d >= suma_filas - d))
+
+
+def es_simetrica(A, tol=1e-12):
+    diferencia = abs(A - A.T)
+    maximo = diferencia.max() if diferencia.shape[0] else 0.0
+    return maximo <= tol * max(abs(A).max(), 1.0)
+
+
+def diagonal_no_nula(A):
+    """Copia de la diagonal de A; error si algún elemento es cero"""
+    D = A.diagonal().copy()
+    if np.any(D == 0):
+        raise ValueError("La diagonal de A tiene ceros: el método no es aplicable")
+    return D
+
+
+def separar_diagonal(A):
+    """Devuelve (D, R) con D = diag(A) y R = A - diag(D), en el formato de A"""
+    D = diagonal_no_nula(A)
+    if es_dispersa(A):
+        R = (A - sp_sparse.diags(D, format='csr')).tocsr()
+        R.eliminate_zeros()
+    else:
+        R = A.copy()
+        np.fill_diagonal(R, 0.0)
+    return D, R
+
+
+def _triangular_inferior(A, diagonal):
+    """M = L + diag(diagonal), con L la parte estrictamente inferior de A"""
+    if es_dispersa(A):
+        return (sp_sparse.tril(A, k=-1) + sp_sparse.diags(diagonal)).tocsr()
+    M = np.tril(A, k=-1)
+    M[np.diag_indices_from(M)] = diagonal
+    return M
+
+
+def _resolutor_triangular_inferior(M):
+    """Prepara la sustitución hacia adelante M z = r y devuelve r -> z"""
+    if es_dispersa(M):
+        # SuperLU con orden natural y sin pivoteo: M ya es triangular, no hay relleno
+        factor = sp_sparse_linalg.splu(M.tocsc(), permc_spec='NATURAL', diag_pivot_thresh=0,
+                                       options={'SymmetricMode': True})
+        return factor.solve
+    if sp_linalg is not None:
+        return lambda r: sp_linalg.solve_triangular(M, r, lower=True, check_finite=False)
+
+    def sustitucion(r):
+        z = np.empty_like(r)
+        for i in range(r.size):
+            z[i] = (r[i] - M[i, :i] @ z[:i]) / M[i, i]
+        return z
+    return sustitucion
+
+
+def _iterar(metodo, A, b, paso, x, tol, max_iter, criterio, guardar_iteraciones, control, **extra):
+    """Bucle común: paso(x) actualiza x en su lugar y devuelve (||Δx||∞, ||b - Ax||₂)"""
+    if criterio not in ('incremento', 'residuo'):
+        raise ValueError(f"Criterio de paro desconocido: {criterio}")
+    norma_b = np.linalg.norm(b) or 1.0
+    diag_dom = es_diagonal_dominante(A)
+
+    errores, residuos, historial = [], [], []
+    error = float('inf')
+    cada = intervalo_reporte(max_iter)
+    for k in range(max_iter):
+        if control is not None and k % cada == 0:
+            control.reportar(k / max_iter)
+
+        incremento, residuo = paso(x)
+        residuo /= norma_b
+        error = incremento if criterio == 'incremento' else residuo
+        errores.append(error)
+        residuos.append(residuo)
+        if guardar_iteraciones:
+            historial.append((k, x.copy(), error))
+
+        if not np.isfinite(error):
+            return ResultadoIterativo(x, k + 1, error, False, metodo, diag_dom,
+                                      mensaje="El método divergió (valores no finitos)",
+                                      errores=errores, residuos=residuos, historial=historial, **extra)
+        if error < tol:
+            return ResultadoIterativo(x, k + 1, error, True, metodo, diag_dom,
+                                      errores=errores, residuos=residuos, historial=historial, **extra)
+
+    return ResultadoIterativo(x, max_iter, error, False, metodo, diag_dom,
+                              mensaje=f"No convergió en {max_iter} iteraciones",
+                              errores=errores, residuos=residuos, historial=historial, **extra)
+
+
+def _vector_inicial(x0, n):
+    return np.zeros(n) if x0 is None else np.asarray(x0, dtype=float).ravel().copy()
+
+
+def jacobi(A, b, tol=1e-4, max_iter=50, x0=None, criterio='incremento',
+           guardar_iteraciones=False, control=None):
+    """Método de Jacobi: x = D^{-1} (b - R x), un producto matriz-vector por barrido"""
+    A, b = preparar_sistema(A, b)
+    if es_dispersa(A):
+        D, R = separar_diagonal(A)
+        producto_R = R.__matmul__
+    else:
+        # R x = A x - D x: no se copia A (puede ser un memmap grande)
+        D = diagonal_no_nula(A)
+        producto_R = lambda x: A @ x - D * x
+    D_inv = 1.0 / D
+    x_nuevo = np.empty(b.size)
+    diferencia = np.empty(b.size)
+
+    def paso(x):
+        np.subtract(b, producto_R(x), out=x_nuevo)
+        np.multiply(D_inv, x_nuevo, out=x_nuevo)
+        np.subtract(x_nuevo, x, out=diferencia)
+        # b - A x = D (x_nuevo - x): el residuo sale sin otro producto
+        residuo = np.linalg.norm(D * diferencia)
+        x[:] = x_nuevo
+        return (np.max(np.abs(diferencia)) if b.size else 0.0), residuo
+
+    return _iterar("Jacobi", A, b, paso, _vector_inicial(x0, b.size), tol, max_iter,
+                   criterio, guardar_iteraciones, control)
+
+
+def _sor(nombre, A, b, omega, tol, max_iter, x0, criterio, guardar_iteraciones, control):
+    """x += (D/ω + L)^{-1} (b - A x); con ω = 1 es Gauss-Seidel"""
+    if not 0 < omega < 2:
+        raise ValueError("ω debe estar en el intervalo (0, 2)")
+    D = diagonal_no_nula(A)
+    resolver = _resolutor_triangular_inferior(_triangular_inferior(A, D / omega))
+
+    def paso(x):
+        r = b - A @ x
+        z = resolver(r)
+        x += z
+        return (np.max(np.abs(z)) if b.size else 0.0), np.linalg.norm(r)
+
+    return _iterar(nombre, A, b, paso, _vector_inicial(x0, b.size), tol, max_iter,
+                   criterio, guardar_iteraciones, control, omega=omega)
+
+
+def gauss_seidel(A, b, tol=1e-4, max_iter=50, x0=None, criterio='incremento',
+                 guardar_iteraciones=False, control=None):
+    """Gauss-Seidel: usa los valores ya actualizados dentro del mismo barrido"""
+    A, b = preparar_sistema(A, b)
+    return _sor("Gauss-Seidel", A, b, 1.0, tol, max_iter, x0, criterio,
+                guardar_iteraciones, control)
+
+
+def estimar_omega(A, max_iter=2000, tol=1e-7, semilla=0):
+    """ω óptimo de SOR, 2 / (1 + sqrt(1 - ρ²)), con ρ el radio espectral de Jacobi
+
+    ρ se estima con el método de la potencia sobre B = -D^{-1} R hasta que la
+    estimación se estabiliza. Devuelve (ω, ρ); si ρ >= 1 se usa ω = 1
+    (Gauss-Seidel).
+    """
+    D, R = separar_diagonal(A)
+    v = np.random.default_rng(semilla).random(D.size)
+    v /= np.linalg.norm(v)
+    rho, norma_anterior = 0.0, None
+    for _ in range(max_iter):
+        v = -(R @ v) / D
+        norma = np.linalg.norm(v)
+        if norma == 0:
+            return 1.0, 0.0
+        v /= norma
+        if norma_anterior is not None:
+            # Dos pasos seguidos: evita la oscilación de los autovalores ±ρ
+            rho_nuevo = float(np.sqrt(norma * norma_anterior))
+            if abs(rho_nuevo - rho) < tol * rho_nuevo:
+                rho = rho_nuevo
+                break
+            rho = rho_nuevo
+        norma_anterior = norma
+    if rho >= 1:
+        return 1.0, rho
+    return 2.0 / (1.0 + np.sqrt(1.0 - rho**2)), rho
+
+
+def sor(A, b, tol=1e-4, max_iter=50, x0=None, omega=None, criterio='incremento',
+        guardar_iteraciones=False, control=None):
+    """Sobrerrelajación sucesiva; si omega es None se estima automáticamente"""
+    A, b = preparar_sistema(A, b)
+    if omega is None:
+        omega, _ = estimar_omega(A)
+    return _sor("SOR", A, b, omega, tol, max_iter, x0, criterio, guardar_iteraciones, control)
+
+
+def conjugate_gradient(A, b, tol=1e-4, max_iter=50, x0=None, criterio='incremento',
+                       guardar_iteraciones=False, control=None):
+    """Gradiente conjugado (A simétrica definida positiva)"""
+    A, b = preparar_sistema(A, b)
+    if not es_simetrica(A):
+        raise ValueError("El gradiente conjugado requiere una matriz A simétrica")
+
+    x = _vector_inicial(x0, b.size)
+    r = b - A @ x
+    p = r.copy()
+    estado = {'rr': float(r @ r)}
+
+    def paso(x):
+        rr = estado['rr']
+        if rr == 0.0:
+            return 0.0, 0.0
+        Ap = A @ p
+        pAp = float(p @ Ap)
+        if pAp <= 0:
+            raise ValueError("La matriz A no es definida positiva")
+        alfa = rr / pAp
+        incremento = abs(alfa) * np.max(np.abs(p))
+        x += alfa * p
+        np.subtract(r, alfa * Ap, out=r)
+        rr_nuevo = float(r @ r)
+        np.multiply(p, rr_nuevo / rr, out=p)
+        np.add(p, r, out=p)
+        estado['rr'] = rr_nuevo
+        return incremento, np.sqrt(rr_nuevo)
+
+    return _iterar("Gradiente Conjugado", A, b, paso, x, tol, max_iter,
+                   criterio, guardar_iteraciones, control)
+
+
+# Para que un proceso por lotes elija el método por nombre
+METODOS_ITERATIVOS = {
+    'jacobi': jacobi,
+    'gauss_seidel': gauss_seidel,
+    'sor': sor,
+    'gradiente_conjugado': conjugate_gradient,
+}
+
+
+def resolver_iterativo(A, b, metodo='jacobi', **opciones):
+    """Resuelve Ax = b con el método iterativo indicado por nombre"""
+    try:
+        funcion = METODOS_ITERATIVOS[metodo]
+    except KeyError:
+        raise ValueError(f"Método iterativo desconocido: {metodo}") from None
+    return funcion(A, b, **opciones)
@@ -0,0 +1,56 @@
+"""Punto de entrada del núcleo numérico: reúne los métodos de todos los módulos
+
+Todas las funciones aceptan la expresión como cadena (se compila con
+core.expresiones) o como función de Python, y devuelven objetos de resultado
+en lugar de imprimir, para poder usarlas sin la interfaz gráfica.
+"""
+from core.cubatura import ResultadoCubatura, cuasi_monte_carlo, simpson38_nd
+from core.derivacion_automatica import Dual, HiperDual, derivar
+from core.derivadas import (
+    ResultadoDerivada, ResultadoDiferencias, derivada, pesos_fornberg, plantilla, second_derivative,
+)
+from core.derivadas_tabuladas import (
+    ResultadoDerivadasArchivo, bloques_archivo, derivar_archivo, derivar_flujo, derivar_muestras,
+)
+from core.edo import (
+    LadoDerecho, ResultadoEDO, SalidaDensa, dopri45, euler_system, rk2, sistema_lineal,
+)
+from core.edo_ensambles import ResultadoEnsamble, ensamble_edo
+from core.edo_rigidas import backward_euler, bdf2, rosenbrock_w
+from core.eventos import Evento
+from core.integracion import (
+    ResultadoIntegral, gauss_kronrod, gauss_legendre, integrar, romberg_simpson38, simpson38,
+    simpson38_adaptativo,
+)
+from core.interpolacion import (
+    InterpoladorBaricentrico, InterpoladorTensorial, ResultadoInterpolacion, lagrange_nd,
+)
+from core.lineales import (
+    ResultadoIterativo, conjugate_gradient, gauss_seidel, jacobi, resolver_iterativo, sor,
+)
+from core.raices import (
+    ResultadoPuntoFijo, ResultadoRaiz, acotar_raiz, biseccion, brent, buscar_raiz, fixed_point, illinois,
+    newton_protegido,
+)
+from core.raices_lotes import ResultadoRaicesLote, raices_lote
+
+__all__ = [
+    'fixed_point', 'ResultadoPuntoFijo',
+    'biseccion', 'illinois', 'brent', 'newton_protegido', 'acotar_raiz', 'buscar_raiz', 'ResultadoRaiz',
+    'raices_lote', 'ResultadoRaicesLote',
+    'jacobi', 'gauss_seidel', 'sor', 'conjugate_gradient', 'resolver_iterativo',
+    'ResultadoIterativo',
+    'InterpoladorBaricentrico', 'InterpoladorTensorial', 'lagrange_nd', 'ResultadoInterpolacion',
+    'simpson38', 'simpson38_adaptativo', 'romberg_simpson38', 'gauss_legendre', 'gauss_kronrod',
+    'integrar', 'ResultadoIntegral',
+    'simpson38_nd', 'cuasi_monte_carlo', 'ResultadoCubatura',
+    'second_derivative', 'ResultadoDerivada',
+    'derivada', 'pesos_fornberg', 'plantilla', 'ResultadoDiferencias',
+    'derivar_muestras', 'derivar_flujo', 'bloques_archivo', 'derivar_archivo', 'ResultadoDerivadasArchivo',
+    'derivar', 'Dual', 'HiperDual',
+    'rk2', 'euler_system', 'dopri45', 'ResultadoEDO', 'SalidaDensa',
+    'sistema_lineal', 'LadoDerecho',
+    'backward_euler', 'bdf2', 'rosenbrock_w',
+    'ensamble_edo', 'ResultadoEnsamble',
+    'Evento',
+]
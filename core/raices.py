@@ -0,0 +1,502 @@
+"""Búsqueda de raíces: punto fijo, métodos de intervalo y Newton protegido
+
+Los métodos de intervalo (bisección, Illinois, Brent) parten de [a, b] con
+f(a)·f(b) <= 0 y no pueden perder la raíz. newton_protegido usa la derivada
+(exacta por derivación automática, o la pendiente secante si la expresión
+no la admite) mientras el paso quede dentro del intervalo y reduzca |f| lo
+suficiente; si no, bisecta. Todos cuentan las evaluaciones de f, que es lo
+que cuesta cuando f es cara.
+"""
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.ejecucion import intervalo_reporte
+from core.derivacion_automatica import derivar
+from core.expresiones import como_expresion
+
+_EPS = np.finfo(float).eps
+
+
+@dataclass
+class ResultadoPuntoFijo:
+    """Resultado del método del punto fijo"""
+    raiz: float
+    f_raiz: float
+    iteraciones: int
+    error: float
+    estado: str                      # 'convergio', 'divergio', 'error_numerico' o 'max_iter'
+    descripcion_g: str
+    g_prima_x0: float = None         # None si no se pudo estimar
+    mensaje: str = ""
+    historial: list = field(default_factory=list)   # (iter, x, f(x), g(x), error)
+    evaluaciones: int = 0            # evaluaciones de f, incluidas las de g'(x0)
+
+    @property
+    def convergio(self):
+        return self.estado == 'convergio'
+
+
+@dataclass
+class ResultadoRaiz:
+    """Resultado de un método de intervalo o de Newton protegido"""
+    raiz: float
+    f_raiz: float
+    iteraciones: int
+    evaluaciones: int                # evaluaciones de f
+    error: float                     # ancho final del intervalo o último paso
+    estado: str                      # 'convergio', 'max_iter', 'sin_cambio_signo', 'divergio' o 'error_numerico'
+    metodo: str
+    intervalo: tuple = None          # último intervalo con cambio de signo, si lo hubo
+    evaluaciones_derivada: int = 0
+    pasos_biseccion: int = 0         # pasos de Newton/secante sustituidos por bisección
+    mensaje: str = ""
+    historial: list = field(default_factory=list)   # (iter, x, f(x), error)
+
+    @property
+    def convergio(self):
+        return self.estado == 'convergio'
+
+
+class _Contador:
+    """Envuelve f(x) devolviendo float y cuenta sus evaluaciones"""
+
+    def __init__(self, f):
+        self.f = f
+        self.n = 0
+
+    def __call__(self, x):
+        self.n += 1
+        return float(self.f(x))
+
+    def derivadas(self, x, orden=1):
+        """(f, f'[, f'']) en x por derivación automática; cuenta como una evaluación"""
+        self.n += 1
+        return derivar(self.f, x, orden)
+
+
+def _tolerancia(tol, x):
+    return tol + 2 * _EPS * abs(x)
+
+
+def _intervalo(a, b):
+    return None if a is None else (min(a, b), max(a, b))
+
+
+def fixed_point(f, x0, tol=1e-4, max_iter=50, metodo='alfa', alfa=-0.1, acelerar=False, control=None):
+    """Punto fijo x = g(x) con g(x) = x + α f(x) o g(x) = x - f(x)/f'(x) (Newton)
+
+    Con acelerar=True cada iteración es un paso de Steffensen: la
+    extrapolación de Aitken de x, g(x), g(g(x)), que converge en forma
+    cuadrática aunque la iteración simple sea lineal (o no converja).
+    """
+    f = _Contador(como_expresion(f, ('x',)).funcion)
+    if metodo not in ("alfa", "newton"):
+        raise ValueError(f"Método desconocido para generar g(x): {metodo}")
+
+    # f, f', f'' exactas en x0 (derivación automática) si la expresión lo admite
+    try:
+        derivadas_x0 = f.derivadas(x0, 2)
+    except TypeError:
+        derivadas_x0 = None
+    except ArithmeticError:
+        derivadas_x0 = (float('nan'),) * 3
+
+    # Generar g(x) según el método seleccionado; g recibe f(x) si ya se conoce
+    if metodo == "alfa":
+        g = lambda x, f_x: x + alfa * f_x
+        descripcion_g = f"g(x) = x + {alfa}*f(x)"
+    elif derivadas_x0 is not None:
+        g = lambda x, f_x: x - f_x / f.derivadas(x)[1]
+        descripcion_g = "g(x) = x - f(x)/f'(x) (Método de Newton, f' por derivación automática)"
+    else:
+        # Derivada numérica con diferencias centrales
+        h = 1e-8
+        f_prima = lambda x: (f(x + h) - f(x - h)) / (2 * h)
+        g = lambda x, f_x: x - f_x / f_prima(x)
+        descripcion_g = "g(x) = x - f(x)/f'(x) (Método de Newton)"
+    if acelerar:
+        descripcion_g += ", acelerada con Steffensen (Aitken)"
+
+    # |g'(x0)| para la condición de convergencia: g' = 1 + α f' o f f''/f'²
+    try:
+        if derivadas_x0 is not None:
+            f0, f1, f2 = derivadas_x0
+            g_prima_x0 = abs(1 + alfa * f1) if metodo == "alfa" else abs(f0 * f2 / (f1 * f1))
+        else:
+            h = 1e-6
+            g_prima_x0 = abs((g(x0 + h, f(x0 + h)) - g(x0 - h, f(x0 - h))) / (2 * h))
+        if not math.isfinite(g_prima_x0):
+            g_prima_x0 = None
+    except Exception:
+        g_prima_x0 = None
+
+    historial = []
+    x = x0
+    error = float('inf')
+    cada = intervalo_reporte(max_iter)
+    try:
+        f_x = f(x)
+    except (ZeroDivisionError, OverflowError, ValueError) as e:
+        return ResultadoPuntoFijo(x, float('nan'), 0, error, 'error_numerico', descripcion_g, g_prima_x0,
+                                  f"Error numérico al evaluar f(x0): {e}", evaluaciones=f.n)
+    for i in range(max_iter):
+        if control is not None and i % cada == 0:
+            control.reportar(i / max_iter)
+        try:
+            x_nuevo = g(x, f_x)
+            if acelerar:
+                x_dos = g(x_nuevo, f(x_nuevo))
+                denominador = x_dos - 2 * x_nuevo + x
+                if denominador != 0:
+                    x_nuevo = x - (x_nuevo - x) ** 2 / denominador
+                else:
+                    x_nuevo = x_dos
+            error = abs(x_nuevo - x)
+            historial.append((i, x, f_x, x_nuevo, error))
+            f_nuevo = f(x_nuevo)
+
+            if error < tol:
+                return ResultadoPuntoFijo(x_nuevo, f_nuevo, i + 1, error, 'convergio',
+                                          descripcion_g, g_prima_x0, historial=historial,
+                                          evaluaciones=f.n)
+
+            # Detectar divergencia
+            if abs(x_nuevo) > 1e10 or not math.isfinite(x_nuevo):
+                return ResultadoPuntoFijo(x_nuevo, f_x, i + 1, error, 'divergio',
+                                          descripcion_g, g_prima_x0,
+                                          "|x| > 10^10", historial, f.n)
+
+            x, f_x = x_nuevo, f_nuevo
+
+        except (ZeroDivisionError, OverflowError) as e:
+            return ResultadoPuntoFijo(x, float('nan'), i, error, 'error_numerico',
+                                      descripcion_g, g_prima_x0,
+                                      f"Error numérico en iteración {i}: {e}", historial, f.n)
+
+    return ResultadoPuntoFijo(x, f_x, max_iter, error, 'max_iter',
+                              descripcion_g, g_prima_x0, historial=historial, evaluaciones=f.n)
+
+
+def _iniciar_intervalo(metodo, f, a, b, fa, fb):
+    """Evalúa los extremos (si no se dieron) y devuelve (a, b, fa, fb) o un ResultadoRaiz final"""
+    try:
+        fa = f(a) if fa is None else float(fa)
+        fb = f(b) if fb is None else float(fb)
+    except (ZeroDivisionError, OverflowError, ValueError) as e:
+        return ResultadoRaiz(a, float('nan'), 0, f.n, abs(b - a), 'error_numerico', metodo,
+                             mensaje=f"Error numérico en los extremos: {e}")
+    if not (math.isfinite(fa) and math.isfinite(fb)):
+        return ResultadoRaiz(a, fa, 0, f.n, abs(b - a), 'error_numerico', metodo,
+                             mensaje="f no es finita en los extremos del intervalo")
+    for x, f_x in ((a, fa), (b, fb)):
+        if f_x == 0:
+            return ResultadoRaiz(x, 0.0, 0, f.n, 0.0, 'convergio', metodo, (x, x))
+    if fa * fb > 0:
+        return ResultadoRaiz(a if abs(fa) < abs(fb) else b, min(fa, fb, key=abs), 0, f.n, abs(b - a),
+                             'sin_cambio_signo', metodo, mensaje="f(a) y f(b) tienen el mismo signo")
+    return a, b, fa, fb
+
+
+def biseccion(f, a, b, tol=1e-10, max_iter=200, fa=None, fb=None, control=None):
+    """Bisección: el intervalo se reduce a la mitad con una evaluación por iteración"""
+    f = _Contador(como_expresion(f, ('x',)).funcion)
+    inicio = _iniciar_intervalo("Bisección", f, a, b, fa, fb)
+    if isinstance(inicio, ResultadoRaiz):
+        return inicio
+    a, b, fa, fb = inicio
+
+    historial = []
+    cada = intervalo_reporte(max_iter)
+    for i in range(max_iter):
+        if control is not None and i % cada == 0:
+            control.reportar(i / max_iter)
+        m = a + (b - a) / 2
+        try:
+            fm = f(m)
+        except (ZeroDivisionError, OverflowError, ValueError) as e:
+            return ResultadoRaiz(m, float('nan'), i, f.n, abs(b - a), 'error_numerico', "Bisección",
+                                 (a, b), mensaje=f"Error numérico en iteración {i}: {e}", historial=historial)
+        if fm == 0:
+            a = b = m
+        elif (fm < 0) == (fa < 0):
+            a, fa = m, fm
+        else:
+            b, fb = m, fm
+        historial.append((i, m, fm, abs(b - a)))
+        if abs(b - a) <= _tolerancia(tol, m):
+            return ResultadoRaiz(m, fm, i + 1, f.n, abs(b - a), 'convergio', "Bisección", (a, b),
+                                 historial=historial)
+
+    return ResultadoRaiz(m, fm, max_iter, f.n, abs(b - a), 'max_iter', "Bisección", (a, b),
+                         historial=historial)
+
+
+def illinois(f, a, b, tol=1e-10, max_iter=200, fa=None, fb=None, control=None):
+    """Regula falsi modificada (Illinois): si un extremo se repite, su f se divide entre 2
+
+    Converge con orden ~1.44 sin perder el intervalo; es el método con el
+    que se localizan los eventos de las EDO.
+    """
+    f = _Contador(como_expresion(f, ('x',)).funcion)
+    inicio = _iniciar_intervalo("Illinois", f, a, b, fa, fb)
+    if isinstance(inicio, ResultadoRaiz):
+        return inicio
+    a, b, fa, fb = inicio
+
+    historial = []
+    cada = intervalo_reporte(max_iter)
+    for i in range(max_iter):
+        if control is not None and i % cada == 0:
+            control.reportar(i / max_iter)
+        c = b - fb * (b - a) / (fb - fa)
+        try:
+            fc = f(c)
+        except (ZeroDivisionError, OverflowError, ValueError) as e:
+            return ResultadoRaiz(c, float('nan'), i, f.n, abs(b - a), 'error_numerico', "Illinois",
+                                 (a, b), mensaje=f"Error numérico en iteración {i}: {e}", historial=historial)
+        if fc == 0:
+            a = b = c
+        elif fc * fb < 0:
+            a, fa = b, fb
+        else:
+            fa /= 2.0
+        b, fb = c, fc
+        historial.append((i, c, fc, abs(b - a)))
+        if fc == 0 or abs(b - a) <= _tolerancia(tol, c):
+            return ResultadoRaiz(c, fc, i + 1, f.n, abs(b - a), 'convergio', "Illinois",
+                                 (min(a, b), max(a, b)), historial=historial)
+
+    return ResultadoRaiz(b, fb, max_iter, f.n, abs(b - a), 'max_iter', "Illinois",
+                         (min(a, b), max(a, b)), historial=historial)
+
+
+def brent(f, a, b, tol=1e-10, max_iter=200, fa=None, fb=None, control=None):
+    """Método de Brent: interpolación inversa cuadrática o secante, con bisección de respaldo
+
+    Cada paso de interpolación se acepta sólo si cae dentro del intervalo y
+    reduce el paso lo suficiente; si no, se bisecta. Nunca necesita muchas
+    más evaluaciones que la bisección y normalmente converge superlinealmente.
+    """
+    f = _Contador(como_expresion(f, ('x',)).funcion)
+    inicio = _iniciar_intervalo("Brent", f, a, b, fa, fb)
+    if isinstance(inicio, ResultadoRaiz):
+        return inicio
+    a, b, fa, fb = inicio
+
+    c, fc = b, fb
+    d = e = b - a
+    historial = []
+    bisecciones = 0
+    cada = intervalo_reporte(max_iter)
+    for i in range(max_iter):
+        if control is not None and i % cada == 0:
+            control.reportar(i / max_iter)
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = _EPS * abs(b) + 0.5 * tol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol1 or fb == 0:
+            return ResultadoRaiz(b, fb, i, f.n, abs(c - b), 'convergio', "Brent",
+                                 (min(b, c), max(b, c)), pasos_biseccion=bisecciones, historial=historial)
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s                      # secante
+            else:
+                q, r = fa / fc, fb / fc                      # interpolación inversa cuadrática
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+                bisecciones += 1
+        else:
+            d = e = m
+            bisecciones += 1
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, m)
+        try:
+            fb = f(b)
+        except (ZeroDivisionError, OverflowError, ValueError) as error:
+            return ResultadoRaiz(b, float('nan'), i, f.n, abs(c - b), 'error_numerico', "Brent",
+                                 mensaje=f"Error numérico en iteración {i}: {error}", historial=historial)
+        historial.append((i, b, fb, abs(c - b)))
+
+    return ResultadoRaiz(b, fb, max_iter, f.n, abs(c - b), 'max_iter', "Brent",
+                         (min(b, c), max(b, c)), pasos_biseccion=bisecciones, historial=historial)
+
+
+def acotar_raiz(f, x0, paso=None, factor=1.6, max_iter=50):
+    """Busca [a, b] con cambio de signo alrededor de x0 ampliando el intervalo
+
+    Se amplía cada vez el extremo con menor |f|. Devuelve (a, b, f(a), f(b))
+    o None si no encontró cambio de signo en max_iter ampliaciones.
+    """
+    if not isinstance(f, _Contador):
+        f = como_expresion(f, ('x',)).funcion
+    paso = 0.1 * max(abs(x0), 1.0) if paso is None else paso
+    a, b = x0 - paso, x0 + paso
+    try:
+        fa, fb = f(a), f(b)
+        for _ in range(max_iter):
+            if fa * fb <= 0:
+                return a, b, fa, fb
+            if abs(fa) < abs(fb):
+                a += factor * (a - b)
+                fa = f(a)
+            else:
+                b += factor * (b - a)
+                fb = f(b)
+    except (ZeroDivisionError, OverflowError, ValueError):
+        return None
+    return None
+
+
+def newton_protegido(f, x0=None, a=None, b=None, df=None, tol=1e-10, max_iter=100, control=None):
+    """Newton que recurre a la bisección
+
+    Si no se da df, f' se obtiene exacta por derivación automática; si la
+    expresión no la admite (funciones de math, ...) se usa la pendiente
+    secante con el iterado anterior.
+
+    Con un intervalo [a, b] con cambio de signo, todo paso que sale del
+    intervalo o que no reduce |f| al menos a la mitad respecto del paso
+    anterior se sustituye por una bisección, y el intervalo se actualiza con
+    cada evaluación. Sin intervalo se itera libremente desde x0 hasta que dos
+    iterados tienen signos opuestos (ya hay intervalo); si el paso falla
+    (pendiente nula, f no finita, |x| > 10^10) se busca un intervalo
+    alrededor de x0 con acotar_raiz y se sigue con él.
+    """
+    funcion = como_expresion(f, ('x',)).funcion
+    f = _Contador(funcion)
+    automatica = df is None
+    if automatica:
+        df = _Contador(lambda x: derivar(funcion, x)[1])
+    else:
+        df = _Contador(como_expresion(df, ('x',)).funcion)
+    metodo = "Newton protegido"
+    if a is not None and b is not None:
+        inicio = _iniciar_intervalo(metodo, f, a, b, None, None)
+        if isinstance(inicio, ResultadoRaiz):
+            return inicio
+        a, b, fa, fb = inicio
+        x, f_x = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+        x_previo, f_previo = (b, fb) if x == a else (a, fa)
+    elif x0 is not None:
+        a = b = fa = None
+        x = x0
+        try:
+            f_x = f(x)
+        except (ZeroDivisionError, OverflowError, ValueError):
+            f_x = float('nan')
+        x_previo = f_previo = None
+    else:
+        raise ValueError("Se necesita x0 o un intervalo [a, b]")
+
+    historial = []
+    paso_anterior = float('inf') if a is None else abs(b - a)
+    bisecciones = 0
+    cada = intervalo_reporte(max_iter)
+    for i in range(max_iter):
+        if control is not None and i % cada == 0:
+            control.reportar(i / max_iter)
+        if f_x == 0:
+            return ResultadoRaiz(x, 0.0, i, f.n, 0.0, 'convergio', metodo, _intervalo(a, b),
+                                 df.n if df else 0, bisecciones, historial=historial)
+
+        # Pendiente: f'(x) o la secante con el iterado anterior
+        try:
+            pendiente = None
+            if df is not None:
+                try:
+                    pendiente = df(x)
+                except TypeError:
+                    if not automatica:
+                        raise
+                    df, metodo = None, "Secante protegida"     # la expresión no admite duales
+            if pendiente is not None:
+                pass
+            elif x_previo is not None and x_previo != x:
+                pendiente = (f_x - f_previo) / (x - x_previo)
+            else:
+                h = 1e-7 * max(abs(x), 1.0)
+                x_previo, f_previo = x + h, f(x + h)
+                pendiente = (f_previo - f_x) / h
+            x_nuevo = x - f_x / pendiente
+        except (ZeroDivisionError, OverflowError, ValueError):
+            x_nuevo = float('nan')
+
+        if a is None and not (math.isfinite(x_nuevo) and math.isfinite(f_x) and abs(x_nuevo) <= 1e10):
+            # Sin intervalo y el paso falló: buscar uno alrededor de x0
+            intervalo = acotar_raiz(f, x0)
+            if intervalo is None:
+                return ResultadoRaiz(x, f_x, i, f.n, paso_anterior, 'divergio', metodo, None,
+                                     df.n if df else 0, bisecciones,
+                                     "El paso falló y no se encontró un intervalo con cambio de signo",
+                                     historial)
+            a, b, fa, fb = intervalo
+            x, f_x = (a, fa) if abs(fa) < abs(fb) else (b, fb)
+            x_previo, f_previo = (b, fb) if x == a else (a, fa)
+            paso_anterior = abs(b - a)
+            continue
+        if a is not None and (not math.isfinite(x_nuevo) or not min(a, b) <= x_nuevo <= max(a, b)
+                              or abs(x_nuevo - x) > paso_anterior / 2):
+            x_nuevo = a + (b - a) / 2
+            bisecciones += 1
+
+        paso = abs(x_nuevo - x)
+        try:
+            f_nuevo = f(x_nuevo)
+        except (ZeroDivisionError, OverflowError, ValueError) as e:
+            return ResultadoRaiz(x, f_x, i, f.n, paso, 'error_numerico', metodo,
+                                 _intervalo(a, b), df.n if df else 0, bisecciones,
+                                 f"Error numérico en iteración {i}: {e}", historial)
+        x_previo, f_previo, x, f_x = x, f_x, x_nuevo, f_nuevo
+        paso_anterior = paso
+
+        if a is not None:
+            if (f_x < 0) == (fa < 0):
+                a, fa = x, f_x
+            else:
+                b, fb = x, f_x
+        elif math.isfinite(f_x) and f_x * f_previo < 0:
+            a, b, fa, fb = x_previo, x, f_previo, f_x       # dos iterados con signos opuestos
+        historial.append((i, x, f_x, paso))
+
+        ancho = abs(b - a) if a is not None else float('inf')
+        if paso <= _tolerancia(tol, x) or ancho <= _tolerancia(tol, x):
+            return ResultadoRaiz(x, f_x, i + 1, f.n, min(paso, ancho), 'convergio', metodo,
+                                 _intervalo(a, b),
+                                 df.n if df else 0, bisecciones, historial=historial)
+
+    return ResultadoRaiz(x, f_x, max_iter, f.n, paso_anterior, 'max_iter', metodo,
+                         _intervalo(a, b),
+                         df.n if df else 0, bisecciones, historial=historial)
+
+
+METODOS_RAICES = {
+    'biseccion': biseccion,
+    'illinois': illinois,
+    'brent': brent,
+    'newton': newton_protegido,
+}
+
+
+def buscar_raiz(f, metodo='brent', **opciones):
+    """Resuelve f(x) = 0 con el método indicado por nombre"""
+    try:
+        funcion = METODOS_RAICES[metodo]
+    except KeyError:
+        raise ValueError(f"Método de raíces desconocido: {metodo}") from None
+    return funcion(f, **opciones)
@@ -0,0 +1,171 @@
+"""Raíces por lotes: f(x; p) = 0 para muchos x0 (y parámetros) a la vez
+
+Es la iteración de fixed_point (g(x) = x + α f(x) o Newton, con o sin
+Steffensen) aplicada a un vector de carriles: cada iteración evalúa f una
+sola vez sobre todos los carriles que siguen activos. Un carril que
+converge o diverge se retira del conjunto activo (y deja de costar
+evaluaciones); los demás siguen hasta converger o llegar a max_iter.
+
+Los parámetros de cada carril (una matriz (m, n_par) o un vector) se usan
+en la expresión como p[0], p[1], ... Si la expresión no funciona con
+arreglos (min, max, if, ...) se detecta en la primera evaluación y se
+recorre carril por carril.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.derivacion_automatica import derivar
+from core.ejecucion import intervalo_reporte
+from core.expresiones import como_expresion
+
+
+@dataclass
+class ResultadoRaicesLote:
+    """Raíces por carril de un lote"""
+    raices: np.ndarray          # último iterado de cada carril
+    f_raices: np.ndarray
+    iteraciones: np.ndarray     # iteraciones de cada carril
+    errores: np.ndarray         # |x_nuevo - x| en la última iteración
+    convergio: np.ndarray       # bool por carril
+    divergio: np.ndarray        # bool por carril (|x| > 10^10 o no finito)
+    descripcion_g: str
+    evaluaciones: int           # evaluaciones de f sumadas sobre los carriles
+    vectorizado: bool           # False si f se evaluó carril por carril
+
+    @property
+    def carriles(self):
+        return len(self.raices)
+
+
+class _FuncionLote:
+    """Evalúa f(x, p) para un subconjunto de carriles y cuenta las evaluaciones"""
+
+    def __init__(self, f, con_parametros):
+        variables = ('x', 'p') if con_parametros else ('x',)
+        self.funcion = como_expresion(f, variables).funcion
+        self.con_parametros = con_parametros
+        self.vectorial = None        # se decide en la primera evaluación
+        self.automatica = None       # ¿admite derivación automática? (primera derivada)
+        self.evaluaciones = 0
+
+    def _por_carril(self, x, P):
+        if P is None:
+            return np.array([self.funcion(v) for v in x], dtype=float)
+        return np.array([self.funcion(v, p) for v, p in zip(x, P)], dtype=float)
+
+    def __call__(self, x, P):
+        self.evaluaciones += len(x)
+        if self.vectorial is False:
+            return self._por_carril(x, P)
+        try:
+            args = (x,) if P is None else (x, P.T)
+            with np.errstate(all='ignore'):
+                valores = np.broadcast_to(np.asarray(self.funcion(*args), dtype=float), x.shape)
+            vectorial = True
+        except (TypeError, ValueError, IndexError):
+            vectorial = False
+        if self.vectorial is None and vectorial:
+            # Se compara con la evaluación de uno en uno en el primer y el último carril
+            extremos = sorted({0, len(x) - 1})
+            muestra = self._por_carril(x[extremos], None if P is None else P[extremos])
+            vectorial = np.allclose(muestra, valores[extremos], rtol=1e-9, atol=1e-12, equal_nan=True)
+        self.vectorial = vectorial
+        return np.array(valores) if vectorial else self._por_carril(x, P)
+
+    def _derivada_automatica(self, x, P):
+        if self.vectorial is False:
+            if P is None:
+                return np.array([derivar(self.funcion, v)[1] for v in x])
+            return np.array([derivar(lambda v, p=p: self.funcion(v, p), xv)[1] for xv, p in zip(x, P)])
+        funcion = self.funcion if P is None else (lambda v: self.funcion(v, P.T))
+        return derivar(funcion, x)[1]
+
+    def derivada(self, x, P):
+        """f'(x) exacta por derivación automática, o por diferencias centrales si la expresión no la admite"""
+        if self.automatica is not False:
+            try:
+                d = self._derivada_automatica(x, P)
+                self.automatica = True
+                self.evaluaciones += len(x)
+                return d
+            except TypeError:
+                self.automatica = False
+        h = 1e-8
+        return (self(x + h, P) - self(x - h, P)) / (2 * h)
+
+
+def raices_lote(f, x0, parametros=None, tol=1e-4, max_iter=50, metodo='alfa', alfa=-0.1,
+                acelerar=False, control=None):
+    """Itera x = g(x) en todos los carriles a la vez (ver fixed_point)
+
+    x0 es un número o un vector (un valor inicial por carril); parametros,
+    si se da, es un vector o una matriz (m, n_par) con una fila por carril.
+    Un x0 escalar se repite en todos los carriles de parámetros.
+    """
+    if metodo not in ('alfa', 'newton'):
+        raise ValueError(f"Método desconocido para generar g(x): {metodo}")
+    P = None
+    if parametros is not None:
+        P = np.asarray(parametros, dtype=float)
+        P = P[:, None] if P.ndim == 1 else P
+        if P.ndim != 2:
+            raise ValueError("Los parámetros deben ser un vector o una matriz (carriles × parámetros)")
+    x = np.array(x0, dtype=float, ndmin=1)
+    if P is not None and x.size == 1:
+        x = np.full(len(P), x[0])
+    if x.ndim != 1 or (P is not None and len(P) != len(x)):
+        raise ValueError("Se esperaba un x0 y una fila de parámetros por carril")
+    m = len(x)
+    if m == 0:
+        raise ValueError("El lote no tiene carriles")
+
+    F = _FuncionLote(f, P is not None)
+    if metodo == 'alfa':
+        g = lambda x, f_x, P: x + alfa * f_x
+        descripcion_g = f"g(x) = x + {alfa}*f(x)"
+    else:
+        g = lambda x, f_x, P: x - f_x / F.derivada(x, P)
+        descripcion_g = "g(x) = x - f(x)/f'(x) (Método de Newton)"
+    if acelerar:
+        descripcion_g += ", acelerada con Steffensen (Aitken)"
+
+    f_x = F(x, P)
+    iteraciones = np.zeros(m, dtype=int)
+    errores = np.full(m, np.inf)
+    convergio = np.zeros(m, dtype=bool)
+    divergio = ~np.isfinite(f_x)
+    activos = np.flatnonzero(~divergio)
+
+    cada = intervalo_reporte(max_iter)
+    with np.errstate(all='ignore'):
+        for i in range(max_iter):
+            if activos.size == 0:
+                break
+            if control is not None and i % cada == 0:
+                control.reportar(i / max_iter)
+            xa = x[activos]
+            Pa = None if P is None else P[activos]
+            x_nuevo = g(xa, f_x[activos], Pa)
+            if acelerar:
+                x_dos = g(x_nuevo, F(x_nuevo, Pa), Pa)
+                denominador = x_dos - 2 * x_nuevo + xa
+                aitken = xa - (x_nuevo - xa) ** 2 / denominador
+                x_nuevo = np.where(denominador != 0, aitken, x_dos)
+            error = np.abs(x_nuevo - xa)
+            f_nuevo = F(x_nuevo, Pa)
+
+            x[activos] = x_nuevo
+            f_x[activos] = f_nuevo
+            errores[activos] = error
+            iteraciones[activos] = i + 1
+            listos = error < tol
+            perdidos = ~listos & ~(np.abs(x_nuevo) <= 1e10)     # también NaN
+            convergio[activos[listos]] = True
+            divergio[activos[perdidos]] = True
+            activos = activos[~(listos | perdidos)]
+
+    if F.automatica:
+        descripcion_g = descripcion_g.replace("Newton)", "Newton, f' por derivación automática)")
+    return ResultadoRaicesLote(x, f_x, iteraciones, errores, convergio, divergio, descripcion_g,
+                               F.evaluaciones, F.vectorial is not False)
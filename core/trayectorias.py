@@ -0,0 +1,177 @@
+"""Almacenamiento por bloques de las trayectorias de EDO
+
+Los integradores de paso fijo no reservan la trayectoria completa: van
+pasando cada estado a un EscritorTrayectoria, que guarda uno de cada
+guardar_cada pasos en un búfer de tamaño fijo y, cuando se llena, lo vacía
+a memoria o a un archivo .npy. El archivo se escribe en secuencia con una
+cabecera de longitud fija que se reescribe al cerrar con el número real de
+filas (así sirve también cuando no se sabe de antemano cuántos pasos habrá).
+
+La Trayectoria resultante tiene filas (t, y_0, ..., y_{n-1}); si está en un
+archivo se abre como memmap y se puede recorrer por bloques sin cargarla.
+"""
+import struct
+
+import numpy as np
+
+# Bytes de la cabecera .npy (versión 1.0): fija para poder reescribirla al cerrar
+_CABECERA = 128
+
+
+def _cabecera_npy(filas, columnas):
+    texto = "{'descr': %r, 'fortran_order': False, 'shape': (%d, %d), }" % (
+        np.lib.format.dtype_to_descr(np.dtype(float)), filas, columnas)
+    texto = texto.ljust(_CABECERA - 11) + "\n"
+    return np.lib.format.magic(1, 0) + struct.pack('<H', len(texto)) + texto.encode('latin1')
+
+
+class Trayectoria:
+    """Filas (t, y_0, ..., y_{n-1}) guardadas en memoria o en un .npy (memmap)"""
+
+    def __init__(self, datos, ruta=None):
+        self.datos = datos
+        self.ruta = ruta
+
+    @classmethod
+    def abrir(cls, ruta):
+        """Abre como memmap (sin leerla) una trayectoria guardada en un .npy"""
+        return cls(np.load(ruta, mmap_mode='r'), ruta)
+
+    @property
+    def t(self):
+        return self.datos[:, 0]
+
+    @property
+    def y(self):
+        return self.datos[:, 1:]
+
+    def __len__(self):
+        return len(self.datos)
+
+    def bloques(self, filas=65536):
+        """Itera sobre (t, y) de a lo sumo filas renglones, cargando uno por vez"""
+        for inicio in range(0, len(self.datos), filas):
+            bloque = np.asarray(self.datos[inicio:inicio + filas])
+            yield bloque[:, 0], bloque[:, 1:]
+
+    def submuestrear(self, max_puntos):
+        """(t, y) con a lo sumo ~max_puntos filas equiespaciadas (y la última), leído por bloques"""
+        total = len(self.datos)
+        paso = max(1, -(-total // max_puntos))
+        if paso == 1:
+            datos = np.asarray(self.datos)
+            return datos[:, 0], datos[:, 1:]
+        filas = max(paso, 65536 // paso * paso)
+        partes = [np.asarray(self.datos[inicio:inicio + filas:paso])
+                  for inicio in range(0, total, filas)]
+        if (total - 1) % paso:
+            partes.append(np.asarray(self.datos[total - 1:]))
+        datos = np.concatenate(partes)
+        return datos[:, 0], datos[:, 1:]
+
+
+class ArchivoNpy:
+    """Matriz (filas, columnas) de float que se escribe en un .npy por bloques
+
+    La cabecera se escribe con 0 filas y se reescribe al cerrar con el total,
+    así que no hace falta saber de antemano cuántas filas habrá.
+    """
+
+    def __init__(self, ruta, columnas):
+        self.ruta = ruta
+        self.columnas = columnas
+        self.filas = 0
+        self._archivo = open(ruta, 'wb')
+        self._archivo.write(_cabecera_npy(0, columnas))
+
+    def escribir(self, filas):
+        filas = np.ascontiguousarray(filas, dtype=float).reshape(-1, self.columnas)
+        filas.tofile(self._archivo)
+        self.filas += len(filas)
+
+    def cerrar(self):
+        self._archivo.seek(0)
+        self._archivo.write(_cabecera_npy(self.filas, self.columnas))
+        self._archivo.close()
+
+    @property
+    def cerrado(self):
+        return self._archivo.closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        # Si el cálculo se interrumpió el archivo queda con la cabecera de 0 filas
+        if not self._archivo.closed:
+            self._archivo.close()
+
+
+class EscritorTrayectoria:
+    """Recibe los estados paso a paso y guarda uno de cada guardar_cada
+
+    Con ruta=None los bloques se juntan en memoria al cerrar; con una ruta
+    se escriben al .npy en cuanto se llena cada bloque de filas. Si se
+    conoce el número de pasos, el búfer no pasa de lo que se va a guardar.
+    """
+
+    def __init__(self, n, ruta=None, guardar_cada=1, bloque=65536, pasos=None):
+        if guardar_cada < 1:
+            raise ValueError("guardar_cada debe ser al menos 1")
+        self.n = n
+        self.ruta = ruta
+        self.guardar_cada = int(guardar_cada)
+        if pasos is not None:
+            bloque = min(bloque, pasos // self.guardar_cada + 2)
+        self._t = np.empty(bloque)
+        self._y = np.empty((bloque, n))
+        self._llenas = 0
+        self._filas = 0
+        self._ultimo_paso = None
+        self._partes = []
+        self._archivo = None
+        if ruta is not None:
+            self._archivo = ArchivoNpy(ruta, n + 1)
+
+    def agregar(self, paso, t, y):
+        """Guarda (t, y) si paso es múltiplo de guardar_cada"""
+        if paso % self.guardar_cada == 0:
+            self._guardar(paso, t, y)
+
+    def _guardar(self, paso, t, y):
+        k = self._llenas
+        self._t[k] = t
+        self._y[k] = y
+        self._llenas = k + 1
+        self._ultimo_paso = paso
+        if self._llenas == len(self._t):
+            self._vaciar()
+
+    def _vaciar(self):
+        if not self._llenas:
+            return
+        filas = np.column_stack((self._t[:self._llenas], self._y[:self._llenas]))
+        if self._archivo is not None:
+            self._archivo.escribir(filas)
+        else:
+            self._partes.append(filas)
+        self._filas += self._llenas
+        self._llenas = 0
+
+    def cerrar(self, paso, t, y):
+        """Guarda el último estado (si no se guardó ya) y devuelve la Trayectoria"""
+        if paso != self._ultimo_paso:
+            self._guardar(paso, t, y)
+        self._vaciar()
+        if self._archivo is None:
+            datos = np.concatenate(self._partes) if self._partes else np.empty((0, self.n + 1))
+            return Trayectoria(datos)
+        self._archivo.cerrar()
+        return Trayectoria.abrir(self.ruta)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        if self._archivo is not None:
+            self._archivo.__exit__(*excepcion)
@@ -1,4 +1,4 @@
-from core.metodos_numericos import MetodosNumericosUI
+from metodos_numericos import MetodosNumericosUI
 import tkinter as tk
 
 def main():
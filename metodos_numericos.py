@@ -1,12 +1,31 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import simpy as sp
 
+from consola import ConsolaSalida
+from core.archivos import cargar_matriz, cargar_vector, resumen_matriz
+from core.ejecucion import CalculoCancelado, Ejecutor
+from core.metodos_numericos import (
+    Evento, InterpoladorBaricentrico, InterpoladorTensorial, backward_euler, bdf2, buscar_raiz,
+    cuasi_monte_carlo, derivada, derivar_archivo, dopri45, ensamble_edo, euler_system, fixed_point, integrar, raices_lote,
+    resolver_iterativo, rk2, rosenbrock_w, second_derivative, simpson38_nd,
+)
+
 class MetodosNumericosUI:
+    # Máximo de incógnitas que se muestran como columnas en las tablas
+    MAX_COLUMNAS_X = 10
+    # Máximo de trayectorias de un ensamble que se dibujan superpuestas
+    MAX_TRAYECTORIAS_GRAFICA = 200
+    # Puntos por trayectoria que se guardan en el modo ensamble
+    MAX_PUNTOS_ENSAMBLE = 1000
+    # Puntos de una trayectoria larga que se leen para graficarla
+    MAX_PUNTOS_GRAFICA = 20000
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Métodos Numéricos")
@@ -17,6 +36,10 @@ class MetodosNumericosUI:
         self.current_entry = None
         self.input_fields = {}
         
+        # Cálculos en segundo plano
+        self.ejecutor = Ejecutor()
+        self.tarea_actual = None
+        
         # Frame principal horizontal
         main_container = tk.Frame(root, bg='#2b2b2b')
         main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -36,9 +59,18 @@ class MetodosNumericosUI:
         self.content_frame.pack(fill=tk.BOTH, expand=True)
         
         # Área de salida
-        output_label = tk.Label(self.content_frame, text="Resultados:", 
+        output_header = tk.Frame(self.content_frame, bg='#2b2b2b')
+        output_header.pack(fill=tk.X)
+        
+        output_label = tk.Label(output_header, text="Resultados:", 
                                bg='#2b2b2b', fg='white', font=('Arial', 12, 'bold'))
-        output_label.pack(anchor='w')
+        output_label.pack(side=tk.LEFT)
+        
+        self.log_activo = tk.BooleanVar(value=False)
+        tk.Checkbutton(output_header, text="Guardar log completo en archivo", 
+                      variable=self.log_activo, command=self.toggle_log,
+                      bg='#2b2b2b', fg='white', selectcolor='#4a4a4a', 
+                      font=('Arial', 9)).pack(side=tk.RIGHT)
         
         self.output_text = scrolledtext.ScrolledText(
             self.content_frame, 
@@ -50,6 +82,18 @@ class MetodosNumericosUI:
         )
         self.output_text.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
         
+        # Las líneas se vuelcan al widget en lotes (ver consola.py)
+        self.consola = ConsolaSalida(self.output_text)
+        
+        # Barra de progreso y cancelación (visible sólo durante un cálculo)
+        self.progress_frame = tk.Frame(self.content_frame, bg='#2b2b2b')
+        self.progress_bar = ttk.Progressbar(self.progress_frame, orient='horizontal',
+                                            mode='determinate', maximum=100)
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        self.cancel_button = tk.Button(self.progress_frame, text="Cancelar", command=self.cancelar_calculo,
+                                       bg='#d9534f', fg='white', font=('Arial', 10, 'bold'), width=12)
+        self.cancel_button.pack(side=tk.RIGHT)
+        
         # Frame para inputs dinámicos con scroll
         input_container = tk.Frame(self.content_frame, bg='#2b2b2b')
         input_container.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -76,8 +120,17 @@ class MetodosNumericosUI:
         
         self.create_math_keyboard(right_frame)
         
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
+        
         self.show_main_menu()
     
+    def cerrar(self):
+        """Cancela el cálculo en curso y cierra la ventana"""
+        self.cancelar_calculo()
+        self.ejecutor.cerrar()
+        self.consola.desactivar_log()
+        self.root.destroy()
+    
     def on_input_frame_configure(self, event=None):
         """Actualiza el scrollregion cuando cambia el tamaño del frame"""
         self.input_canvas.configure(scrollregion=self.input_canvas.bbox("all"))
@@ -98,12 +151,13 @@ class MetodosNumericosUI:
         
         buttons = [
             ("1. Punto Fijo", self.punto_fijo_ui),
-            ("2. Jacobi", self.jacobi_ui),
+            ("2. Sistemas Lineales", self.jacobi_ui),
             ("3. Interpolación Multiple", self.interpolacion_ui),
-            ("4. Simpson 3/8", self.simpson_ui),
-            ("5. 2da Derivada", self.derivada_ui),
+            ("4. Integración", self.simpson_ui),
+            ("5. Derivación", self.derivada_ui),
             ("6. Runge-Kutta", self.rk_ui),
             ("7. Sistema EDO", self.sistema_edo_ui),
+            ("8. Integración Múltiple", self.cubatura_ui),
         ]
         
         for i, (text, command) in enumerate(buttons):
@@ -228,6 +282,11 @@ class MetodosNumericosUI:
     
     def clear_input_frame(self):
         """Limpia todos los widgets del frame de inputs"""
+        # Al cambiar de pantalla se abandona el cálculo en curso
+        if self.tarea_actual is not None:
+            self.tarea_actual.cancelar()
+            self.tarea_actual = None
+            self.progress_frame.pack_forget()
         for widget in self.input_frame.winfo_children():
             widget.destroy()
         self.input_fields = {}
@@ -235,13 +294,65 @@ class MetodosNumericosUI:
     
     def clear_output(self):
         """Limpia el área de salida"""
-        self.output_text.delete(1.0, tk.END)
+        self.consola.limpiar()
     
     def print_output(self, text, color='#00ff00'):
-        """Imprime texto en el área de salida"""
-        self.output_text.insert(tk.END, text + '\n', color)
-        self.output_text.see(tk.END)
-        self.output_text.update()
+        """Imprime texto en el área de salida (se muestra en el siguiente volcado)"""
+        self.consola.escribir(text, color)
+    
+    def toggle_log(self):
+        """Activa o desactiva la copia de toda la salida a un archivo"""
+        if self.log_activo.get():
+            ruta = filedialog.asksaveasfilename(title="Guardar log de resultados",
+                                                defaultextension=".txt",
+                                                filetypes=[("Texto", "*.txt"), ("Todos", "*.*")])
+            if not ruta:
+                self.log_activo.set(False)
+                return
+            self.consola.activar_log(ruta)
+            self.print_output(f"Log completo en: {ruta}", '#ffff00')
+        else:
+            self.consola.desactivar_log()
+    
+    def ejecutar_en_segundo_plano(self, funcion, args, al_terminar, kwargs=None):
+        """Ejecuta funcion(*args, **kwargs) en el hilo de cálculo y llama a al_terminar(resultado) al acabar"""
+        if self.tarea_actual is not None:
+            messagebox.showerror("Error", "Ya hay un cálculo en curso")
+            return
+        self.tarea_actual = self.ejecutor.enviar(funcion, *args, **(kwargs or {}))
+        self.progress_bar['value'] = 0
+        self.progress_frame.pack(fill=tk.X, pady=(0, 10), before=self.output_text)
+        self.root.after(50, self.sondear_tarea, al_terminar)
+    
+    def sondear_tarea(self, al_terminar):
+        """Consulta periódicamente el progreso de la tarea actual (hilo de Tk)"""
+        tarea = self.tarea_actual
+        if tarea is None:
+            return
+        if not tarea.terminada:
+            self.progress_bar['value'] = 100 * tarea.progreso
+            self.root.after(50, self.sondear_tarea, al_terminar)
+            return
+        
+        self.tarea_actual = None
+        self.progress_frame.pack_forget()
+        try:
+            resultado = tarea.resultado()
+        except CalculoCancelado:
+            self.print_output("\n✗ Cálculo cancelado por el usuario", '#ff0000')
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+            return
+        try:
+            al_terminar(resultado)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al mostrar resultados: {str(e)}")
+    
+    def cancelar_calculo(self):
+        """Pide al cálculo en curso que se detenga en la siguiente iteración"""
+        if self.tarea_actual is not None:
+            self.tarea_actual.cancelar()
     
     def create_entry_field(self, label_text, row, default=""):
         """Crea un campo de entrada con etiqueta"""
@@ -303,15 +414,31 @@ class MetodosNumericosUI:
                     variable=self.metodo_g, value="newton", bg='#2b2b2b', fg='white', 
                     selectcolor='#4a4a4a', font=('Arial', 9)).pack(anchor='w')
         
+        for texto, valor in [("Bisección en [a, b]", "biseccion"),
+                             ("Illinois (regula falsi modificada) en [a, b]", "illinois"),
+                             ("Brent en [a, b]", "brent"),
+                             ("Newton/secante protegido (x0, [a, b] opcional)", "newton_protegido")]:
+            tk.Radiobutton(rb_frame, text=texto, variable=self.metodo_g, value=valor,
+                        bg='#2b2b2b', fg='white', selectcolor='#4a4a4a', font=('Arial', 9)).pack(anchor='w')
+        
         self.input_fields['alfa'] = self.create_entry_field("α (solo si seleccionó α personalizado):", 3, "-0.1")
         self.input_fields['x0'] = self.create_entry_field("Valor inicial x0:", 4, "1")
-        self.input_fields['tol'] = self.create_entry_field("Tolerancia:", 5, "0.0001")
-        self.input_fields['max_iter'] = self.create_entry_field("Máx. iteraciones:", 6, "50")
+        self.input_fields['a'] = self.create_entry_field("Extremo a (métodos con intervalo):", 5, "0")
+        self.input_fields['b'] = self.create_entry_field("Extremo b (métodos con intervalo):", 6, "5")
+        self.input_fields['tol'] = self.create_entry_field("Tolerancia:", 7, "0.0001")
+        self.input_fields['max_iter'] = self.create_entry_field("Máx. iteraciones:", 8, "50")
+        self.input_fields['lote_p'] = self.create_entry_field("Lote de p (inicio:fin:cantidad o lista):", 9, "")
+        
+        self.acelerar_punto_fijo = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.input_frame, text="Acelerar g(x) con Steffensen (Aitken)",
+                       variable=self.acelerar_punto_fijo, bg='#2b2b2b', fg='white',
+                       selectcolor='#4a4a4a', font=('Arial', 9)).grid(
+                       row=10, column=0, columnspan=2, sticky='w', padx=5)
         
         btn = tk.Button(self.input_frame, text="Calcular", command=self.calcular_punto_fijo,
                     bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), 
                     width=20, height=2)
-        btn.grid(row=7, column=0, columnspan=2, pady=20)
+        btn.grid(row=11, column=0, columnspan=2, pady=20)
         
         self.current_entry = self.input_fields['f']
         self.input_fields['f'].focus()
@@ -319,150 +446,359 @@ class MetodosNumericosUI:
     def calcular_punto_fijo(self):
         try:
             f_str = self.input_fields['f'].get()
-            x0 = float(self.input_fields['x0'].get())
             tol = float(self.input_fields['tol'].get())
             max_iter = int(self.input_fields['max_iter'].get())
             metodo = self.metodo_g.get()
             
-            # Definir f(x)
-            f = lambda x: eval(f_str)
+            x0_lote = self.leer_valores(self.input_fields['x0'].get())
+            parametros = self.leer_valores(self.input_fields['lote_p'].get())
+            if parametros is not None or len(x0_lote) > 1:
+                self.calcular_raices_lote(f_str, x0_lote, parametros, tol, max_iter, metodo)
+                return
+            x0 = float(x0_lote[0])
             
-            # Generar g(x) según el método seleccionado
-            if metodo == "alfa":
-                alfa = float(self.input_fields['alfa'].get())
-                g = lambda x: x + alfa * f(x)
-                g_descripcion = f"g(x) = x + {alfa}*f(x)"
-            elif metodo == "newton":
-                # Derivada numérica con diferencias centrales
-                h = 1e-8
-                f_prima = lambda x: (f(x + h) - f(x - h)) / (2 * h)
-                g = lambda x: x - f(x) / f_prima(x)
-                g_descripcion = "g(x) = x - f(x)/f'(x) (Método de Newton)"
-            else:
+            if metodo in ("biseccion", "illinois", "brent", "newton_protegido"):
+                self.calcular_raiz_intervalo(f_str, x0, tol, max_iter, metodo)
+                return
+            if metodo not in ("alfa", "newton"):
                 messagebox.showerror("Error", "Seleccione un método válido")
                 return
+            alfa = float(self.input_fields['alfa'].get()) if metodo == "alfa" else None
             
             self.clear_output()
-            self.print_output("=== MÉTODO DEL PUNTO FIJO ===\n", '#00ffff')
-            self.print_output(f"f(x) = {f_str}", '#ffff00')
-            self.print_output(f"{g_descripcion}\n", '#00ff00')
-            
-            # Verificar condición de convergencia inicial
-            x_test = x0
-            try:
-                # Estimar |g'(x0)| numéricamente
-                h = 1e-6
-                g_prima_x0 = abs((g(x_test + h) - g(x_test - h)) / (2 * h))
-                self.print_output(f"|g'(x0)| ≈ {g_prima_x0:.6f}", '#ffff00')
-                if g_prima_x0 >= 1:
-                    self.print_output("⚠ Advertencia: |g'(x0)| ≥ 1, puede no converger\n", '#ff0000')
-                else:
-                    self.print_output("✓ |g'(x0)| < 1, se espera convergencia\n", '#00ff00')
-            except:
-                self.print_output("No se pudo verificar convergencia\n", '#ffff00')
-            
-            self.print_output(f"{'Iter':<8}{'x':<18}{'f(x)':<18}{'g(x)':<18}{'Error':<15}", '#ffff00')
-            self.print_output("-"*77, '#ffff00')
-            
-            x = x0
-            for i in range(max_iter):
-                try:
-                    f_x = f(x)
-                    x_nuevo = g(x)
-                    error = abs(x_nuevo - x)
-                    
-                    self.print_output(f"{i:<8}{x:<18.10f}{f_x:<18.10e}{x_nuevo:<18.10f}{error:<15.2e}")
-                    
-                    if error < tol:
-                        self.print_output(f"\n✓ Raíz encontrada: x = {x_nuevo:.10f}", '#00ff00')
-                        self.print_output(f"  f({x_nuevo:.10f}) = {f(x_nuevo):.2e}", '#00ff00')
-                        self.print_output(f"  Iteraciones: {i+1}", '#00ff00')
-                        self.print_output(f"  Error final: {error:.2e}", '#00ff00')
-                        return
-                    
-                    # Detectar divergencia
-                    if abs(x_nuevo) > 1e10:
-                        self.print_output(f"\n✗ Divergió: |x| > 10^10", '#ff0000')
-                        self.print_output(f"  Intente con otro método o valor inicial diferente", '#ff0000')
-                        return
-                    
-                    x = x_nuevo
-                    
-                except (ZeroDivisionError, OverflowError) as e:
-                    self.print_output(f"\n✗ Error numérico en iteración {i}: {str(e)}", '#ff0000')
-                    self.print_output(f"  Intente con otro método o valor inicial", '#ff0000')
-                    return
+            self.print_output("Calculando...", '#ffff00')
+            self.ejecutar_en_segundo_plano(
+                fixed_point, (f_str, x0, tol, max_iter, metodo, alfa),
+                lambda res: self.mostrar_punto_fijo(res, f_str, max_iter),
+                {'acelerar': self.acelerar_punto_fijo.get()})
             
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+    
+    def mostrar_punto_fijo(self, res, f_str, max_iter):
+        """Imprime la tabla de iteraciones y el resultado del punto fijo"""
+        self.clear_output()
+        self.print_output("=== MÉTODO DEL PUNTO FIJO ===\n", '#00ffff')
+        self.print_output(f"f(x) = {f_str}", '#ffff00')
+        self.print_output(f"{res.descripcion_g}\n", '#00ff00')
+        
+        # Condición de convergencia inicial
+        if res.g_prima_x0 is None:
+            self.print_output("No se pudo verificar convergencia\n", '#ffff00')
+        else:
+            self.print_output(f"|g'(x0)| ≈ {res.g_prima_x0:.6f}", '#ffff00')
+            if res.g_prima_x0 >= 1:
+                self.print_output("⚠ Advertencia: |g'(x0)| ≥ 1, puede no converger\n", '#ff0000')
+            else:
+                self.print_output("✓ |g'(x0)| < 1, se espera convergencia\n", '#00ff00')
+        
+        self.print_output(f"{'Iter':<8}{'x':<18}{'f(x)':<18}{'g(x)':<18}{'Error':<15}", '#ffff00')
+        self.print_output("-"*77, '#ffff00')
+        
+        for i, x, f_x, x_nuevo, error in res.historial:
+            self.print_output(f"{i:<8}{x:<18.10f}{f_x:<18.10e}{x_nuevo:<18.10f}{error:<15.2e}")
+        
+        if res.estado == 'convergio':
+            self.print_output(f"\n✓ Raíz encontrada: x = {res.raiz:.10f}", '#00ff00')
+            self.print_output(f"  f({res.raiz:.10f}) = {res.f_raiz:.2e}", '#00ff00')
+            self.print_output(f"  Iteraciones: {res.iteraciones}", '#00ff00')
+            self.print_output(f"  Evaluaciones de f: {res.evaluaciones}", '#00ff00')
+            self.print_output(f"  Error final: {res.error:.2e}", '#00ff00')
+        elif res.estado == 'divergio':
+            self.print_output(f"\n✗ Divergió: |x| > 10^10", '#ff0000')
+            self.print_output(f"  Intente con otro método o valor inicial diferente", '#ff0000')
+            self.print_output(f"  • Los métodos con intervalo [a, b] no pueden divergir", '#ffff00')
+        elif res.estado == 'error_numerico':
+            self.print_output(f"\n✗ {res.mensaje}", '#ff0000')
+            self.print_output(f"  Intente con otro método o valor inicial", '#ff0000')
+        else:
             self.print_output(f"\n⚠ No convergió en {max_iter} iteraciones", '#ff0000')
-            self.print_output(f"  Último valor: x = {x:.10f}", '#ff0000')
-            self.print_output(f"  f(x) = {f(x):.2e}", '#ff0000')
+            self.print_output(f"  Último valor: x = {res.raiz:.10f}", '#ff0000')
+            self.print_output(f"  f(x) = {res.f_raiz:.2e}", '#ff0000')
             self.print_output(f"\n  Sugerencias:", '#ffff00')
             self.print_output(f"  • Intente otro valor inicial x0", '#ffff00')
             self.print_output(f"  • Pruebe otro método para generar g(x)", '#ffff00')
             self.print_output(f"  • Aumente el número de iteraciones", '#ffff00')
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+            self.print_output(f"  • Active la aceleración de Steffensen o use Brent en [a, b]", '#ffff00')
+    
+    def leer_valores(self, texto):
+        """'inicio:fin:cantidad' (equiespaciados) o 'v1, v2, ...' como arreglo; None si está vacío"""
+        texto = texto.strip()
+        if not texto:
+            return None
+        if ':' in texto:
+            inicio, fin, cantidad = texto.split(':')
+            return np.linspace(float(inicio), float(fin), int(cantidad))
+        return np.array([float(v) for v in texto.split(',')])
+    
+    def calcular_raices_lote(self, f_str, x0, parametros, tol, max_iter, metodo):
+        """Punto fijo para todos los x0 / valores de p a la vez (raices_lote)"""
+        if metodo not in ("alfa", "newton"):
+            messagebox.showerror("Error", "El modo por lotes usa g(x) = x + α*f(x) o Newton")
+            return
+        if parametros is not None and len(x0) > 1 and len(x0) != len(parametros):
+            messagebox.showerror("Error", "Indique un x0 o tantos x0 como valores de p")
+            return
+        alfa = float(self.input_fields['alfa'].get()) if metodo == "alfa" else None
+        
+        self.clear_output()
+        self.print_output("Calculando...", '#ffff00')
+        self.ejecutar_en_segundo_plano(
+            raices_lote, (f_str, x0, parametros, tol, max_iter, metodo, alfa),
+            lambda res: self.mostrar_raices_lote(res, f_str, x0, parametros, max_iter),
+            {'acelerar': self.acelerar_punto_fijo.get()})
+    
+    def mostrar_raices_lote(self, res, f_str, x0, parametros, max_iter):
+        """Primeros carriles del lote y resumen de convergencia"""
+        self.clear_output()
+        self.print_output("=== PUNTO FIJO POR LOTES ===\n", '#00ffff')
+        self.print_output(f"f(x) = {f_str}", '#ffff00')
+        self.print_output(f"{res.descripcion_g}\n", '#00ff00')
+        
+        self.print_output(f"{'Carril':<8}{'p':<14}{'x0':<14}{'Raíz':<20}{'f(raíz)':<14}{'Iter':<6}", '#ffff00')
+        self.print_output("-"*76, '#ffff00')
+        x0 = np.broadcast_to(x0, res.raices.shape)
+        mostrar = min(res.carriles, 10)
+        for k in range(mostrar):
+            p = f"{parametros[k]:.6g}" if parametros is not None else "-"
+            estado = "" if res.convergio[k] else (" ✗" if res.divergio[k] else " ⚠")
+            self.print_output(f"{k:<8}{p:<14}{x0[k]:<14.6g}{res.raices[k]:<20.12f}"
+                              f"{res.f_raices[k]:<14.2e}{res.iteraciones[k]:<6}{estado}")
+        if res.carriles > mostrar:
+            self.print_output(f"... ({res.carriles - mostrar} carriles más)")
+        
+        convergidos = int(res.convergio.sum())
+        divergidos = int(res.divergio.sum())
+        color = '#00ff00' if convergidos == res.carriles else '#ffff00'
+        self.print_output(f"\n✓ Convergieron {convergidos} de {res.carriles} carriles", color)
+        if divergidos:
+            self.print_output(f"  ✗ Divergieron: {divergidos}", '#ff0000')
+        pendientes = res.carriles - convergidos - divergidos
+        if pendientes:
+            self.print_output(f"  ⚠ Sin converger en {max_iter} iteraciones: {pendientes}", '#ff0000')
+        self.print_output(f"  Iteraciones: mín {res.iteraciones.min()}, media {res.iteraciones.mean():.1f}, "
+                          f"máx {res.iteraciones.max()}", '#00ff00')
+        forma = "vectorizada" if res.vectorizado else "carril por carril"
+        self.print_output(f"  Evaluaciones de f ({forma}): {res.evaluaciones} "
+                          f"({res.evaluaciones / res.carriles:.1f} por carril)", '#00ff00')
     
-    # ============ MÉTODO 5: SEGUNDA DERIVADA ============
+    def calcular_raiz_intervalo(self, f_str, x0, tol, max_iter, metodo):
+        """Bisección, Illinois, Brent o Newton/secante protegido (buscar_raiz)"""
+        a_texto = self.input_fields['a'].get().strip()
+        b_texto = self.input_fields['b'].get().strip()
+        opciones = {'tol': tol, 'max_iter': max_iter}
+        if a_texto and b_texto:
+            opciones['a'], opciones['b'] = float(a_texto), float(b_texto)
+        elif metodo != "newton_protegido":
+            messagebox.showerror("Error", "Indique el intervalo [a, b]")
+            return
+        if metodo == "newton_protegido":
+            metodo = "newton"
+            opciones['x0'] = x0
+        
+        self.clear_output()
+        self.print_output("Calculando...", '#ffff00')
+        self.ejecutar_en_segundo_plano(buscar_raiz, (f_str, metodo),
+                                       lambda res: self.mostrar_raiz(res, f_str), opciones)
+    
+    def mostrar_raiz(self, res, f_str):
+        """Imprime las iteraciones y el resultado de un método de intervalo"""
+        self.clear_output()
+        self.print_output(f"=== {res.metodo.upper()} ===\n", '#00ffff')
+        self.print_output(f"f(x) = {f_str}\n", '#ffff00')
+        
+        self.print_output(f"{'Iter':<8}{'x':<22}{'f(x)':<20}{'Error':<15}", '#ffff00')
+        self.print_output("-"*65, '#ffff00')
+        for i, x, f_x, error in res.historial:
+            self.print_output(f"{i:<8}{x:<22.14f}{f_x:<20.10e}{error:<15.2e}")
+        
+        if res.estado == 'convergio':
+            self.print_output(f"\n✓ Raíz encontrada: x = {res.raiz:.14f}", '#00ff00')
+            self.print_output(f"  f(x) = {res.f_raiz:.2e}", '#00ff00')
+        elif res.estado == 'sin_cambio_signo':
+            self.print_output(f"\n✗ {res.mensaje}: no hay una raíz garantizada en [a, b]", '#ff0000')
+            return
+        elif res.estado == 'max_iter':
+            self.print_output(f"\n⚠ No convergió en {res.iteraciones} iteraciones", '#ff0000')
+            self.print_output(f"  Último valor: x = {res.raiz:.14f}, f(x) = {res.f_raiz:.2e}", '#ff0000')
+        else:
+            self.print_output(f"\n✗ {res.mensaje}", '#ff0000')
+            return
+        self.print_output(f"  Iteraciones: {res.iteraciones}", '#00ff00')
+        self.print_output(f"  Evaluaciones de f: {res.evaluaciones}", '#00ff00')
+        if res.evaluaciones_derivada:
+            self.print_output(f"  Evaluaciones de f': {res.evaluaciones_derivada}", '#00ff00')
+        if res.pasos_biseccion:
+            self.print_output(f"  Pasos de bisección de respaldo: {res.pasos_biseccion}", '#00ff00')
+        if res.intervalo is not None:
+            a, b = res.intervalo
+            self.print_output(f"  Intervalo final: [{a:.14f}, {b:.14f}]", '#00ff00')
+    
+    # ============ MÉTODO 5: DERIVACIÓN NUMÉRICA ============
     def derivada_ui(self):
         self.clear_input_frame()
         self.clear_output()
-        self.print_output("=== SEGUNDA DERIVADA NUMÉRICA ===\n", '#00ffff')
+        self.print_output("=== DERIVACIÓN NUMÉRICA ===\n", '#00ffff')
+        self.print_output("Orden 2 con h y plantilla mínima: fórmula clásica de 3 puntos", '#ffff00')
+        self.print_output("x0 = inicio:fin:cantidad deriva en muchos puntos a la vez", '#ffff00')
+        self.print_output("Datos de archivo: h = paso de muestreo (vacío = la columna 0 es x)\n", '#ffff00')
         
         self.input_fields['f'] = self.create_entry_field("f(x) =", 0, "x**3")
         self.input_fields['x0'] = self.create_entry_field("Punto x0:", 1, "1")
-        self.input_fields['h'] = self.create_entry_field("Paso h:", 2, "0.01")
+        self.input_fields['h'] = self.create_entry_field("Paso h (vacío = automático):", 2, "0.01")
+        self.input_fields['orden_derivada'] = self.create_entry_field("Orden de la derivada:", 3, "2")
+        self.input_fields['puntos'] = self.create_entry_field("Puntos de la plantilla (vacío = mínima):", 4, "")
+        self.input_fields['richardson'] = self.create_entry_field("Niveles de Richardson:", 5, "0")
         
         btn = tk.Button(self.input_frame, text="Calcular", command=self.calcular_derivada,
                        bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20, height=2)
-        btn.grid(row=3, column=0, columnspan=2, pady=20)
+        btn.grid(row=6, column=0, columnspan=2, pady=20)
+        
+        btn = tk.Button(self.input_frame, text="Derivar datos desde archivo", command=self.derivar_datos_archivo,
+                        bg='#4a4a4a', fg='white', font=('Arial', 11, 'bold'), width=24)
+        btn.grid(row=7, column=0, columnspan=2, pady=5)
         
         self.current_entry = self.input_fields['f']
         self.input_fields['f'].focus()
     
+    def derivar_datos_archivo(self):
+        """Deriva señales muestreadas de un archivo por bloques y guarda las derivadas en un .npy"""
+        try:
+            h_texto = self.input_fields['h'].get().strip()
+            h = float(h_texto) if h_texto else None
+            orden = int(self.input_fields['orden_derivada'].get())
+            if orden not in (1, 2):
+                raise ValueError("Para datos tabulados el orden debe ser 1 o 2")
+            tipos = [("Muestras", "*.npy *.csv *.txt *.dat"), ("Todos", "*.*")]
+            entrada = filedialog.askopenfilename(title="Archivo de muestras", filetypes=tipos)
+            if not entrada:
+                return
+            salida = filedialog.asksaveasfilename(title="Guardar derivadas", defaultextension=".npy",
+                                                  filetypes=[("NumPy", "*.npy")])
+            if not salida:
+                return
+            
+            self.clear_output()
+            self.print_output("Calculando...", '#ffff00')
+            self.ejecutar_en_segundo_plano(
+                derivar_archivo, (entrada, salida, h, orden),
+                lambda res: self.mostrar_derivadas_archivo(res, entrada))
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+    
+    def mostrar_derivadas_archivo(self, res, entrada):
+        self.clear_output()
+        self.print_output("=== RESULTADOS ===\n", '#00ffff')
+        nombre = "f'" if res.orden == 1 else "f''"
+        malla = "uniforme" if res.uniforme else "no uniforme (columna 0 = x)"
+        self.print_output(f"Muestras: {entrada}", '#ffff00')
+        self.print_output(f"Malla {malla}, plantilla central de 3 puntos\n", '#ffff00')
+        
+        senales = min(res.senales, self.MAX_COLUMNAS_X)
+        inicio = 0 if res.uniforme else 1
+        encabezado = ("" if res.uniforme else f"{'x':<16}") + "".join(
+            f"{nombre + f'[{k}]':<20}" for k in range(senales))
+        self.print_output(encabezado, '#ffff00')
+        self.print_output("-"*len(encabezado), '#ffff00')
+        mostrar = min(res.filas, 10)
+        for fila in res.datos[:mostrar]:
+            texto = "" if res.uniforme else f"{fila[0]:<16.8g}"
+            self.print_output(texto + "".join(f"{v:<20.10g}" for v in fila[inicio:inicio + senales]))
+        if res.filas > mostrar:
+            self.print_output(f"... ({res.filas - mostrar} filas más)")
+        self.print_output(f"\n✓ {nombre} de {res.senales} señal(es) en {res.filas} muestras", '#00ff00')
+        self.print_output(f"  Derivadas guardadas en: {res.ruta}", '#00ff00')
+    
     def calcular_derivada(self):
         try:
             f_str = self.input_fields['f'].get()
-            x0 = float(self.input_fields['x0'].get())
-            h = float(self.input_fields['h'].get())
-            
-            f = lambda x: eval(f_str)
-            
-            f_mas = f(x0 + h)
-            f_centro = f(x0)
-            f_menos = f(x0 - h)
+            x0 = self.leer_valores(self.input_fields['x0'].get())
+            h_texto = self.input_fields['h'].get().strip()
+            h = float(h_texto) if h_texto else None
+            orden = int(self.input_fields['orden_derivada'].get())
+            puntos_texto = self.input_fields['puntos'].get().strip()
+            puntos = int(puntos_texto) if puntos_texto else None
+            richardson = int(self.input_fields['richardson'].get())
+            
+            if orden != 2 or puntos is not None or richardson or h is None or len(x0) > 1:
+                self.clear_output()
+                self.print_output("Calculando...", '#ffff00')
+                self.ejecutar_en_segundo_plano(
+                    derivada, (f_str, x0 if len(x0) > 1 else float(x0[0]), orden, puntos),
+                    lambda res: self.mostrar_diferencias(res, f_str),
+                    {'h': h, 'richardson': richardson})
+                return
+            x0 = float(x0[0])
             
-            f_segunda = (f_mas - 2*f_centro + f_menos) / (h**2)
+            res = second_derivative(f_str, x0, h)
             
             self.clear_output()
             self.print_output("=== RESULTADOS ===\n", '#00ffff')
             self.print_output(f"✓ Segunda derivada:", '#00ff00')
-            self.print_output(f"  f''({x0}) ≈ {f_segunda:.10f}", '#00ff00')
+            self.print_output(f"  f''({x0}) ≈ {res.valor:.10f}", '#00ff00')
             self.print_output(f"\nValores utilizados:", '#ffff00')
-            self.print_output(f"  f({x0-h:.4f}) = {f_menos:.8f}")
-            self.print_output(f"  f({x0:.4f}) = {f_centro:.8f}")
-            self.print_output(f"  f({x0+h:.4f}) = {f_mas:.8f}")
+            self.print_output(f"  f({x0-h:.4f}) = {res.f_menos:.8f}")
+            self.print_output(f"  f({x0:.4f}) = {res.f_centro:.8f}")
+            self.print_output(f"  f({x0+h:.4f}) = {res.f_mas:.8f}")
+            if res.exacta is not None:
+                self.print_output(f"\nDerivación automática (hiperduales):", '#ffff00')
+                self.print_output(f"  f''({x0}) = {res.exacta:.10f}", '#00ff00')
+                self.print_output(f"  Error de la fórmula de 3 puntos: {abs(res.valor - res.exacta):.2e}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al calcular: {str(e)}")
     
+    def mostrar_diferencias(self, res, f_str):
+        """Derivada por diferencias finitas (uno o muchos puntos) con su error estimado"""
+        self.clear_output()
+        self.print_output("=== RESULTADOS ===\n", '#00ffff')
+        self.print_output(f"f(x) = {f_str}", '#ffff00')
+        nombre = "f" + "'" * res.orden if res.orden <= 3 else f"f^({res.orden})"
+        extrapolacion = f", Richardson con {res.richardson} niveles" if res.richardson else ""
+        self.print_output(f"Plantilla de {len(res.nodos)} puntos, error O(h^{res.precision}){extrapolacion}\n",
+                          '#ffff00')
+        
+        if np.ndim(res.valor) == 0:
+            self.print_output(f"{'Nodo (×h)':<12}{'Peso (×h^-' + str(res.orden) + ')':<20}", '#ffff00')
+            self.print_output("-"*32, '#ffff00')
+            for nodo, peso in zip(res.nodos, res.pesos):
+                self.print_output(f"{nodo:<12}{peso:<20.10g}")
+            self.print_output(f"\n✓ {nombre}({res.x0}) ≈ {res.valor:.12f}", '#00ff00')
+            self.print_output(f"  Error estimado: {res.error:.2e}", '#00ff00')
+            self.print_output(f"  Paso h: {res.h:.3e}", '#00ff00')
+        else:
+            self.print_output(f"{'x0':<16}{nombre + '(x0)':<22}{'Error est.':<14}{'h':<12}", '#ffff00')
+            self.print_output("-"*64, '#ffff00')
+            mostrar = min(len(res.x0), 10)
+            for k in range(mostrar):
+                self.print_output(f"{res.x0[k]:<16.8g}{res.valor[k]:<22.12f}{res.error[k]:<14.2e}{res.h[k]:<12.3e}")
+            if len(res.x0) > mostrar:
+                self.print_output(f"... ({len(res.x0) - mostrar} puntos más)")
+            self.print_output(f"\n✓ Derivada en {len(res.x0)} puntos", '#00ff00')
+            self.print_output(f"  Error estimado máximo: {np.nanmax(res.error):.2e}", '#00ff00')
+        self.print_output(f"  Evaluaciones de f: {res.evaluaciones}", '#00ff00')
+    
     # ============ MÉTODO 6: RUNGE-KUTTA ============
     def rk_ui(self):
         self.clear_input_frame()
         self.clear_output()
-        self.print_output("=== RUNGE-KUTTA 2DO ORDEN (EDO 1er Orden) ===\n", '#00ffff')
+        self.print_output("=== RUNGE-KUTTA (EDO 1er Orden) ===\n", '#00ffff')
         self.print_output("Resolver: y' = f(t, y)\n", '#ffff00')
         
         self.input_fields['f'] = self.create_entry_field("f(t, y) =", 0, "-2*y")
         self.input_fields['t0'] = self.create_entry_field("t inicial:", 1, "0")
         self.input_fields['y0'] = self.create_entry_field("y(t0):", 2, "1")
         self.input_fields['tf'] = self.create_entry_field("t final:", 3, "2")
-        self.input_fields['h'] = self.create_entry_field("Paso h:", 4, "0.1")
+        self.input_fields['h'] = self.create_entry_field("Paso h (paso fijo):", 4, "0.1")
+        
+        self.metodo_edo = self.crear_selector_metodo_edo(5, [("RK2 punto medio (paso fijo h)", "rk2")])
+        self.crear_campos_ensamble(9)
+        self.crear_campos_almacenamiento(12)
+        self.crear_campos_eventos(14)
         
         btn = tk.Button(self.input_frame, text="Calcular", command=self.calcular_rk,
                        bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20, height=2)
-        btn.grid(row=5, column=0, columnspan=2, pady=20)
+        btn.grid(row=17, column=0, columnspan=2, pady=20)
         
         self.current_entry = self.input_fields['f']
         self.input_fields['f'].focus()
@@ -474,54 +810,73 @@ class MetodosNumericosUI:
             y0 = float(self.input_fields['y0'].get())
             tf = float(self.input_fields['tf'].get())
             h = float(self.input_fields['h'].get())
-            
-            f = lambda t, y: eval(f_str)
-            
-            n_pasos = int((tf - t0) / h)
-            
-            t = np.zeros(n_pasos + 1)
-            y = np.zeros(n_pasos + 1)
-            
-            t[0] = t0
-            y[0] = y0
+            ensamble = self.leer_ensamble([y0], 'rk2', int((tf - t0) / h))
+            eventos = self.leer_eventos()
             
             self.clear_output()
-            self.print_output("=== RESULTADOS ===\n", '#00ffff')
-            self.print_output(f"{'Paso':<8}{'t':<15}{'y':<18}", '#ffff00')
-            self.print_output("-"*41, '#ffff00')
-            
-            # Runge-Kutta de 2do orden
-            for i in range(n_pasos):
-                k1 = f(t[i], y[i])
-                t_mid = t[i] + h/2
-                y_mid = y[i] + (h/2) * k1
-                k2 = f(t_mid, y_mid)
-                
-                t[i+1] = t[i] + h
-                y[i+1] = y[i] + h * k2
-                
-                if (i+1) % max(1, n_pasos // 10) == 0 or i == n_pasos - 1:
-                    self.print_output(f"{i+1:<8}{t[i+1]:<15.6f}{y[i+1]:<18.10f}")
-            
-            self.print_output(f"\n✓ Solución encontrada:", '#00ff00')
-            self.print_output(f"  y({tf}) ≈ {y[-1]:.10f}", '#00ff00')
-            self.print_output(f"  Pasos totales: {n_pasos}", '#00ff00')
-            
-            # Mostrar gráfica
-            self.mostrar_grafica_rk(t, y)
+            self.print_output("Calculando...", '#ffff00')
+            if ensamble is not None:
+                Y0, opciones = ensamble
+                self.ejecutar_en_segundo_plano(ensamble_edo, (f_str, Y0[:, 0], t0, tf, h),
+                                               lambda res: self.mostrar_ensamble(res, tf), opciones)
+            elif self.metodo_edo.get() == 'rk2':
+                self.ejecutar_en_segundo_plano(rk2, (f_str, t0, y0, tf, h),
+                                               lambda res: self.mostrar_rk(res, tf),
+                                               {**self.leer_almacenamiento(), 'eventos': eventos})
+            else:
+                self.ejecutar_en_segundo_plano(dopri45, (f_str, t0, y0, tf),
+                                               lambda res: self.mostrar_rk(res, tf),
+                                               {**self.leer_tolerancias_edo(), 'eventos': eventos})
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al calcular: {str(e)}")
     
-    def mostrar_grafica_rk(self, t, y):
-        """Muestra la gráfica de Runge-Kutta"""
+    def mostrar_rk(self, res, tf):
+        """Imprime la tabla de Runge-Kutta y muestra la gráfica"""
+        t, y, n_pasos = res.t, res.y, res.n_pasos
+        
+        self.clear_output()
+        self.print_output("=== RESULTADOS ===\n", '#00ffff')
+        self.print_output(f"{'Paso':<8}{'t':<15}{'y':<18}", '#ffff00')
+        self.print_output("-"*41, '#ffff00')
+        
+        for paso, j in self.filas_tabla_edo(res):
+            self.print_output(f"{paso:<8}{t[j]:<15.6f}{y[j]:<18.10f}")
+        
+        self.print_output(f"\n✓ Solución encontrada:", '#00ff00')
+        t_final = tf if res.evento_terminal is None else f"{t[-1]:.6f}"
+        self.print_output(f"  y({t_final}) ≈ {y[-1]:.10f}", '#00ff00')
+        self.print_output(f"  Pasos totales: {n_pasos}", '#00ff00')
+        self.imprimir_estadisticas_edo(res)
+        
+        # Mostrar gráfica
+        if res.trayectoria is not None:
+            t, y = res.trayectoria.submuestrear(self.MAX_PUNTOS_GRAFICA)
+            y = y[:, 0]
+        self.mostrar_grafica_rk(t, y, res.densa)
+    
+    def mostrar_grafica_rk(self, t, y, densa=None):
+        """Muestra la gráfica de Runge-Kutta (con salida densa si el método la tiene)
+
+        Si y es una matriz (puntos × trayectorias) se superponen las
+        trayectorias del ensamble.
+        """
         top = tk.Toplevel(self.root)
         top.title("Gráfica - Runge-Kutta")
         top.geometry("800x600")
         
         fig = Figure(figsize=(8, 6), dpi=100)
         ax = fig.add_subplot(111)
-        ax.plot(t, y, 'b-', linewidth=2, marker='o', markersize=4, label='y(t)')
+        if y.ndim == 2:
+            familia = y[:, :self.MAX_TRAYECTORIAS_GRAFICA]
+            ax.plot(t, familia, 'b-', linewidth=0.8, alpha=self.transparencia_familia(familia.shape[1]))
+            ax.plot([], [], 'b-', label=f'y(t): {familia.shape[1]} de {y.shape[1]} trayectorias')
+        elif densa is not None:
+            t_fino = np.linspace(t[0], t[-1], 1000)
+            ax.plot(t_fino, densa(t_fino), 'b-', linewidth=2, label='y(t) (salida densa)')
+            ax.plot(t, y, 'o', color='orange', markersize=4, label='pasos aceptados')
+        else:
+            ax.plot(t, y, 'b-', linewidth=2, marker='o', markersize=4, label='y(t)')
         ax.set_xlabel('t', fontsize=12)
         ax.set_ylabel('y', fontsize=12)
         ax.set_title("Solución de la EDO: y' = f(t, y)", fontsize=14)
@@ -532,12 +887,162 @@ class MetodosNumericosUI:
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
+    def crear_selector_metodo_edo(self, row, metodos_fijos):
+        """Radios de método (paso fijo + adaptativo) y campos rtol/atol a partir de la fila row"""
+        tk.Label(self.input_frame, text="Método:", 
+                bg='#2b2b2b', fg='#00ffff', font=('Arial', 10, 'bold')).grid(
+                row=row, column=0, columnspan=2, pady=5, sticky='w', padx=5)
+        
+        metodo = tk.StringVar(value=metodos_fijos[0][1])
+        
+        rb_frame = tk.Frame(self.input_frame, bg='#2b2b2b')
+        rb_frame.grid(row=row+1, column=0, columnspan=2, sticky='w', padx=5)
+        
+        for texto, valor in metodos_fijos + [("Dormand-Prince RK45 (paso adaptativo)", "dopri45")]:
+            tk.Radiobutton(rb_frame, text=texto, variable=metodo, value=valor,
+                           bg='#2b2b2b', fg='white', selectcolor='#4a4a4a', 
+                           font=('Arial', 9)).pack(anchor='w')
+        
+        self.input_fields['rtol'] = self.create_entry_field("rtol (adaptativo):", row+2, "1e-6")
+        self.input_fields['atol'] = self.create_entry_field("atol (adaptativo):", row+3, "1e-9")
+        return metodo
+    
+    def leer_tolerancias_edo(self):
+        return {'rtol': float(self.input_fields['rtol'].get()),
+                'atol': float(self.input_fields['atol'].get())}
+    
+    def imprimir_estadisticas_edo(self, res):
+        """Pasos aceptados/rechazados y evaluaciones de f de los métodos adaptativos"""
+        if res.aceptados is not None:
+            self.print_output(f"  Pasos aceptados: {res.aceptados}, rechazados: {res.rechazados}", '#00ff00')
+        if res.evaluaciones is not None:
+            self.print_output(f"  Evaluaciones de f: {res.evaluaciones}", '#00ff00')
+        if res.jacobianos is not None:
+            self.print_output(f"  Jacobianos: {res.jacobianos}, factorizaciones LU: {res.factorizaciones}", '#00ff00')
+        if res.iteraciones_newton is not None:
+            self.print_output(f"  Iteraciones de Newton: {res.iteraciones_newton}", '#00ff00')
+        if res.guardar_cada > 1:
+            self.print_output(f"  Puntos guardados: {len(res.t)} (1 de cada {res.guardar_cada} pasos)", '#00ff00')
+        if res.trayectoria is not None and res.trayectoria.ruta is not None:
+            self.print_output(f"  Trayectoria guardada en: {res.trayectoria.ruta}", '#00ff00')
+        if res.eventos:
+            self.print_output(f"\n{'Evento':<8}{'t':<20}y", '#ffff00')
+            self.print_output("-"*50, '#ffff00')
+            for k, t_e, y_e in res.eventos[:50]:
+                valores = ", ".join(f"{v:.10f}" for v in np.atleast_1d(y_e))
+                self.print_output(f"{k:<8}{t_e:<20.12f}{valores}")
+            if len(res.eventos) > 50:
+                self.print_output(f"... ({len(res.eventos) - 50} eventos más)")
+        if res.evento_terminal is not None:
+            self.print_output(f"\n⚠ Integración detenida por el evento {res.evento_terminal} en t = {res.t[-1]:.12f}",
+                              '#ffff00')
+    
+    def crear_campos_almacenamiento(self, row):
+        """Campos de la trayectoria de paso fijo: decimación y archivo .npy (filas row, row+1)"""
+        self.input_fields['guardar_cada'] = self.create_entry_field("Guardar 1 de cada k pasos (paso fijo):", row, "1")
+        self.input_fields['archivo_trayectoria'] = self.create_entry_field(
+            "Archivo .npy de la trayectoria (opcional):", row+1, "")
+    
+    def leer_almacenamiento(self):
+        archivo = self.input_fields['archivo_trayectoria'].get().strip()
+        return {'guardar_cada': int(self.input_fields['guardar_cada'].get()),
+                'archivo': archivo or None}
+    
+    def filas_tabla_edo(self, res):
+        """(paso, fila) de unos 10 renglones de la trayectoria, sin recorrerla toda"""
+        filas = len(res.t) - 1
+        salto = max(1, filas // 10)
+        indices = list(range(salto, filas + 1, salto))
+        if indices and indices[-1] != filas:
+            indices.append(filas)
+        return [(min(j * res.guardar_cada, res.n_pasos), j) for j in indices]
+    
+    def crear_campos_ensamble(self, row):
+        """Campos del modo ensamble (filas row .. row+2)"""
+        self.input_fields['trayectorias'] = self.create_entry_field("Trayectorias (ensamble):", row, "1")
+        self.input_fields['dispersion'] = self.create_entry_field("Dispersión de y₀ (±, ensamble):", row+1, "0.5")
+        self.input_fields['procesos_ensamble'] = self.create_entry_field("Procesos (ensamble):", row+2, "1")
+    
+    def crear_campos_eventos(self, row):
+        """Campos de eventos g(t, y) = 0 (filas row .. row+2)"""
+        self.input_fields['eventos'] = self.create_entry_field("Eventos g(t, y) = 0 (separados por ;):", row, "")
+        self.input_fields['direccion_eventos'] = self.create_entry_field(
+            "Dirección de los eventos (+, - o ambas):", row+1, "ambas")
+        self.detener_en_evento = tk.BooleanVar(value=True)
+        tk.Checkbutton(self.input_frame, text="Detener la integración en el primer evento",
+                       variable=self.detener_en_evento, bg='#2b2b2b', fg='white',
+                       selectcolor='#4a4a4a', font=('Arial', 9)).grid(
+                       row=row+2, column=0, columnspan=2, sticky='w', padx=5)
+    
+    def leer_eventos(self):
+        """Lista de Evento a partir de los campos, o None si no se escribió ninguno"""
+        fuentes = [g.strip() for g in self.input_fields['eventos'].get().split(';') if g.strip()]
+        if not fuentes:
+            return None
+        if int(self.input_fields['trayectorias'].get()) > 1:
+            raise ValueError("Los eventos no están disponibles en el modo ensamble")
+        texto = self.input_fields['direccion_eventos'].get().strip()
+        direccion = {'+': 1, '-': -1}.get(texto, 0)
+        return [Evento(g, terminal=self.detener_en_evento.get(), direccion=direccion) for g in fuentes]
+    
+    def leer_ensamble(self, y0, metodo, n_pasos):
+        """(Y0, opciones) para ensamble_edo, o None si hay una sola trayectoria
+
+        Las condiciones iniciales son y0 más una perturbación uniforme en
+        ±dispersión (semilla fija); la primera trayectoria parte de y0.
+        """
+        m = int(self.input_fields['trayectorias'].get())
+        if m <= 1:
+            return None
+        if self.metodo_edo.get() != metodo:
+            raise ValueError("El modo ensamble sólo está disponible con el método explícito de paso fijo")
+        dispersion = float(self.input_fields['dispersion'].get())
+        perturbacion = np.random.default_rng(0).uniform(-dispersion, dispersion, (m, len(y0)))
+        perturbacion[0] = 0.0
+        opciones = {'metodo': metodo,
+                    'procesos': int(self.input_fields['procesos_ensamble'].get()),
+                    'guardar_cada': max(int(self.input_fields['guardar_cada'].get()),
+                                        -(-n_pasos // self.MAX_PUNTOS_ENSAMBLE))}
+        return np.asarray(y0, dtype=float) + perturbacion, opciones
+    
+    def transparencia_familia(self, trayectorias):
+        return min(1.0, max(0.05, 10.0 / trayectorias))
+    
+    def mostrar_ensamble(self, res, tf, n=None):
+        """Valores finales del ensamble (por trayectoria, media y desviación) y gráfica"""
+        self.clear_output()
+        self.print_output(f"=== {res.metodo.upper()} ===\n", '#00ffff')
+        finales = res.y[-1].reshape(res.trayectorias, -1)
+        componentes = ['y'] if n is None else [f"y[{j}]" for j in range(n)]
+        
+        header = f"{'Tray.':<8}" + "".join(f"{c + '(' + str(tf) + ')':<18}" for c in componentes)
+        self.print_output(header, '#ffff00')
+        self.print_output("-"*(8 + 18*len(componentes)), '#ffff00')
+        mostrar = min(res.trayectorias, 10)
+        for k in range(mostrar):
+            self.print_output(f"{k:<8}" + "".join(f"{v:<18.10f}" for v in finales[k]))
+        if res.trayectorias > mostrar:
+            self.print_output(f"... ({res.trayectorias - mostrar} trayectorias más)")
+        
+        self.print_output(f"\n✓ Ensamble resuelto:", '#00ff00')
+        for j, c in enumerate(componentes):
+            self.print_output(f"  {c}({tf}): media {finales[:, j].mean():.10f}, "
+                              f"desviación {finales[:, j].std():.3e}", '#00ff00')
+        self.print_output(f"  Trayectorias: {res.trayectorias}, pasos: {res.n_pasos}", '#00ff00')
+        forma = "vectorizado" if res.vectorizado else "trayectoria por trayectoria"
+        self.print_output(f"  Lado derecho {forma}: {res.evaluaciones} evaluaciones del ensamble", '#00ff00')
+        
+        if n is None:
+            self.mostrar_grafica_rk(res.t, res.y)
+        else:
+            self.mostrar_grafica_sistema(res.t, res.y, n, res.metodo)
+    
     # ============ MÉTODO 7: SISTEMA DE EDO ============
     # ============ MÉTODO 7: SISTEMA DE EDO CON EULER ============
     def sistema_edo_ui(self):
         self.clear_input_frame()
         self.clear_output()
-        self.print_output("=== SISTEMA DE EDO - MÉTODO DE EULER ===\n", '#00ffff')
+        self.print_output("=== SISTEMA DE EDO ===\n", '#00ffff')
         self.print_output("Resolver sistema: y'₁ = f₁(t, y₁, y₂, ...)", '#ffff00')
         self.print_output("                  y'₂ = f₂(t, y₁, y₂, ...)", '#ffff00')
         self.print_output("                  ...\n", '#ffff00')
@@ -586,11 +1091,21 @@ class MetodosNumericosUI:
             # Parámetros temporales
             self.input_fields['t0_sistema'] = self.create_entry_field("t inicial:", 2*n+3, "0")
             self.input_fields['tf_sistema'] = self.create_entry_field("t final:", 2*n+4, "10")
-            self.input_fields['h_sistema'] = self.create_entry_field("Paso h:", 2*n+5, "0.01")
-            
-            btn = tk.Button(self.input_frame, text="Resolver con Euler", command=self.calcular_sistema_edo,
+            self.input_fields['h_sistema'] = self.create_entry_field("Paso h (paso fijo):", 2*n+5, "0.01")
+            
+            self.metodo_edo = self.crear_selector_metodo_edo(2*n+6, [
+                ("Euler explícito (paso fijo h)", "euler"),
+                ("Euler implícito - rígidos (paso fijo h)", "backward_euler"),
+                ("BDF2 - rígidos (paso fijo h)", "bdf2"),
+                ("Rosenbrock-W ROS2 - rígidos (paso fijo h)", "rosenbrock_w"),
+            ])
+            self.crear_campos_ensamble(2*n+10)
+            self.crear_campos_almacenamiento(2*n+13)
+            self.crear_campos_eventos(2*n+15)
+            
+            btn = tk.Button(self.input_frame, text="Resolver", command=self.calcular_sistema_edo,
                         bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20, height=2)
-            btn.grid(row=2*n+6, column=0, columnspan=2, pady=20)
+            btn.grid(row=2*n+18, column=0, columnspan=2, pady=20)
             
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -602,73 +1117,85 @@ class MetodosNumericosUI:
             # Leer funciones
             funciones_str = [self.input_fields['funciones'][i].get() for i in range(n)]
             
-            # Crear función del sistema
-            def sistema(t, y):
-                dydt = np.zeros(n)
-                for i in range(n):
-                    dydt[i] = eval(funciones_str[i])
-                return dydt
-            
             # Condiciones iniciales
             y0 = np.array([float(self.input_fields['y0_vals'][i].get()) for i in range(n)])
             
             t0 = float(self.input_fields['t0_sistema'].get())
             tf = float(self.input_fields['tf_sistema'].get())
             h = float(self.input_fields['h_sistema'].get())
-            
-            n_pasos = int((tf - t0) / h)
-            
-            t = np.zeros(n_pasos + 1)
-            y_vals = np.zeros((n_pasos + 1, n))
-            
-            t[0] = t0
-            y_vals[0] = y0
+            ensamble = self.leer_ensamble(y0, 'euler', int((tf - t0) / h))
+            eventos = self.leer_eventos()
             
             self.clear_output()
-            self.print_output("=== MÉTODO DE EULER ===\n", '#00ffff')
-            
-            # Encabezado
-            header = f"{'Paso':<8}{'t':<12}"
-            for i in range(n):
-                header += f"{'y['+str(i)+']':<15}"
-            self.print_output(header, '#ffff00')
-            self.print_output("-"*(20 + 15*n), '#ffff00')
-            
-            # Método de Euler para sistemas
-            # y_{n+1} = y_n + h * f(t_n, y_n)
-            for i in range(n_pasos):
-                y = y_vals[i]  # Estado actual
-                
-                # Calcular derivadas en el punto actual
-                dydt = sistema(t[i], y)
-                
-                # Actualizar usando Euler
-                t[i+1] = t[i] + h
-                y_vals[i+1] = y + h * dydt
-                
-                # Mostrar cada 10% de los pasos o el último
-                if (i+1) % max(1, n_pasos // 10) == 0 or i == n_pasos - 1:
-                    line = f"{i+1:<8}{t[i+1]:<12.4f}"
-                    for j in range(n):
-                        line += f"{y_vals[i+1][j]:<15.8f}"
-                    self.print_output(line)
-            
-            self.print_output(f"\n✓ Sistema resuelto exitosamente:", '#00ff00')
-            for i in range(n):
-                self.print_output(f"  y[{i}]({tf}) ≈ {y_vals[-1][i]:.10f}", '#00ff00')
-            self.print_output(f"  Pasos totales: {n_pasos}", '#00ff00')
-            self.print_output(f"  Método: Euler (orden 1)", '#00ff00')
-            
-            # Mostrar gráfica
-            self.mostrar_grafica_sistema(t, y_vals, n)
+            self.print_output("Calculando...", '#ffff00')
+            if ensamble is not None:
+                Y0, opciones = ensamble
+                self.ejecutar_en_segundo_plano(ensamble_edo, (funciones_str, Y0, t0, tf, h),
+                                               lambda res: self.mostrar_ensamble(res, tf, n), opciones)
+                return
+            metodos_paso_fijo = {'euler': euler_system, 'backward_euler': backward_euler,
+                                 'bdf2': bdf2, 'rosenbrock_w': rosenbrock_w}
+            if self.metodo_edo.get() in metodos_paso_fijo:
+                self.ejecutar_en_segundo_plano(metodos_paso_fijo[self.metodo_edo.get()],
+                                               (funciones_str, y0, t0, tf, h),
+                                               lambda res: self.mostrar_sistema_edo(res, n, tf),
+                                               {**self.leer_almacenamiento(), 'eventos': eventos})
+            else:
+                self.ejecutar_en_segundo_plano(dopri45, (funciones_str, t0, y0, tf),
+                                               lambda res: self.mostrar_sistema_edo(res, n, tf),
+                                               {**self.leer_tolerancias_edo(), 'eventos': eventos})
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+    
+    def mostrar_sistema_edo(self, res, n, tf):
+        """Imprime la tabla del sistema de EDO y muestra las gráficas"""
+        t, y_vals, n_pasos = res.t, res.y, res.n_pasos
+        
+        self.clear_output()
+        self.print_output(f"=== {res.metodo.upper()} ===\n", '#00ffff')
+        
+        # Encabezado
+        header = f"{'Paso':<8}{'t':<12}"
+        for i in range(n):
+            header += f"{'y['+str(i)+']':<15}"
+        self.print_output(header, '#ffff00')
+        self.print_output("-"*(20 + 15*n), '#ffff00')
+        
+        # Mostrar cada 10% de los pasos o el último
+        for paso, fila in self.filas_tabla_edo(res):
+            line = f"{paso:<8}{t[fila]:<12.4f}"
+            for j in range(n):
+                line += f"{y_vals[fila][j]:<15.8f}"
+            self.print_output(line)
+        
+        self.print_output(f"\n✓ Sistema resuelto exitosamente:", '#00ff00')
+        t_final = tf if res.evento_terminal is None else f"{t[-1]:.6f}"
+        for i in range(n):
+            self.print_output(f"  y[{i}]({t_final}) ≈ {y_vals[-1][i]:.10f}", '#00ff00')
+        self.print_output(f"  Pasos totales: {n_pasos}", '#00ff00')
+        self.print_output(f"  Método: {res.metodo}", '#00ff00')
+        self.imprimir_estadisticas_edo(res)
+        
+        # Mostrar gráfica
+        if res.densa is not None:
+            t_fino = np.linspace(t[0], t[-1], 2000)
+            self.mostrar_grafica_sistema(t_fino, res.densa(t_fino), n, res.metodo)
+        elif res.trayectoria is not None:
+            self.mostrar_grafica_sistema(*res.trayectoria.submuestrear(self.MAX_PUNTOS_GRAFICA), n, res.metodo)
+        else:
+            self.mostrar_grafica_sistema(t, y_vals, n, res.metodo)
+
+    def mostrar_grafica_sistema(self, t, y, n, metodo="Euler"):
+        """Muestra la gráfica del sistema de EDO
 
-    def mostrar_grafica_sistema(self, t, y, n):
-        """Muestra la gráfica del sistema de EDO"""
+        y es (puntos, n) o, en modo ensamble, (puntos, trayectorias, n): en
+        ese caso se superpone la familia de trayectorias en cada gráfica.
+        """
+        if y.ndim == 3:
+            return self.mostrar_grafica_ensamble(t, y, n, metodo)
         top = tk.Toplevel(self.root)
-        top.title("Gráfica - Sistema de EDO (Euler)")
+        top.title(f"Gráfica - Sistema de EDO ({metodo})")
         top.geometry("1000x600")
         
         # Determinar configuración de subplots
@@ -694,7 +1221,7 @@ class MetodosNumericosUI:
                 linewidth=2, label=f'y[{i}](t)')
             ax.set_xlabel('t', fontsize=11)
             ax.set_ylabel(f'y[{i}]', fontsize=11)
-            ax.set_title(f'Solución y[{i}](t) - Euler', fontsize=12)
+            ax.set_title(f'Solución y[{i}](t)', fontsize=12)
             ax.grid(True, alpha=0.3)
             ax.legend(fontsize=10)
         
@@ -730,12 +1257,65 @@ class MetodosNumericosUI:
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+    def mostrar_grafica_ensamble(self, t, y, n, metodo):
+        """Familia de trayectorias de un ensamble: y[i](t) y plano/espacio de fase"""
+        top = tk.Toplevel(self.root)
+        top.title(f"Gráfica - Ensamble de EDO ({metodo})")
+        top.geometry("1000x600")
+        
+        familia = y[:, :self.MAX_TRAYECTORIAS_GRAFICA]
+        m = familia.shape[1]
+        alfa = self.transparencia_familia(m)
+        fase = n in (2, 3)
+        paneles = n + 1 if fase else n
+        cols = min(paneles, 3)
+        rows = (paneles + cols - 1) // cols
+        fig = Figure(figsize=(5*cols, 5*rows), dpi=100)
+        
+        colors = ['b', 'r', 'g', 'm', 'c', 'y', 'k', 'orange', 'purple', 'brown']
+        for i in range(n):
+            ax = fig.add_subplot(rows, cols, i+1)
+            ax.plot(t, familia[:, :, i], color=colors[i % len(colors)], linewidth=0.8, alpha=alfa)
+            ax.set_xlabel('t', fontsize=11)
+            ax.set_ylabel(f'y[{i}]', fontsize=11)
+            ax.set_title(f'y[{i}](t): {m} de {y.shape[1]} trayectorias', fontsize=12)
+            ax.grid(True, alpha=0.3)
+        
+        if n == 2:
+            ax = fig.add_subplot(rows, cols, n+1)
+            ax.plot(familia[:, :, 0], familia[:, :, 1], 'k-', linewidth=0.8, alpha=alfa)
+            ax.plot(familia[0, :, 0], familia[0, :, 1], 'go', markersize=3, label='Inicio')
+            ax.plot(familia[-1, :, 0], familia[-1, :, 1], 'ro', markersize=3, label='Final')
+            ax.set_xlabel('y[0]', fontsize=11)
+            ax.set_ylabel('y[1]', fontsize=11)
+            ax.set_title('Plano de Fase', fontsize=12)
+            ax.grid(True, alpha=0.3)
+            ax.legend(fontsize=10)
+        elif n == 3:
+            ax = fig.add_subplot(rows, cols, n+1, projection='3d')
+            for k in range(m):
+                ax.plot(familia[:, k, 0], familia[:, k, 1], familia[:, k, 2], 'k-', linewidth=0.8, alpha=alfa)
+            ax.scatter(familia[0, :, 0], familia[0, :, 1], familia[0, :, 2], c='g', s=10, label='Inicio')
+            ax.scatter(familia[-1, :, 0], familia[-1, :, 1], familia[-1, :, 2], c='r', s=10, label='Final')
+            ax.set_xlabel('y[0]', fontsize=10)
+            ax.set_ylabel('y[1]', fontsize=10)
+            ax.set_zlabel('y[2]', fontsize=10)
+            ax.set_title('Espacio de Fase 3D', fontsize=12)
+            ax.legend(fontsize=9)
+        
+        fig.tight_layout()
+        
+        canvas = FigureCanvasTkAgg(fig, master=top)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
         
         # ============ MÉTODO 2: JACOBI ============
     def jacobi_ui(self):
         self.clear_input_frame()
         self.clear_output()
-        self.print_output("=== MÉTODO DE JACOBI ===\n", '#00ffff')
+        self.print_output("=== SISTEMAS LINEALES: MÉTODOS ITERATIVOS ===\n", '#00ffff')
+        self.print_output("Jacobi, Gauss-Seidel, SOR y Gradiente Conjugado\n", '#ffff00')
         
         self.input_fields['n'] = self.create_entry_field("Número de ecuaciones:", 0, "3")
         
@@ -743,13 +1323,57 @@ class MetodosNumericosUI:
                         bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20)
         btn.grid(row=1, column=0, columnspan=2, pady=20)
         
+        tk.Label(self.input_frame, text="O cargue A y b desde archivo (.npy, .npz, .mtx, .csv):", 
+                bg='#2b2b2b', fg='#ffff00', font=('Arial', 9, 'italic')).grid(
+                row=2, column=0, columnspan=2, pady=2, sticky='w', padx=5)
+        
+        btn = tk.Button(self.input_frame, text="Cargar desde archivo", command=self.cargar_sistema_archivo,
+                        bg='#4a4a4a', fg='white', font=('Arial', 11, 'bold'), width=20)
+        btn.grid(row=3, column=0, columnspan=2, pady=10)
+        
         self.current_entry = self.input_fields['n']
         self.input_fields['n'].focus()
+    
+    def cargar_sistema_archivo(self):
+        """Carga A y b desde archivo sin crear un campo por fila"""
+        try:
+            tipos = [("Matrices", "*.npy *.npz *.mtx *.csv *.txt *.dat"), ("Todos", "*.*")]
+            ruta_A = filedialog.askopenfilename(title="Matriz A", filetypes=tipos)
+            if not ruta_A:
+                return
+            A = cargar_matriz(ruta_A)
+            ruta_b = filedialog.askopenfilename(title="Vector b", filetypes=tipos)
+            if not ruta_b:
+                return
+            b = cargar_vector(ruta_b)
+            
+            n = A.shape[0]
+            if A.shape != (n, n):
+                raise ValueError(f"La matriz A debe ser cuadrada, tiene forma {A.shape}")
+            if b.shape != (n,):
+                raise ValueError(f"El vector b debe tener {n} valores, tiene {b.size}")
+            
+            self.clear_input_frame()
+            self.sistema_archivo = (A, b)
+            self.n_jacobi = n
+            
+            tk.Label(self.input_frame, text=f"A: {os.path.basename(ruta_A)}  —  {resumen_matriz(A)}", 
+                    bg='#2b2b2b', fg='#00ffff', font=('Arial', 10, 'bold')).grid(
+                    row=0, column=0, columnspan=2, pady=5, sticky='w', padx=5)
+            tk.Label(self.input_frame, text=f"b: {os.path.basename(ruta_b)}  —  {n} valores", 
+                    bg='#2b2b2b', fg='#00ffff', font=('Arial', 10, 'bold')).grid(
+                    row=1, column=0, columnspan=2, pady=5, sticky='w', padx=5)
+            
+            self.crear_parametros_iterativos(2)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al cargar: {str(e)}")
 
     def jacobi_matriz_ui(self):
         try:
             n = int(self.input_fields['n'].get())
             self.n_jacobi = n  # Guardar n como atributo
+            self.sistema_archivo = None
             self.clear_input_frame()
             
             # Crear campos para la matriz A
@@ -771,51 +1395,90 @@ class MetodosNumericosUI:
             
             self.input_fields['b'] = self.create_entry_field("b (separar por espacios):", n+2, "6 6 6")
             
-            # Parámetros
-            self.input_fields['tol'] = self.create_entry_field("Tolerancia:", n+3, "0.0001")
-            self.input_fields['max_iter'] = self.create_entry_field("Máx. iteraciones:", n+4, "50")
-            
-            btn = tk.Button(self.input_frame, text="Calcular", command=self.calcular_jacobi,
-                            bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20, height=2)
-            btn.grid(row=n+5, column=0, columnspan=2, pady=20)
+            self.crear_parametros_iterativos(n+3)
             
         except Exception as e:
             messagebox.showerror("Error", str(e))
+    
+    def crear_parametros_iterativos(self, row):
+        """Campos de tolerancia, iteraciones y método a partir de la fila row"""
+        self.input_fields['tol'] = self.create_entry_field("Tolerancia:", row, "0.0001")
+        self.input_fields['max_iter'] = self.create_entry_field("Máx. iteraciones:", row+1, "50")
+        
+        # Método iterativo
+        tk.Label(self.input_frame, text="Método iterativo:", 
+                bg='#2b2b2b', fg='#00ffff', font=('Arial', 10, 'bold')).grid(
+                row=row+2, column=0, columnspan=2, pady=5, sticky='w', padx=5)
+        
+        self.metodo_lineal = tk.StringVar(value="jacobi")
+        
+        rb_frame = tk.Frame(self.input_frame, bg='#2b2b2b')
+        rb_frame.grid(row=row+3, column=0, columnspan=2, sticky='w', padx=5)
+        
+        for texto, valor in [("Jacobi", "jacobi"), ("Gauss-Seidel", "gauss_seidel"),
+                             ("SOR", "sor"), ("Gradiente Conjugado (A simétrica def. positiva)", "gradiente_conjugado")]:
+            tk.Radiobutton(rb_frame, text=texto, variable=self.metodo_lineal, value=valor,
+                           bg='#2b2b2b', fg='white', selectcolor='#4a4a4a', 
+                           font=('Arial', 9)).pack(anchor='w')
+        
+        self.input_fields['omega'] = self.create_entry_field("ω para SOR (vacío = automático):", row+4, "")
+        
+        btn = tk.Button(self.input_frame, text="Calcular", command=self.calcular_jacobi,
+                        bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20, height=2)
+        btn.grid(row=row+5, column=0, columnspan=2, pady=20)
 
     def calcular_jacobi(self):
         try:
             n = self.n_jacobi  # Usar el atributo guardado
             
-            # Leer matriz A
-            A = np.zeros((n, n))
-            for i in range(n):
-                row_values = list(map(float, self.input_fields['A'][i].get().split()))
-                if len(row_values) != n:
-                    raise ValueError(f"La fila {i+1} debe tener {n} valores")
-                A[i] = row_values
-            
-            # Leer vector b
-            b_values = list(map(float, self.input_fields['b'].get().split()))
-            if len(b_values) != n:
-                raise ValueError(f"El vector b debe tener {n} valores")
-            b = np.array(b_values)
+            if self.sistema_archivo is not None:
+                A, b = self.sistema_archivo
+            else:
+                # Leer matriz A
+                A = np.zeros((n, n))
+                for i in range(n):
+                    row_values = list(map(float, self.input_fields['A'][i].get().split()))
+                    if len(row_values) != n:
+                        raise ValueError(f"La fila {i+1} debe tener {n} valores")
+                    A[i] = row_values
+                
+                # Leer vector b
+                b_values = list(map(float, self.input_fields['b'].get().split()))
+                if len(b_values) != n:
+                    raise ValueError(f"El vector b debe tener {n} valores")
+                b = np.array(b_values)
             
             tol = float(self.input_fields['tol'].get())
             max_iter = int(self.input_fields['max_iter'].get())
+            metodo = self.metodo_lineal.get()
             
-            self.clear_output()
-            self.print_output("=== RESULTADOS ===\n", '#00ffff')
-            
-            # Verificar diagonal dominante
-            diag_dom = True
-            for i in range(n):
-                if abs(A[i][i]) < sum(abs(A[i][j]) for j in range(n) if j != i):
-                    diag_dom = False
+            # Las columnas x1..xn sólo se muestran para sistemas pequeños
+            opciones = {'tol': tol, 'max_iter': max_iter, 'guardar_iteraciones': n <= self.MAX_COLUMNAS_X}
+            omega_str = self.input_fields['omega'].get().strip()
+            if metodo == "sor" and omega_str:
+                opciones['omega'] = float(omega_str)
             
-            if not diag_dom:
-                self.print_output("⚠ La matriz NO es diagonalmente dominante", '#ff0000')
-                self.print_output("  La convergencia no está garantizada\n", '#ff0000')
+            self.clear_output()
+            self.print_output("Calculando...", '#ffff00')
+            self.ejecutar_en_segundo_plano(resolver_iterativo, (A, b, metodo),
+                                           lambda res: self.mostrar_jacobi(res, n, max_iter),
+                                           opciones)
             
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+    
+    def mostrar_jacobi(self, res, n, max_iter):
+        """Imprime la tabla de iteraciones del método iterativo y la solución"""
+        self.clear_output()
+        self.print_output(f"=== RESULTADOS: {res.metodo.upper()} ===\n", '#00ffff')
+        if res.metodo == "SOR":
+            self.print_output(f"ω = {res.omega:.6f}\n", '#ffff00')
+        
+        if not res.diagonal_dominante:
+            self.print_output("⚠ La matriz NO es diagonalmente dominante", '#ff0000')
+            self.print_output("  La convergencia no está garantizada\n", '#ff0000')
+        
+        if n <= self.MAX_COLUMNAS_X:
             # Encabezado
             header = f"{'Iter':<8}"
             for i in range(n):
@@ -824,34 +1487,31 @@ class MetodosNumericosUI:
             self.print_output(header, '#ffff00')
             self.print_output("-"*(8 + 15*n + 15), '#ffff00')
             
-            x = np.zeros(n)
-            for k in range(max_iter):
-                x_nuevo = np.zeros(n)
-                
-                for i in range(n):
-                    suma = sum(A[i][j] * x[j] for j in range(n) if j != i)
-                    x_nuevo[i] = (b[i] - suma) / A[i][i]
-                
-                error = np.linalg.norm(x_nuevo - x, np.inf)
-                
+            for k, x_k, error in res.historial:
                 line = f"{k:<8}"
-                for val in x_nuevo:
+                for val in x_k:
                     line += f"{val:<15.8f}"
                 line += f"{error:<15.2e}"
                 self.print_output(line)
-                
-                if error < tol:
-                    self.print_output(f"\n✓ Solución encontrada:", '#00ff00')
-                    for i in range(n):
-                        self.print_output(f"  x{i+1} = {x_nuevo[i]:.10f}", '#00ff00')
-                    return
-                
-                x = x_nuevo.copy()
-            
-            self.print_output(f"\n⚠ No convergió en {max_iter} iteraciones", '#ff0000')
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+        else:
+            # Sistema grande: sólo error y residuo, cada 5% de las iteraciones
+            self.print_output(f"{'Iter':<8}{'Error':<15}{'Residuo':<15}", '#ffff00')
+            self.print_output("-"*38, '#ffff00')
+            total = len(res.errores)
+            for k in range(total):
+                if (k+1) % max(1, total // 20) == 0 or k == total - 1:
+                    self.print_output(f"{k:<8}{res.errores[k]:<15.2e}{res.residuos[k]:<15.2e}")
+        
+        if res.convergio:
+            self.print_output(f"\n✓ Solución encontrada:", '#00ff00')
+            for i in range(min(n, self.MAX_COLUMNAS_X)):
+                self.print_output(f"  x{i+1} = {res.x[i]:.10f}", '#00ff00')
+            if n > self.MAX_COLUMNAS_X:
+                self.print_output(f"  ... ({n - self.MAX_COLUMNAS_X} componentes más)", '#00ff00')
+            self.print_output(f"  Iteraciones: {res.iteraciones}", '#00ff00')
+            self.print_output(f"  Residuo relativo: {res.residuos[-1]:.2e}", '#00ff00')
+        else:
+            self.print_output(f"\n⚠ {res.mensaje}", '#ff0000')
 
     # ============ MÉTODO 3: INTERPOLACIÓN ============
     # ============ MÉTODO 3: INTERPOLACIÓN DE LAGRANGE MULTIVARIABLE ============
@@ -951,7 +1611,7 @@ class MetodosNumericosUI:
                         bg='#2b2b2b', fg='#00ffff', font=('Arial', 10, 'bold')).grid(
                         row=2*n+1, column=0, columnspan=2, pady=5, sticky='w', padx=5)
                 
-                self.input_fields['eval_x'] = self.create_entry_field("x =", 2*n+2, "1.5")
+                self.input_fields['eval_x'] = self.create_entry_field("x (uno o varios, separados por espacio) =", 2*n+2, "1.5")
                 
                 btn = tk.Button(self.input_frame, text="Calcular Interpolación", 
                             command=self.calcular_interpolacion,
@@ -1070,6 +1730,27 @@ class MetodosNumericosUI:
             messagebox.showerror("Error", str(e))
 
 
+    def leer_puntos_evaluacion(self, campos):
+        """Lee las coordenadas de evaluación; cada campo admite varios valores
+        separados por espacio (un valor único se repite en todos los puntos)"""
+        coordenadas = [np.array(list(map(float, self.input_fields[c].get().split()))) for c in campos]
+        m = max(c.size for c in coordenadas)
+        if m == 0:
+            raise ValueError("Indique al menos un punto de evaluación")
+        if any(c.size not in (1, m) for c in coordenadas):
+            raise ValueError("Todas las coordenadas deben tener la misma cantidad de valores")
+        return np.column_stack([np.broadcast_to(c, (m,)) for c in coordenadas])
+
+    def mostrar_resultados_interpolacion(self, puntos, resultados):
+        if len(puntos) == 1:
+            self.print_output(f"\n✓ Resultado de la interpolación:", '#00ff00')
+        else:
+            self.print_output(f"\n✓ Resultado de la interpolación en {len(puntos)} puntos:", '#00ff00')
+        for punto, valor in zip(puntos[:50], resultados[:50]):
+            self.print_output(f"  P({', '.join(str(c) for c in punto)}) ≈ {valor:.10f}", '#00ff00')
+        if len(puntos) > 50:
+            self.print_output(f"  ... ({len(puntos) - 50} puntos más)")
+
     def calcular_interpolacion(self):
         try:
             n_vars = self.n_vars_interp
@@ -1079,27 +1760,32 @@ class MetodosNumericosUI:
                 n = self.n_interp_1d
                 x = np.array([float(self.input_fields['x_vals'][i].get()) for i in range(n)])
                 z = np.array([float(self.input_fields['z_vals'][i].get()) for i in range(n)])
-                x_eval = float(self.input_fields['eval_x'].get())
+                x_eval = np.array(list(map(float, self.input_fields['eval_x'].get().split())))
+                if x_eval.size == 0:
+                    raise ValueError("Indique al menos un punto de evaluación")
                 
                 self.clear_output()
                 self.print_output("=== INTERPOLACIÓN DE LAGRANGE 1D ===\n", '#00ffff')
                 
-                # Calcular polinomios de Lagrange
-                result = 0.0
-                self.print_output("Polinomios de Lagrange:", '#ffff00')
+                # Pesos baricéntricos: se calculan una vez y sirven para todos los puntos
+                interpolador = InterpoladorBaricentrico(x, z)
+                resultados = interpolador(x_eval)
                 
-                for i in range(n):
-                    # L_i(x)
-                    L_i = 1.0
-                    for j in range(n):
-                        if i != j:
-                            L_i *= (x_eval - x[j]) / (x[i] - x[j])
+                if x_eval.size == 1:
+                    x_eval, result = x_eval[0], resultados[0]
+                    self.print_output("Polinomios de Lagrange:", '#ffff00')
                     
-                    result += z[i] * L_i
-                    self.print_output(f"L_{i}({x_eval:.4f}) = {L_i:.6f},  z[{i}]*L_{i} = {z[i]*L_i:.6f}")
-                
-                self.print_output(f"\n✓ Resultado de la interpolación:", '#00ff00')
-                self.print_output(f"  P({x_eval}) ≈ {result:.10f}", '#00ff00')
+                    for i, L_i in enumerate(interpolador.base(x_eval)):
+                        self.print_output(f"L_{i}({x_eval:.4f}) = {L_i:.6f},  z[{i}]*L_{i} = {z[i]*L_i:.6f}")
+                    
+                    self.print_output(f"\n✓ Resultado de la interpolación:", '#00ff00')
+                    self.print_output(f"  P({x_eval}) ≈ {result:.10f}", '#00ff00')
+                else:
+                    self.print_output(f"\n✓ Resultado de la interpolación en {x_eval.size} puntos:", '#00ff00')
+                    for xi, pi in zip(x_eval[:50], resultados[:50]):
+                        self.print_output(f"  P({xi}) ≈ {pi:.10f}", '#00ff00')
+                    if x_eval.size > 50:
+                        self.print_output(f"  ... ({x_eval.size - 50} puntos más)")
                 
             elif n_vars == 2:
                 # Interpolación de Lagrange 2D
@@ -1116,29 +1802,13 @@ class MetodosNumericosUI:
                         raise ValueError(f"La fila {i} debe tener {nx} valores")
                     Z[i] = z_row
                 
-                x_eval = float(self.input_fields['eval_x'].get())
-                y_eval = float(self.input_fields['eval_y'].get())
+                puntos = self.leer_puntos_evaluacion(['eval_x', 'eval_y'])
                 
                 self.clear_output()
                 self.print_output("=== INTERPOLACIÓN DE LAGRANGE 2D ===\n", '#00ffff')
                 
-                # Calcular usando producto tensor de polinomios de Lagrange
-                result = 0.0
-                
-                for i in range(ny):
-                    for j in range(nx):
-                        # L_i(y_eval) * L_j(x_eval)
-                        L_y = 1.0
-                        for k in range(ny):
-                            if k != i:
-                                L_y *= (y_eval - y[k]) / (y[i] - y[k])
-                        
-                        L_x = 1.0
-                        for k in range(nx):
-                            if k != j:
-                                L_x *= (x_eval - x[k]) / (x[j] - x[k])
-                        
-                        result += Z[i][j] * L_y * L_x
+                # Producto tensor de polinomios de Lagrange (Z está indexada [y, x])
+                resultados = InterpoladorTensorial([x, y], Z.T)(puntos)
                 
                 self.print_output(f"Puntos en x: {x}", '#ffff00')
                 self.print_output(f"Puntos en y: {y}", '#ffff00')
@@ -1146,8 +1816,7 @@ class MetodosNumericosUI:
                 for i in range(ny):
                     self.print_output(f"  {Z[i]}")
                 
-                self.print_output(f"\n✓ Resultado de la interpolación:", '#00ff00')
-                self.print_output(f"  P({x_eval}, {y_eval}) ≈ {result:.10f}", '#00ff00')
+                self.mostrar_resultados_interpolacion(puntos, resultados)
                 
             else:  # n_vars == 3
                 # Interpolación de Lagrange 3D
@@ -1167,36 +1836,13 @@ class MetodosNumericosUI:
                             raise ValueError(f"La fila [{k},{i}] debe tener {nx} valores")
                         W[k][i] = w_row
                 
-                x_eval = float(self.input_fields['eval_x'].get())
-                y_eval = float(self.input_fields['eval_y'].get())
-                z_eval = float(self.input_fields['eval_z'].get())
+                puntos = self.leer_puntos_evaluacion(['eval_x', 'eval_y', 'eval_z'])
                 
                 self.clear_output()
                 self.print_output("=== INTERPOLACIÓN DE LAGRANGE 3D ===\n", '#00ffff')
                 
-                # Calcular usando producto tensor de polinomios de Lagrange
-                result = 0.0
-                
-                for k in range(nz):
-                    for i in range(ny):
-                        for j in range(nx):
-                            # L_k(z_eval) * L_i(y_eval) * L_j(x_eval)
-                            L_z = 1.0
-                            for m in range(nz):
-                                if m != k:
-                                    L_z *= (z_eval - z[m]) / (z[k] - z[m])
-                            
-                            L_y = 1.0
-                            for m in range(ny):
-                                if m != i:
-                                    L_y *= (y_eval - y[m]) / (y[i] - y[m])
-                            
-                            L_x = 1.0
-                            for m in range(nx):
-                                if m != j:
-                                    L_x *= (x_eval - x[m]) / (x[j] - x[m])
-                            
-                            result += W[k][i][j] * L_z * L_y * L_x
+                # Producto tensor de polinomios de Lagrange (W está indexado [z, y, x])
+                resultados = InterpoladorTensorial([x, y, z], W.transpose(2, 1, 0))(puntos)
                 
                 self.print_output(f"Puntos en x: {x}", '#ffff00')
                 self.print_output(f"Puntos en y: {y}", '#ffff00')
@@ -1207,26 +1853,45 @@ class MetodosNumericosUI:
                     for i in range(ny):
                         self.print_output(f"    {W[k][i]}")
                 
-                self.print_output(f"\n✓ Resultado de la interpolación:", '#00ff00')
-                self.print_output(f"  P({x_eval}, {y_eval}, {z_eval}) ≈ {result:.10f}", '#00ff00')
+                self.mostrar_resultados_interpolacion(puntos, resultados)
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al calcular: {str(e)}")
 
-    # ============ MÉTODO 4: SIMPSON 3/8 ============
+    # ============ MÉTODO 4: INTEGRACIÓN ============
     def simpson_ui(self):
         self.clear_input_frame()
         self.clear_output()
-        self.print_output("=== REGLA DE SIMPSON 3/8 COMPUESTA ===\n", '#00ffff')
+        self.print_output("=== INTEGRACIÓN NUMÉRICA: SIMPSON 3/8 Y GAUSS ===\n", '#00ffff')
         
         self.input_fields['f'] = self.create_entry_field("f(x) =", 0, "x**2")
         self.input_fields['a'] = self.create_entry_field("Límite inferior a:", 1, "0")
         self.input_fields['b'] = self.create_entry_field("Límite superior b:", 2, "1")
         self.input_fields['n'] = self.create_entry_field("Subintervalos (múltiplo de 3):", 3, "9")
+        self.input_fields['tol'] = self.create_entry_field("Tolerancia (modos con error):", 4, "1e-8")
+        
+        # Modo de integración
+        tk.Label(self.input_frame, text="Modo:", 
+                bg='#2b2b2b', fg='#00ffff', font=('Arial', 10, 'bold')).grid(
+                row=5, column=0, columnspan=2, pady=5, sticky='w', padx=5)
+        
+        self.modo_integracion = tk.StringVar(value="simpson38")
+        
+        rb_frame = tk.Frame(self.input_frame, bg='#2b2b2b')
+        rb_frame.grid(row=6, column=0, columnspan=2, sticky='w', padx=5)
+        
+        for texto, valor in [("Compuesta (n fijo)", "simpson38"),
+                             ("Adaptativa (tolerancia)", "simpson38_adaptativo"),
+                             ("Romberg: extrapolación de Richardson (tolerancia)", "romberg_simpson38"),
+                             ("Gauss-Legendre (tolerancia)", "gauss_legendre"),
+                             ("Gauss-Kronrod G7K15 adaptativa (tolerancia)", "gauss_kronrod")]:
+            tk.Radiobutton(rb_frame, text=texto, variable=self.modo_integracion, value=valor,
+                           bg='#2b2b2b', fg='white', selectcolor='#4a4a4a', 
+                           font=('Arial', 9)).pack(anchor='w')
         
         btn = tk.Button(self.input_frame, text="Calcular", command=self.calcular_simpson,
                         bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20, height=2)
-        btn.grid(row=4, column=0, columnspan=2, pady=20)
+        btn.grid(row=7, column=0, columnspan=2, pady=20)
         
         self.current_entry = self.input_fields['f']
         self.input_fields['f'].focus()
@@ -1236,32 +1901,148 @@ class MetodosNumericosUI:
             f_str = self.input_fields['f'].get()
             a = float(self.input_fields['a'].get())
             b = float(self.input_fields['b'].get())
-            n = int(self.input_fields['n'].get())
-            
-            f = lambda x: eval(f_str)
-            
-            if n % 3 != 0:
-                n = ((n + 2) // 3) * 3
+            metodo = self.modo_integracion.get()
             
-            h = (b - a) / n
+            if metodo == 'simpson38':
+                opciones = {'n': int(self.input_fields['n'].get())}
+            else:
+                opciones = {'tol': float(self.input_fields['tol'].get())}
             
-            suma = f(a) + f(b)
-            for i in range(1, n):
-                x_i = a + i * h
-                if i % 3 == 0:
-                    suma += 2 * f(x_i)
-                else:
-                    suma += 3 * f(x_i)
+            self.clear_output()
+            self.print_output("Calculando...", '#ffff00')
+            self.ejecutar_en_segundo_plano(integrar, (f_str, a, b, metodo),
+                                           lambda res: self.mostrar_integral(res, a, b, metodo), opciones)
             
-            integral = (3 * h / 8) * suma
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+    
+    def mostrar_integral(self, res, a, b, metodo):
+        """Imprime el valor de la integral y, si lo hay, el error estimado"""
+        self.clear_output()
+        self.print_output("=== RESULTADOS ===\n", '#00ffff')
+        self.print_output(f"Método: {res.metodo}", '#ffff00')
+        
+        if res.tabla:
+            # Tabla de Romberg: fila k con n = 3·2^k, columna j elimina h^(2j+2)
+            columnas = min(len(res.tabla), 6)
+            self.print_output(f"\n{'n':<10}" + "".join(f"{'R[k][' + str(j) + ']':<20}" for j in range(columnas)), '#ffff00')
+            self.print_output("-"*(10 + 20*columnas), '#ffff00')
+            for k, fila in enumerate(res.tabla):
+                self.print_output(f"{3 * 2**k:<10}" + "".join(f"{v:<20.14f}" for v in fila[:columnas]))
+            self.print_output("")
+        
+        self.print_output(f"✓ Integral calculada:", '#00ff00')
+        self.print_output(f"  ∫[{a}, {b}] f(x)dx ≈ {res.valor:.10f}", '#00ff00')
+        if metodo == 'gauss_legendre':
+            self.print_output(f"  Puntos de Gauss: {res.n}", '#00ff00')
+        elif metodo in ('simpson38_adaptativo', 'gauss_kronrod'):
+            self.print_output(f"  Subintervalos: {res.n}", '#00ff00')
+            self.print_output(f"  Ancho mínimo: {res.h:.3e}", '#00ff00')
+        else:
+            self.print_output(f"  Subintervalos: {res.n}", '#00ff00')
+            self.print_output(f"  Paso h: {res.h:.8f}", '#00ff00')
+        if res.error is not None:
+            self.print_output(f"  Error estimado: {res.error:.3e}", '#00ff00')
+        self.print_output(f"  Evaluaciones de f: {res.evaluaciones}", '#00ff00')
+        if not res.convergio:
+            self.print_output(f"\n⚠ {res.mensaje}", '#ff0000')
+
+
+    # ============ MÉTODO 8: INTEGRACIÓN MÚLTIPLE ============
+    def cubatura_ui(self):
+        self.clear_input_frame()
+        self.clear_output()
+        self.print_output("=== INTEGRACIÓN MÚLTIPLE EN UNA CAJA ===\n", '#00ffff')
+        self.print_output("Deje vacíos los límites de z para integrar en 2D", '#ffff00')
+        
+        self.input_fields['f'] = self.create_entry_field("f(x, y, z) =", 0, "x*y + z")
+        self.input_fields['lim_x'] = self.create_entry_field("Límites de x (a b):", 1, "0 1")
+        self.input_fields['lim_y'] = self.create_entry_field("Límites de y (a b):", 2, "0 1")
+        self.input_fields['lim_z'] = self.create_entry_field("Límites de z (a b):", 3, "0 1")
+        self.input_fields['n'] = self.create_entry_field("Subintervalos por eje / puntos por réplica:", 4, "30")
+        
+        # Modo de integración
+        tk.Label(self.input_frame, text="Modo:", 
+                bg='#2b2b2b', fg='#00ffff', font=('Arial', 10, 'bold')).grid(
+                row=5, column=0, columnspan=2, pady=5, sticky='w', padx=5)
+        
+        self.modo_cubatura = tk.StringVar(value="simpson38")
+        
+        rb_frame = tk.Frame(self.input_frame, bg='#2b2b2b')
+        rb_frame.grid(row=6, column=0, columnspan=2, sticky='w', padx=5)
+        
+        for texto, valor in [("Simpson 3/8 tensorial", "simpson38"),
+                             ("Cuasi-Monte Carlo: Sobol", "sobol"),
+                             ("Cuasi-Monte Carlo: Halton", "halton"),
+                             ("Monte Carlo", "aleatoria")]:
+            tk.Radiobutton(rb_frame, text=texto, variable=self.modo_cubatura, value=valor,
+                           bg='#2b2b2b', fg='white', selectcolor='#4a4a4a', 
+                           font=('Arial', 9)).pack(anchor='w')
+        
+        self.input_fields['replicas'] = self.create_entry_field("Réplicas (Monte Carlo):", 7, "8")
+        self.input_fields['procesos'] = self.create_entry_field("Procesos (Monte Carlo):", 8, "1")
+        self.input_fields['semilla'] = self.create_entry_field("Semilla (Monte Carlo):", 9, "0")
+        
+        btn = tk.Button(self.input_frame, text="Calcular", command=self.calcular_cubatura,
+                        bg='#5cb85c', fg='white', font=('Arial', 11, 'bold'), width=20, height=2)
+        btn.grid(row=10, column=0, columnspan=2, pady=20)
+        
+        self.current_entry = self.input_fields['f']
+        self.input_fields['f'].focus()
+
+    def calcular_cubatura(self):
+        try:
+            f_str = self.input_fields['f'].get()
+            limites = []
+            for eje in ('x', 'y', 'z'):
+                valores = list(map(float, self.input_fields[f'lim_{eje}'].get().split()))
+                if not valores and eje == 'z':
+                    continue
+                if len(valores) != 2:
+                    raise ValueError(f"Los límites de {eje} deben ser dos valores: a b")
+                limites.append(valores)
+            n = int(self.input_fields['n'].get())
+            modo = self.modo_cubatura.get()
             
             self.clear_output()
-            self.print_output("=== RESULTADOS ===\n", '#00ffff')
-            self.print_output(f"✓ Integral calculada:", '#00ff00')
-            self.print_output(f"  ∫[{a}, {b}] f(x)dx ≈ {integral:.10f}", '#00ff00')
-            self.print_output(f"  Subintervalos: {n}", '#00ff00')
-            self.print_output(f"  Paso h: {h:.8f}", '#00ff00')
+            self.print_output("Calculando...", '#ffff00')
+            if modo == 'simpson38':
+                self.ejecutar_en_segundo_plano(simpson38_nd, (f_str, limites, n),
+                                               lambda res: self.mostrar_cubatura(res, limites))
+            else:
+                opciones = {'n': n, 'secuencia': modo,
+                            'replicas': int(self.input_fields['replicas'].get()),
+                            'procesos': int(self.input_fields['procesos'].get()),
+                            'semilla': int(self.input_fields['semilla'].get()),
+                            'puntos_ronda': min(4096, 1 << max(0, n.bit_length() - 1))}
+                self.ejecutar_en_segundo_plano(cuasi_monte_carlo, (f_str, limites),
+                                               lambda res: self.mostrar_cubatura(res, limites), opciones)
             
         except Exception as e:
-            messagebox.showerror("Error", f"Error")
-
+            messagebox.showerror("Error", f"Error al calcular: {str(e)}")
+    
+    def mostrar_cubatura(self, res, limites):
+        """Imprime el valor de la integral múltiple y la convergencia de Monte Carlo"""
+        self.clear_output()
+        self.print_output("=== RESULTADOS ===\n", '#00ffff')
+        self.print_output(f"Método: {res.metodo}", '#ffff00')
+        
+        if res.historial:
+            self.print_output(f"\n{'Puntos/réplica':<18}{'Integral':<22}{'Error estándar':<16}", '#ffff00')
+            self.print_output("-"*56, '#ffff00')
+            paso = max(1, len(res.historial) // 20)
+            for i, (puntos, valor, error) in enumerate(res.historial):
+                if i % paso == 0 or i == len(res.historial) - 1:
+                    self.print_output(f"{puntos:<18}{valor:<22.12f}{error:<16.3e}")
+            self.print_output("")
+        
+        caja = " × ".join(f"[{a}, {b}]" for a, b in limites)
+        self.print_output(f"✓ Integral calculada:", '#00ff00')
+        self.print_output(f"  ∫ f sobre {caja} ≈ {res.valor:.10f}", '#00ff00')
+        if res.n is not None:
+            self.print_output(f"  Subintervalos por eje: {', '.join(map(str, res.n))}", '#00ff00')
+        if res.error is not None:
+            self.print_output(f"  Error estándar estimado: {res.error:.3e}", '#00ff00')
+        self.print_output(f"  Evaluaciones de f: {res.evaluaciones}", '#00ff00')
+        if not res.convergio:
+            self.print_output(f"\n⚠ {res.mensaje}", '#ff0000')